@@ -5,7 +5,7 @@ Provides high-level interface to JACK audio server with transport control.
 """
 
 import logging
-from typing import Optional, List, Tuple, Dict
+from typing import Callable, Optional, List, Tuple, Dict
 from enum import Enum
 
 import jack
@@ -39,6 +39,16 @@ class JackClientManager:
         self.client: Optional[jack.Client] = None
         self._connected = False
         self.monitor_ports = []  # Store created ports
+        self._xrun_count = 0
+        
+        # Server parameters, cached on connect and kept current by JACK
+        # callbacks so per-tick readers don't cross into the C library
+        self._samplerate = 0
+        self._blocksize = 0
+        
+        # Event hooks; called from JACK's notification thread
+        self.on_xrun: Optional[Callable[[int], None]] = None  # total xrun count
+        self.on_shutdown: Optional[Callable[[str], None]] = None  # reason
     
     def connect(self):
         """
@@ -67,11 +77,20 @@ class JackClientManager:
                 self.client.outports.register('monitor_out_R')
             )
             
+            # Notification callbacks must be set before activation
+            self._xrun_count = 0
+            self.client.set_xrun_callback(self._handle_xrun)
+            self.client.set_shutdown_callback(self._handle_shutdown)
+            self.client.set_samplerate_callback(self._handle_samplerate)
+            self.client.set_blocksize_callback(self._handle_blocksize)
+            self._samplerate = self.client.samplerate
+            self._blocksize = self.client.blocksize
+            
             self.client.activate()  # Must activate to appear in JACK graph
             self._connected = True
             logger.info(f"Connected to JACK as '{self.client_name}'")
-            logger.info(f"Sample rate: {self.client.samplerate} Hz")
-            logger.info(f"Buffer size: {self.client.blocksize} frames")
+            logger.info(f"Sample rate: {self._samplerate} Hz")
+            logger.info(f"Buffer size: {self._blocksize} frames")
         except jack.JackError as e:
             logger.error(f"Failed to connect to JACK: {e}")
             raise RuntimeError(f"JACK connection failed: {e}") from e
@@ -90,9 +109,30 @@ class JackClientManager:
                 logger.info("Disconnected from JACK")
     
     def is_connected(self) -> bool:
-        """Check if connected to JACK server."""
+        """Check if connected to JACK server (cached; cleared by the shutdown callback)."""
         return self._connected and self.client is not None
     
+    def _handle_xrun(self, delayed_usecs: float):
+        """JACK xrun notification (JACK thread)."""
+        self._xrun_count += 1
+        if self.on_xrun:
+            self.on_xrun(self._xrun_count)
+    
+    def _handle_samplerate(self, samplerate: int):
+        """JACK sample rate change notification (JACK thread)."""
+        self._samplerate = samplerate
+    
+    def _handle_blocksize(self, blocksize: int):
+        """JACK buffer size change notification (JACK thread)."""
+        self._blocksize = blocksize
+    
+    def _handle_shutdown(self, status, reason: str):
+        """JACK server shutdown notification (JACK thread)."""
+        self._connected = False
+        logger.warning(f"JACK server shut down: {reason}")
+        if self.on_shutdown:
+            self.on_shutdown(reason)
+    
     # Transport Control
     
     def get_transport_state(self) -> str:
@@ -149,20 +189,25 @@ class JackClientManager:
             return self.client.transport_frame
         return 0
     
-    def get_transport_time(self) -> Tuple[int, int, int, int]:
+    def get_transport_time(self, frame: Optional[int] = None) -> Tuple[int, int, int, int]:
         """
         Get transport time in hours, minutes, seconds, frames.
         
+        Args:
+            frame: Transport frame already read by the caller; queried from
+                JACK when omitted
+        
         Returns:
             Tuple of (hours, minutes, seconds, frames)
         """
-        if not self.client:
+        if not self.client or not self._samplerate or not self._blocksize:
             return (0, 0, 0, 0)
         
-        frame = self.client.transport_frame
-        fps = self.client.samplerate / self.client.blocksize
+        if frame is None:
+            frame = self.client.transport_frame
+        fps = self._samplerate / self._blocksize
         
-        total_seconds = frame / self.client.samplerate
+        total_seconds = frame / self._samplerate
         hours = int(total_seconds // 3600)
         minutes = int((total_seconds % 3600) // 60)
         seconds = int(total_seconds % 60)
@@ -271,15 +316,14 @@ class JackClientManager:
     @property
     def sample_rate(self) -> int:
         """Get JACK server sample rate."""
-        return self.client.samplerate if self.client else 0
+        return self._samplerate if self.client else 0
     
     @property
     def buffer_size(self) -> int:
         """Get JACK server buffer size."""
-        return self.client.blocksize if self.client else 0
+        return self._blocksize if self.client else 0
     
     @property
     def xruns(self) -> int:
-        """Get xrun count (if available)."""
-        # Note: JACK-Client doesn't directly expose xruns, would need to track via callback
-        return 0
+        """Get xrun count since connecting."""
+        return self._xrun_count
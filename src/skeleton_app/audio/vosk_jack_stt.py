@@ -9,9 +9,9 @@ and provides continuous, real-time transcription with wake word support.
 import asyncio
 import json
 import logging
-import queue
+import os
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set
 
@@ -29,7 +29,7 @@ class TranscriptionResult:
     partial: bool = False
     confidence: float = 0.0
     timestamp: float = 0.0
-    metadata: Dict = field(default_factory=dict)
+    metadata: Optional[Dict] = None  # Allocated only by producers that attach metadata
 
 
 @dataclass
@@ -42,6 +42,93 @@ class VoiceCommand:
     timestamp: float = 0.0
 
 
+class _Resampler:
+    """
+    Streaming downsampler from the JACK rate to the Vosk rate.
+    
+    Integer ratios (48k -> 16k, 32k -> 16k, 96k -> 16k) use a precomputed
+    FIR low-pass whose state and decimation phase carry across calls, so
+    block boundaries are seamless. Other ratios (e.g. 44.1k -> 16k) fall
+    back to polyphase resampling of each chunk.
+    """
+    
+    def __init__(self, input_rate: int, output_rate: int, numtaps: int = 64):
+        from math import gcd
+        from scipy import signal
+        
+        self._signal = signal
+        divisor = gcd(input_rate, output_rate)
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        
+        if self.up == 1:
+            self._fir = signal.firwin(
+                numtaps, cutoff=output_rate / 2, fs=input_rate
+            ).astype(np.float32)
+            self._zi = np.zeros(numtaps - 1, dtype=np.float32)
+            self._phase = 0
+    
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample a chunk of float32 samples."""
+        if self.up != 1:
+            return self._signal.resample_poly(samples, self.up, self.down)
+        
+        filtered, self._zi = self._signal.lfilter(
+            self._fir, 1.0, samples, zi=self._zi
+        )
+        out = filtered[self._phase::self.down]
+        self._phase = (self._phase - len(samples)) % self.down
+        return out
+
+
+class VoskModelRegistry:
+    """
+    Process-wide cache of loaded Vosk models.
+    
+    A Vosk ``Model`` holds the acoustic and language model (50-500 MB) and is
+    safe to share between recognizers. Each ``VoskJackSTT`` keeps its own
+    lightweight ``KaldiRecognizer`` but obtains the model from here, so running
+    one engine per node loads the model from disk only once.
+    """
+    
+    _models: Dict[str, Model] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, model_path: Path) -> Model:
+        """
+        Get the model for a path, loading it on first use.
+        
+        Args:
+            model_path: Path to Vosk model directory
+        
+        Returns:
+            Shared Vosk model instance
+        """
+        key = str(Path(model_path).resolve())
+        with cls._lock:
+            model = cls._models.get(key)
+            if model is None:
+                logger.info(f"Loading Vosk model from {model_path}")
+                model = Model(key)
+                cls._models[key] = model
+            else:
+                logger.info(f"Reusing loaded Vosk model from {model_path}")
+            return model
+    
+    @classmethod
+    def release(cls, model_path: Path):
+        """Drop a cached model so it can be garbage collected."""
+        with cls._lock:
+            cls._models.pop(str(Path(model_path).resolve()), None)
+    
+    @classmethod
+    def clear(cls):
+        """Drop all cached models."""
+        with cls._lock:
+            cls._models.clear()
+
+
 class VoskJackSTT:
     """
     JACK-aware Vosk STT engine for real-time voice commands.
@@ -54,13 +141,17 @@ class VoskJackSTT:
     - Callback-based event system
     """
     
+    # Seconds of audio the RT-to-decoder ring buffer can hold
+    RING_SECONDS = 4.0
+    
     def __init__(
         self,
         model_path: str,
         client_name: str = "vosk_stt",
         sample_rate: int = 16000,
         buffer_duration: float = 0.1,  # 100ms buffer
-        wake_words: Optional[Dict[str, str]] = None  # node_id -> wake_word
+        wake_words: Optional[Dict[str, str]] = None,  # node_id -> wake_word
+        decode_cpus: Optional[Set[int]] = None
     ):
         """
         Initialize Vosk JACK STT engine.
@@ -71,12 +162,20 @@ class VoskJackSTT:
             sample_rate: Sample rate (Vosk typically uses 16kHz)
             buffer_duration: Audio buffer duration in seconds
             wake_words: Dictionary mapping node IDs to their wake words
+            decode_cpus: CPUs the recognition thread may run on. Defaults to
+                every CPU except CPU 0, leaving that core to the JACK
+                real-time thread. Pass an empty set to leave affinity alone.
         """
         self.model_path = Path(model_path)
         self.client_name = client_name
         self.sample_rate = sample_rate
         self.buffer_duration = buffer_duration
         self.wake_words = wake_words or {}
+        self.decode_cpus = decode_cpus
+        # Lowercased copies, kept in sync by add/remove_wake_word
+        self._wake_words_lc: Dict[str, str] = {
+            node_id: word.lower() for node_id, word in self.wake_words.items()
+        }
         
         # JACK components
         self.jack_client: Optional[jack.Client] = None
@@ -87,7 +186,12 @@ class VoskJackSTT:
         self.recognizer: Optional[KaldiRecognizer] = None
         
         # Audio processing
-        self.audio_queue = queue.Queue()
+        # Lock-free JACK ring buffer (created in connect_jack) carrying raw
+        # float32 samples from the RT callback; the event wakes the
+        # processing thread only when audio arrives
+        self.audio_ring: Optional[jack.RingBuffer] = None
+        self._audio_available = threading.Event()
+        self._resampler: Optional[_Resampler] = None
         self.processing_thread: Optional[threading.Thread] = None
         self.running = False
         
@@ -96,6 +200,7 @@ class VoskJackSTT:
         self.current_target_node: Optional[str] = None
         self.command_timeout = 5.0  # seconds
         self._command_timer: Optional[asyncio.Task] = None
+        self._last_partial_checked = ""  # Last partial scanned for wake words
         
         # Callbacks
         self._on_partial_result: Optional[Callable[[TranscriptionResult], None]] = None
@@ -104,29 +209,31 @@ class VoskJackSTT:
         self._on_command: Optional[Callable[[VoiceCommand], None]] = None
         
         # Stats
+        # Frame counters are plain attributes because the RT callback bumps
+        # them every block; get_stats() folds them into the stats dict
+        self._frames_processed = 0
+        self._frames_dropped = 0
         self.stats = {
-            'frames_processed': 0,
             'transcriptions': 0,
             'commands_detected': 0,
             'wake_words_detected': 0
         }
     
     def load_model(self):
-        """Load Vosk model from disk."""
+        """Load Vosk model (shared across engines) and create a recognizer."""
         if not self.model_path.exists():
             raise FileNotFoundError(
                 f"Vosk model not found at {self.model_path}. "
                 "Download a model from https://alphacephei.com/vosk/models"
             )
         
-        logger.info(f"Loading Vosk model from {self.model_path}")
-        self.model = Model(str(self.model_path))
+        self.model = VoskModelRegistry.get(self.model_path)
         self.recognizer = KaldiRecognizer(self.model, self.sample_rate)
         
         # Enable partial results for real-time feedback
         self.recognizer.SetWords(True)
         
-        logger.info("Vosk model loaded successfully")
+        logger.info("Vosk recognizer ready")
     
     def connect_jack(self):
         """Connect to JACK server and create audio input port."""
@@ -136,6 +243,29 @@ class VoskJackSTT:
             # Create mono input port for microphone
             self.input_port = self.jack_client.inports.register('voice_in')
             
+            # Resample to the Vosk rate in the processing thread if needed
+            if self.jack_client.samplerate != self.sample_rate:
+                logger.info(
+                    f"JACK sample rate ({self.jack_client.samplerate}) "
+                    f"differs from Vosk sample rate ({self.sample_rate}). "
+                    "Audio will be resampled before recognition."
+                )
+                self._resampler = _Resampler(
+                    self.jack_client.samplerate, self.sample_rate
+                )
+            else:
+                self._resampler = None
+            
+            # Ring buffer sized for a few seconds of float32 audio so a slow
+            # decode never blocks the RT callback
+            self.audio_ring = jack.RingBuffer(
+                int(self.jack_client.samplerate * self.RING_SECONDS) * 4
+            )
+            try:
+                self.audio_ring.mlock()
+            except jack.JackError as e:
+                logger.warning(f"Could not lock audio ring buffer in memory: {e}")
+            
             # Set process callback for audio capture
             self.jack_client.set_process_callback(self._process_audio)
             
@@ -145,14 +275,6 @@ class VoskJackSTT:
             logger.info(f"Connected to JACK as '{self.client_name}'")
             logger.info(f"JACK sample rate: {self.jack_client.samplerate} Hz")
             logger.info(f"JACK buffer size: {self.jack_client.blocksize} frames")
-            
-            # Warn if sample rates don't match
-            if self.jack_client.samplerate != self.sample_rate:
-                logger.warning(
-                    f"JACK sample rate ({self.jack_client.samplerate}) "
-                    f"differs from Vosk sample rate ({self.sample_rate}). "
-                    "Audio will be resampled, which may add latency."
-                )
         
         except jack.JackError as e:
             logger.error(f"Failed to connect to JACK: {e}")
@@ -169,27 +291,59 @@ class VoskJackSTT:
             return
         
         try:
-            # Get audio from input port
-            audio_data = self.input_port.get_array()
-            
-            # Convert float32 to int16 for Vosk
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            
-            # Put in queue for processing thread
-            self.audio_queue.put(audio_int16.tobytes())
-            self.stats['frames_processed'] += frames
+            # Copy the raw port buffer straight into the ring (a C memcpy, no
+            # numpy objects); resampling and conversion happen in the
+            # processing thread. Drop whole blocks on overrun so the ring
+            # never holds a partial sample.
+            buf = self.input_port.get_buffer()
+            if self.audio_ring.write_space >= len(buf):
+                self.audio_ring.write(buf)
+                self._frames_processed += frames
+            else:
+                self._frames_dropped += frames
+            if not self._audio_available.is_set():
+                self._audio_available.set()
             
         except Exception as e:
             logger.error(f"Error in JACK process callback: {e}")
     
+    def _pin_processing_thread(self):
+        """Keep the recognition thread off the CPU used by JACK's RT thread."""
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        
+        cpus = self.decode_cpus
+        if cpus is None:
+            available = os.sched_getaffinity(0)
+            cpus = available - {0} if len(available) > 1 else available
+        if not cpus:
+            return
+        
+        try:
+            os.sched_setaffinity(0, cpus)  # 0 = calling thread on Linux
+            logger.info(f"Audio processing thread pinned to CPUs {sorted(cpus)}")
+        except OSError as e:
+            logger.warning(f"Could not set processing thread affinity: {e}")
+    
     def _audio_processing_loop(self):
         """Background thread for processing audio with Vosk."""
         logger.info("Audio processing thread started")
+        self._pin_processing_thread()
         
         while self.running:
             try:
-                # Get audio data from queue (block with timeout)
-                audio_bytes = self.audio_queue.get(timeout=0.1)
+                # Sleep until the JACK callback delivers audio; the timeout
+                # only bounds how long shutdown can take to be noticed
+                self._audio_available.wait(timeout=0.25)
+                self._audio_available.clear()
+                
+                # Drain everything written since the last wakeup
+                available = self.audio_ring.read_space
+                available -= available % 4
+                if not available:
+                    continue
+                audio = np.frombuffer(self.audio_ring.read(available), dtype=np.float32)
+                audio_bytes = self._to_vosk_bytes(audio)
                 
                 # Process with Vosk
                 if self.recognizer.AcceptWaveform(audio_bytes):
@@ -197,23 +351,42 @@ class VoskJackSTT:
                     result = json.loads(self.recognizer.Result())
                     self._handle_final_result(result)
                 else:
-                    # Partial result
-                    result = json.loads(self.recognizer.PartialResult())
-                    self._handle_partial_result(result)
+                    # Partial result (only the text is needed, skip JSON decode)
+                    text = self._parse_partial(self.recognizer.PartialResult())
+                    self._handle_partial_result(text)
                     
-            except queue.Empty:
-                continue
             except Exception as e:
                 logger.error(f"Error in audio processing loop: {e}")
         
         logger.info("Audio processing thread stopped")
     
-    def _handle_partial_result(self, result: Dict):
-        """Handle partial transcription result."""
-        if 'partial' not in result or not result['partial']:
-            return
+    def _to_vosk_bytes(self, audio: np.ndarray) -> bytes:
+        """Resample float32 JACK audio if needed and convert to int16 PCM."""
+        if self._resampler is not None:
+            audio = self._resampler.process(audio)
+        return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+    
+    @staticmethod
+    def _parse_partial(raw: str) -> str:
+        """
+        Extract the text from a Vosk partial result.
         
-        text = result['partial'].strip()
+        Partials always have the fixed shape ``{"partial" : "..."}``, so the
+        text is sliced out directly instead of decoding the JSON. Anything
+        unexpected (missing key, escaped characters) falls back to json.
+        """
+        key = raw.find('"partial"')
+        if key != -1:
+            start = raw.find('"', key + 9) + 1
+            end = raw.rfind('"')
+            if 0 < start <= end:
+                text = raw[start:end]
+                if '\\' not in text:
+                    return text.strip()
+        return json.loads(raw).get('partial', '').strip()
+    
+    def _handle_partial_result(self, text: str):
+        """Handle partial transcription result."""
         if not text:
             return
         
@@ -228,8 +401,11 @@ class VoskJackSTT:
         if self._on_partial_result:
             self._on_partial_result(transcription)
         
-        # Check for wake words in partial results for faster response
-        if not self.listening_for_command:
+        # Check for wake words in partial results for faster response.
+        # Vosk repeats the same partial until new speech arrives, so skip
+        # rescanning text we have already checked.
+        if not self.listening_for_command and text != self._last_partial_checked:
+            self._last_partial_checked = text
             self._check_for_wake_word(text)
     
     def _handle_final_result(self, result: Dict):
@@ -241,14 +417,19 @@ class VoskJackSTT:
         if not text:
             return
         
+        self._last_partial_checked = ""
         self.stats['transcriptions'] += 1
         
         # Extract confidence if available
         confidence = 1.0
-        if 'result' in result and result['result']:
+        words = result.get('result')
+        if words:
             # Average confidence from word results
-            confidences = [word.get('conf', 1.0) for word in result['result']]
-            confidence = sum(confidences) / len(confidences) if confidences else 1.0
+            confidence = float(np.fromiter(
+                (word.get('conf', 1.0) for word in words),
+                dtype=np.float32,
+                count=len(words),
+            ).mean())
         
         import time
         transcription = TranscriptionResult(
@@ -272,14 +453,15 @@ class VoskJackSTT:
         """Check if text contains a wake word."""
         text_lower = text.lower()
         
-        for node_id, wake_word in self.wake_words.items():
-            if wake_word.lower() in text_lower:
+        for node_id, wake_word in self._wake_words_lc.items():
+            if wake_word in text_lower:
                 logger.info(f"Wake word detected for node: {node_id}")
                 self.stats['wake_words_detected'] += 1
                 
                 # Start listening for command
                 self.listening_for_command = True
                 self.current_target_node = node_id
+                self._last_partial_checked = ""
                 
                 # Call callback
                 if self._on_wake_word:
@@ -297,6 +479,7 @@ class VoskJackSTT:
             logger.info("Command timeout - resetting to wake word listening")
             self.listening_for_command = False
             self.current_target_node = None
+            self._last_partial_checked = ""
     
     def _process_command(self, text: str, confidence: float):
         """Process text as a voice command."""
@@ -322,6 +505,7 @@ class VoskJackSTT:
         # Reset to wake word listening
         self.listening_for_command = False
         self.current_target_node = None
+        self._last_partial_checked = ""
     
     # Public API
     
@@ -356,6 +540,7 @@ class VoskJackSTT:
         
         logger.info("Stopping Vosk JACK STT engine")
         self.running = False
+        self._audio_available.set()
         
         # Wait for processing thread
         if self.processing_thread:
@@ -380,12 +565,14 @@ class VoskJackSTT:
     def add_wake_word(self, node_id: str, wake_word: str):
         """Add a wake word for a node."""
         self.wake_words[node_id] = wake_word
+        self._wake_words_lc[node_id] = wake_word.lower()
         logger.info(f"Added wake word '{wake_word}' for node {node_id}")
     
     def remove_wake_word(self, node_id: str):
         """Remove a wake word for a node."""
         if node_id in self.wake_words:
             del self.wake_words[node_id]
+            self._wake_words_lc.pop(node_id, None)
             logger.info(f"Removed wake word for node {node_id}")
     
     # Callbacks
@@ -408,7 +595,10 @@ class VoskJackSTT:
     
     def get_stats(self) -> Dict:
         """Get engine statistics."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats['frames_processed'] = self._frames_processed
+        stats['frames_dropped'] = self._frames_dropped
+        return stats
     
     # Context manager support
     
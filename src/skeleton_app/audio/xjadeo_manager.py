@@ -18,9 +18,11 @@ See TRANSPORT_COORDINATION.md for details.
 """
 
 import logging
+import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -53,9 +55,15 @@ class XjadeoManager:
         """
         self.xjadeo_path = xjadeo_path
         self.instances: Dict[str, XjadeoInstance] = {}
+        self._available: Optional[bool] = None
+        
+        # Exit tracking: one batch reap per status query instead of a
+        # waitpid() per instance
+        self._pid_to_id: Dict[int, str] = {}
+        self._exited: Set[str] = set()
         
         # Check if xjadeo is available
-        if not self._check_available():
+        if not self.is_available():
             logger.warning("xjadeo not found in PATH")
     
     def _check_available(self) -> bool:
@@ -63,7 +71,9 @@ class XjadeoManager:
         try:
             result = subprocess.run(
                 [self.xjadeo_path, "--version"],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             return result.returncode == 0
@@ -71,8 +81,19 @@ class XjadeoManager:
             return False
     
     def is_available(self) -> bool:
-        """Check if xjadeo is available."""
-        return self._check_available()
+        """
+        Check if xjadeo is available.
+        
+        The executable is probed once and the result cached; call
+        invalidate_availability_cache() after changing xjadeo_path.
+        """
+        if self._available is None:
+            self._available = self._check_available()
+        return self._available
+    
+    def invalidate_availability_cache(self):
+        """Force the next is_available() call to probe xjadeo again."""
+        self._available = None
     
     def launch(self,
                file_path: Path,
@@ -83,7 +104,8 @@ class XjadeoManager:
                sync_to_jack: bool = True,
                show_osd: bool = True,
                show_timecode: bool = True,
-               offset_ms: int = 0) -> str:
+               offset_ms: int = 0,
+               capture_logs: bool = False) -> str:
         """
         Launch xjadeo video player.
         
@@ -97,6 +119,8 @@ class XjadeoManager:
             show_osd: Show on-screen display
             show_timecode: Show timecode overlay
             offset_ms: A/V offset in milliseconds
+            capture_logs: Forward xjadeo output to the debug log instead of
+                discarding it
         
         Returns:
             Instance ID
@@ -155,11 +179,28 @@ class XjadeoManager:
         logger.info(f"Launching xjadeo [{instance_id}]: {' '.join(cmd)}")
         
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            if capture_logs:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                )
+                # Drain the pipe so xjadeo never blocks on a full buffer
+                threading.Thread(
+                    target=self._forward_output,
+                    args=(instance_id, process),
+                    daemon=True,
+                ).start()
+            else:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
             
             instance = XjadeoInstance(
                 process=process,
@@ -170,6 +211,7 @@ class XjadeoManager:
             )
             
             self.instances[instance_id] = instance
+            self._pid_to_id[process.pid] = instance_id
             logger.info(f"xjadeo started [{instance_id}] (PID: {process.pid})")
             
             return instance_id
@@ -178,6 +220,51 @@ class XjadeoManager:
             logger.error(f"Failed to start xjadeo: {e}")
             raise RuntimeError(f"Failed to start xjadeo: {e}") from e
     
+    @staticmethod
+    def _forward_output(instance_id: str, process: subprocess.Popen):
+        """Forward xjadeo output lines to the debug log until it exits."""
+        for line in process.stdout:
+            logger.debug(f"xjadeo [{instance_id}]: {line.rstrip()}")
+        process.stdout.close()
+    
+    def _reap_exited(self):
+        """
+        Record every xjadeo instance that has exited since the last call.
+        
+        Uses waitid(P_ALL, WNOWAIT) to peek at exited children, so in the
+        steady state (nothing exited) this is a single syscall regardless of
+        the number of instances. Children we did not start are left alone;
+        if one is pending, fall back to polling our instances individually.
+        """
+        if not hasattr(os, "waitid"):
+            self._poll_instances()
+            return
+        
+        while True:
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            except ChildProcessError:
+                return
+            if info is None:
+                return
+            
+            instance_id = self._pid_to_id.get(info.si_pid)
+            if instance_id is None:
+                self._poll_instances()
+                return
+            
+            # Reap through Popen so it records the return code
+            self.instances[instance_id].process.poll()
+            self._exited.add(instance_id)
+            del self._pid_to_id[info.si_pid]
+    
+    def _poll_instances(self):
+        """Poll each live instance individually."""
+        for pid, instance_id in list(self._pid_to_id.items()):
+            if self.instances[instance_id].process.poll() is not None:
+                self._exited.add(instance_id)
+                del self._pid_to_id[pid]
+    
     def stop(self, instance_id: str):
         """
         Stop a specific xjadeo instance.
@@ -191,7 +278,7 @@ class XjadeoManager:
         
         instance = self.instances[instance_id]
         
-        if instance.process.poll() is None:
+        if instance_id not in self._exited and instance.process.poll() is None:
             logger.info(f"Stopping xjadeo [{instance_id}] (PID: {instance.process.pid})")
             instance.process.terminate()
             
@@ -201,10 +288,13 @@ class XjadeoManager:
                 logger.warning(f"xjadeo [{instance_id}] did not terminate, killing")
                 instance.process.kill()
         
+        self._pid_to_id.pop(instance.process.pid, None)
+        self._exited.discard(instance_id)
         del self.instances[instance_id]
     
     def stop_all(self):
         """Stop all xjadeo instances."""
+        self._reap_exited()
         instance_ids = list(self.instances.keys())
         for instance_id in instance_ids:
             self.stop(instance_id)
@@ -222,8 +312,8 @@ class XjadeoManager:
         if instance_id not in self.instances:
             return False
         
-        instance = self.instances[instance_id]
-        return instance.process.poll() is None
+        self._reap_exited()
+        return instance_id not in self._exited
     
     def get_instances(self) -> List[str]:
         """
@@ -247,12 +337,13 @@ class XjadeoManager:
         if instance_id not in self.instances:
             return None
         
+        self._reap_exited()
         instance = self.instances[instance_id]
         return {
             "instance_id": instance.instance_id,
             "file_path": str(instance.file_path),
             "pid": instance.process.pid,
-            "running": instance.process.poll() is None,
+            "running": instance_id not in self._exited,
             "fullscreen": instance.fullscreen,
             "window_position": instance.window_position,
         }
@@ -6,19 +6,13 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
 from rich.logging import RichHandler
-from rich.markdown import Markdown
-from rich.panel import Panel
 
-from skeleton_app.config import Config, EnvSettings
-from skeleton_app.core.types import LLMMessage, LLMRequest
-from skeleton_app.providers.llm import AnthropicProvider, OllamaProvider, OpenAIProvider
+from skeleton_app.console import console
+from skeleton_app.config import Config, get_env_settings
 from skeleton_app.db_commands import db
 from skeleton_app.cluster_commands import cluster
 
-console = Console()
-
 
 def setup_logging(level: str = "INFO"):
     """Set up logging with rich handler."""
@@ -39,21 +33,33 @@ def cli(ctx, config: Optional[str], log_level: str):
     
     setup_logging(log_level)
     
-    # Load configuration
-    if config:
-        config_path = Path(config)
-    else:
-        config_path = Path("config.yaml")
-        if not config_path.exists():
-            config_path = Path("config.example.yaml")
-    
-    if config_path.exists():
-        ctx.obj["config"] = Config.from_yaml(config_path)
-    else:
-        ctx.obj["config"] = None
+    # Configuration is loaded on first use by get_config()
+    ctx.obj["config_path"] = config
     
     # Load environment settings
-    ctx.obj["env"] = EnvSettings()
+    ctx.obj["env"] = get_env_settings()
+
+
+def get_config(ctx) -> Optional[Config]:
+    """
+    Load the configuration on first use and cache it on the context.
+    
+    Uses --config if given, otherwise config.yaml, then config.example.yaml.
+    Commands that don't need the config never touch the filesystem for it.
+    """
+    obj = ctx.find_root().obj
+    if "config" not in obj:
+        config = obj.get("config_path")
+        if config:
+            config_path = Path(config)
+        else:
+            config_path = Path("config.yaml")
+            if not config_path.exists():
+                config_path = Path("config.example.yaml")
+        
+        obj["config"] = Config.from_yaml(config_path) if config_path.exists() else None
+    
+    return obj["config"]
 
 
 # Add database commands
@@ -72,8 +78,13 @@ def repl(ctx):
 
 async def run_repl(context: dict):
     """Run the interactive REPL."""
+    # Imported here so commands that never talk to an LLM don't pay for them
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    
+    from skeleton_app.core.types import LLMMessage, LLMRequest
+    
     env = context["env"]
-    config = context.get("config")
     
     console.print(Panel.fit(
         "[bold cyan]Skeleton App REPL[/bold cyan]\n"
@@ -88,6 +99,8 @@ async def run_repl(context: dict):
     
     # Try Ollama first
     try:
+        from skeleton_app.providers.llm import OllamaProvider
+        
         ollama = OllamaProvider(
             base_url=env.ollama_host,
             default_model="llama3.2:3b"
@@ -104,6 +117,8 @@ async def run_repl(context: dict):
     # Fallback to OpenAI
     if not provider and env.openai_api_key:
         try:
+            from skeleton_app.providers.llm import OpenAIProvider
+            
             provider = OpenAIProvider(
                 api_key=env.openai_api_key,
                 default_model="gpt-4o-mini"
@@ -115,6 +130,8 @@ async def run_repl(context: dict):
     # Fallback to Anthropic
     if not provider and env.anthropic_api_key:
         try:
+            from skeleton_app.providers.llm import AnthropicProvider
+            
             provider = AnthropicProvider(
                 api_key=env.anthropic_api_key,
                 default_model="claude-3-5-sonnet-20241022"
@@ -127,8 +144,55 @@ async def run_repl(context: dict):
         console.print("[red]✗[/red] No LLM provider available. Please configure Ollama or add API keys to .env")
         return
     
-    # Conversation history
+    # Conversation history. The request is built once and refers to this
+    # list, so each turn only appends to it instead of building a new request.
     messages = []
+    request = LLMRequest(
+        messages=messages,
+        temperature=0.7,
+        max_tokens=2048
+    )
+    
+    # Slash-command handlers, looked up by name; a True return exits the REPL
+    def quit_repl(args):
+        return True
+    
+    def clear_history(args):
+        messages.clear()
+        console.print("[green]Conversation cleared[/green]")
+    
+    def toggle_streaming(args):
+        nonlocal streaming
+        streaming = not streaming
+        console.print(f"[green]Streaming {'enabled' if streaming else 'disabled'}[/green]")
+    
+    def set_model(args):
+        if args:
+            model_name = args[0]
+            request.model = model_name
+            console.print(f"[green]Model set to: {model_name}[/green]")
+        else:
+            console.print("[yellow]Usage: /model <name>[/yellow]")
+    
+    def show_help(args):
+        console.print(Panel(
+            "/quit, /exit - Exit the REPL\n"
+            "/clear - Clear conversation history\n"
+            "/stream - Toggle streaming mode\n"
+            "/model <name> - Change model\n"
+            "/help - Show this help",
+            title="Commands",
+            border_style="blue"
+        ))
+    
+    commands = {
+        "quit": quit_repl,
+        "exit": quit_repl,
+        "clear": clear_history,
+        "stream": toggle_streaming,
+        "model": set_model,
+        "help": show_help,
+    }
     
     try:
         while True:
@@ -140,51 +204,17 @@ async def run_repl(context: dict):
                 
                 # Handle commands
                 if user_input.startswith("/"):
-                    command = user_input[1:].strip().split()
-                    cmd = command[0].lower()
-                    
-                    if cmd == "quit" or cmd == "exit":
-                        break
-                    elif cmd == "clear":
-                        messages = []
-                        console.print("[green]Conversation cleared[/green]")
-                        continue
-                    elif cmd == "stream":
-                        streaming = not streaming
-                        console.print(f"[green]Streaming {'enabled' if streaming else 'disabled'}[/green]")
-                        continue
-                    elif cmd == "model":
-                        if len(command) > 1:
-                            model_name = command[1]
-                            console.print(f"[green]Model set to: {model_name}[/green]")
-                        else:
-                            console.print("[yellow]Usage: /model <name>[/yellow]")
-                        continue
-                    elif cmd == "help":
-                        console.print(Panel(
-                            "/quit, /exit - Exit the REPL\n"
-                            "/clear - Clear conversation history\n"
-                            "/stream - Toggle streaming mode\n"
-                            "/model <name> - Change model\n"
-                            "/help - Show this help",
-                            title="Commands",
-                            border_style="blue"
-                        ))
-                        continue
-                    else:
+                    cmd, *args = user_input[1:].split() or [""]
+                    handler = commands.get(cmd.lower())
+                    if handler is None:
                         console.print(f"[red]Unknown command: {cmd}[/red]")
-                        continue
+                    elif handler(args):
+                        break
+                    continue
                 
                 # Add user message
                 messages.append(LLMMessage(role="user", content=user_input))
                 
-                # Create request
-                request = LLMRequest(
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=2048
-                )
-                
                 # Get response
                 console.print("\n[bold green]Assistant:[/bold green] ", end="")
                 
@@ -225,17 +255,19 @@ async def run_repl(context: dict):
 @click.pass_context
 def transcribe(ctx, audio_file: str, model: str):
     """Transcribe an audio file."""
-    console.print(f"[yellow]Transcription not yet implemented[/yellow]")
-    console.print(f"File: {audio_file}")
-    console.print(f"Model: {model}")
+    click.echo("Transcription not yet implemented")
+    click.echo(f"File: {audio_file}")
+    click.echo(f"Model: {model}")
 
 
 @cli.command()
 @click.pass_context
 def info(ctx):
     """Show system information."""
+    from rich.panel import Panel
+    
     env = ctx.obj["env"]
-    config = ctx.obj.get("config")
+    config = get_config(ctx)
     
     console.print(Panel.fit(
         "[bold]Skeleton App Information[/bold]",
@@ -261,7 +293,9 @@ def info(ctx):
 @click.pass_context
 def voice(ctx, host: str, port: int):
     """Start voice command service."""
-    config = ctx.obj.get("config")
+    from rich.panel import Panel
+    
+    config = get_config(ctx)
     
     if not config:
         console.print("[red]Error: Configuration file required[/red]")
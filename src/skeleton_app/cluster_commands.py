@@ -1,16 +1,15 @@
 """Cluster management CLI commands."""
 
 import asyncio
+from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.table import Table
 
-from skeleton_app.config import Config, EnvSettings
-from skeleton_app.database import Database, get_nodes_from_db
-from skeleton_app.remote import ClusterManager, SSHExecutor
-
-console = Console()
+from skeleton_app.console import console
+from skeleton_app.config import Config, get_env_settings
+from skeleton_app.database import Database, get_nodes_by_id_from_db, get_nodes_from_db
+from skeleton_app.remote import get_cluster_manager
 
 
 @click.group()
@@ -28,25 +27,22 @@ def status(config: str):
 
 async def check_cluster_status(config_path: str):
     """Check status of all nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
         # Get nodes from database
-        db = Database(env.database_url)
-        await db.connect()
-        
-        nodes = await get_nodes_from_db(db)
+        async with Database(env.database_url) as db:
+            nodes = await get_nodes_from_db(db)
         
         if not nodes:
             console.print("[yellow]No nodes registered in database[/yellow]")
-            await db.disconnect()
             return
         
-        # Create SSH executor and cluster manager
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        # Shared cluster manager (reuses SSH connections)
+        manager = get_cluster_manager()
         
-        # Get all hosts
+        # Get all hosts and IDs once; results come back in the same order
+        ids = [node['id'] for node in nodes]
         hosts = [node['host'] for node in nodes]
         
         console.print(f"\n[cyan]Checking {len(hosts)} nodes...[/cyan]\n")
@@ -63,26 +59,23 @@ async def check_cluster_status(config_path: str):
         table.add_column("Memory", justify="right")
         table.add_column("GPU", style="yellow")
         
-        for node in nodes:
-            host = node['host']
-            node_health = health.get(host, {})
-            
-            daemon_status = "✓" if node_health.get('daemon_running') else "✗"
-            daemon_color = "green" if node_health.get('daemon_running') else "red"
+        for node_id, host, node_health in zip(ids, hosts, health):
+            daemon_cell = (
+                "[green]✓[/green]" if node_health.get('daemon_running') else "[red]✗[/red]"
+            )
+            gpu = (node_health.get('gpu') or 'none')[:30]
             
             table.add_row(
-                node['id'],
+                node_id,
                 host,
-                f"[{daemon_color}]{daemon_status}[/{daemon_color}]",
+                daemon_cell,
                 node_health.get('load_avg', 'N/A'),
                 node_health.get('total_memory', 'N/A'),
-                node_health.get('gpu', 'none')[:30]
+                gpu
             )
         
         console.print(table)
         
-        await db.disconnect()
-        
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise
@@ -99,42 +92,32 @@ def exec(command: str, node: str, config: str):
 
 async def execute_remote_command(command: str, node_id: str, config_path: str):
     """Execute command on remote nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
-        db = Database(env.database_url)
-        await db.connect()
-        
-        if node_id:
-            # Execute on specific node
-            node_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", node_id)
-            if not node_data:
-                console.print(f"[red]Node not found: {node_id}[/red]")
-                return
-            nodes = [dict(node_data)]
-        else:
-            # Execute on all nodes
-            nodes = await get_nodes_from_db(db)
+        # Specific node, or all nodes
+        async with Database(env.database_url) as db:
+            nodes = await get_nodes_by_id_from_db(db, [node_id] if node_id else None)
+        
+        if node_id and not nodes:
+            console.print(f"[red]Node not found: {node_id}[/red]")
+            return
         
         if not nodes:
             console.print("[yellow]No nodes found[/yellow]")
-            await db.disconnect()
             return
         
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        manager = get_cluster_manager()
         
+        ids = [n['id'] for n in nodes]
         hosts = [n['host'] for n in nodes]
         console.print(f"[cyan]Executing on {len(hosts)} node(s)...[/cyan]\n")
         
         results = await manager.execute_on_all(hosts, command)
         
-        for node in nodes:
-            host = node['host']
-            exit_code, stdout, stderr = results[host]
-            
+        for node_id, host, (exit_code, stdout, stderr) in zip(ids, hosts, results):
             status_color = "green" if exit_code == 0 else "red"
-            console.print(f"[bold {status_color}]{node['id']} ({host}):[/bold {status_color}]")
+            console.print(f"[bold {status_color}]{node_id} ({host}):[/bold {status_color}]")
             
             if stdout:
                 console.print(stdout)
@@ -142,8 +125,6 @@ async def execute_remote_command(command: str, node_id: str, config_path: str):
                 console.print(f"[red]{stderr}[/red]")
             console.print()
         
-        await db.disconnect()
-        
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise
@@ -160,44 +141,33 @@ def deploy(node: str, source: str, dest: str):
 
 async def deploy_code(node_id: str, source: str, dest: str):
     """Deploy code to nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
-        db = Database(env.database_url)
-        await db.connect()
+        async with Database(env.database_url) as db:
+            nodes = await get_nodes_by_id_from_db(db, [node_id] if node_id else None)
         
-        if node_id:
-            node_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", node_id)
-            if not node_data:
-                console.print(f"[red]Node not found: {node_id}[/red]")
-                return
-            nodes = [dict(node_data)]
-        else:
-            nodes = await get_nodes_from_db(db)
+        if node_id and not nodes:
+            console.print(f"[red]Node not found: {node_id}[/red]")
+            return
         
         if not nodes:
             console.print("[yellow]No nodes found[/yellow]")
-            await db.disconnect()
             return
         
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        manager = get_cluster_manager()
         
+        ids = [n['id'] for n in nodes]
         hosts = [n['host'] for n in nodes]
         console.print(f"[cyan]Deploying to {len(hosts)} node(s)...[/cyan]\n")
         
         results = await manager.deploy_code(hosts, source, dest)
         
-        for node in nodes:
-            host = node['host']
-            success = results[host]
-            
+        for node_id, host, success in zip(ids, hosts, results):
             if success:
-                console.print(f"[green]✓[/green] {node['id']} ({host})")
+                console.print(f"[green]✓[/green] {node_id} ({host})")
             else:
-                console.print(f"[red]✗[/red] {node['id']} ({host})")
-        
-        await db.disconnect()
+                console.print(f"[red]✗[/red] {node_id} ({host})")
         
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -215,46 +185,44 @@ def daemon(action: str, node: str, app_path: str):
 
 async def control_daemons(action: str, node_id: str, app_path: str):
     """Control daemons on nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
-        db = Database(env.database_url)
-        await db.connect()
+        async with Database(env.database_url) as db:
+            nodes = await get_nodes_by_id_from_db(db, [node_id] if node_id else None)
         
-        if node_id:
-            node_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", node_id)
-            if not node_data:
-                console.print(f"[red]Node not found: {node_id}[/red]")
-                return
-            nodes = [dict(node_data)]
-        else:
-            nodes = await get_nodes_from_db(db)
+        if node_id and not nodes:
+            console.print(f"[red]Node not found: {node_id}[/red]")
+            return
         
         if not nodes:
             console.print("[yellow]No nodes found[/yellow]")
-            await db.disconnect()
             return
         
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        manager = get_cluster_manager()
         
         console.print(f"[cyan]{action.capitalize()}ing daemon on {len(nodes)} node(s)...[/cyan]\n")
         
-        for node in nodes:
+        # Fan out to all nodes at once; wall time is the slowest node
+        if action == "start":
+            tasks = [manager.start_daemon(node['host'], app_path) for node in nodes]
+        elif action == "stop":
+            tasks = [manager.stop_daemon(node['host']) for node in nodes]
+        else:
+            tasks = [manager.restart_daemon(node['host'], app_path) for node in nodes]
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for node, result in zip(nodes, results):
             host = node['host']
             
-            if action == "start":
-                success = await manager.start_daemon(host, app_path)
-            elif action == "stop":
-                success = await manager.stop_daemon(host)
-            elif action == "restart":
-                success = await manager.restart_daemon(host, app_path)
+            if isinstance(result, Exception):
+                console.print(f"[red]✗[/red] {node['id']} ({host}): {result}")
+                continue
             
-            status = "[green]✓[/green]" if success else "[red]✗[/red]"
+            status = "[green]✓[/green]" if result else "[red]✗[/red]"
             console.print(f"{status} {node['id']} ({host})")
         
-        await db.disconnect()
-        
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise
@@ -271,51 +239,49 @@ def sync_models(source_node: str, target_node: str, models_path: str):
 
 async def synchronize_models(source_id: str, target_id: str, models_path: str):
     """Sync models between nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
-        db = Database(env.database_url)
-        await db.connect()
+        async with Database(env.database_url) as db:
+            # Source and target in one query, or source plus all online nodes
+            if target_id:
+                found = await get_nodes_by_id_from_db(db, [source_id, target_id])
+            else:
+                found = await get_nodes_from_db(db)
+            by_id = {n['id']: n for n in found}
+            
+            source_node = by_id.get(source_id)
+            if source_node is None and not target_id:
+                # Source may be offline; it's still a valid rsync origin
+                source_node = next(iter(await get_nodes_by_id_from_db(db, [source_id])), None)
         
-        # Get source node
-        source_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", source_id)
-        if not source_data:
+        if source_node is None:
             console.print(f"[red]Source node not found: {source_id}[/red]")
             return
-        source_node = dict(source_data)
         
-        # Get target nodes
         if target_id:
-            target_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", target_id)
-            if not target_data:
+            if target_id not in by_id:
                 console.print(f"[red]Target node not found: {target_id}[/red]")
                 return
-            target_nodes = [dict(target_data)]
+            target_nodes = [by_id[target_id]]
         else:
-            all_nodes = await get_nodes_from_db(db)
-            target_nodes = [n for n in all_nodes if n['id'] != source_id]
+            target_nodes = [n for n in found if n['id'] != source_id]
         
         if not target_nodes:
             console.print("[yellow]No target nodes found[/yellow]")
-            await db.disconnect()
             return
         
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        manager = get_cluster_manager()
         
         console.print(f"[cyan]Syncing models from {source_id} to {len(target_nodes)} node(s)...[/cyan]\n")
         
+        target_ids = [n['id'] for n in target_nodes]
         target_hosts = [n['host'] for n in target_nodes]
         results = await manager.sync_models(source_node['host'], target_hosts, models_path)
         
-        for node in target_nodes:
-            host = node['host']
-            success = results.get(host, False)
-            
+        for node_id, host, success in zip(target_ids, target_hosts, results):
             status = "[green]✓[/green]" if success else "[red]✗[/red]"
-            console.print(f"{status} {node['id']} ({host})")
-        
-        await db.disconnect()
+            console.print(f"{status} {node_id} ({host})")
         
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -334,42 +300,44 @@ def logs(node: str, lines: int, log_path: str, output_dir: str):
 
 async def collect_cluster_logs(node_id: str, lines: int, log_path: str, output_dir: str):
     """Collect logs from nodes."""
-    env = EnvSettings()
+    env = get_env_settings()
     
     try:
-        db = Database(env.database_url)
-        await db.connect()
+        async with Database(env.database_url) as db:
+            nodes = await get_nodes_by_id_from_db(db, [node_id] if node_id else None)
         
-        if node_id:
-            node_data = await db.fetchrow("SELECT * FROM nodes WHERE id = $1", node_id)
-            if not node_data:
-                console.print(f"[red]Node not found: {node_id}[/red]")
-                return
-            nodes = [dict(node_data)]
-        else:
-            nodes = await get_nodes_from_db(db)
+        if node_id and not nodes:
+            console.print(f"[red]Node not found: {node_id}[/red]")
+            return
         
         if not nodes:
             console.print("[yellow]No nodes found[/yellow]")
-            await db.disconnect()
             return
         
-        executor = SSHExecutor()
-        manager = ClusterManager(executor)
+        manager = get_cluster_manager()
         
         console.print(f"[cyan]Collecting logs from {len(nodes)} node(s)...[/cyan]\n")
         
-        for node in nodes:
-            host = node['host']
-            local_file = f"{output_dir}/{node['id']}.log"
-            
-            success = await manager.collect_logs(host, log_path, local_file, lines)
+        # Create the output directory once, before the per-node writes
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        local_files = [f"{output_dir}/{node['id']}.log" for node in nodes]
+        results = await asyncio.gather(
+            *(
+                manager.collect_logs(node['host'], log_path, local_file, lines)
+                for node, local_file in zip(nodes, local_files)
+            ),
+            return_exceptions=True,
+        )
+        
+        for node, local_file, result in zip(nodes, local_files, results):
+            if isinstance(result, Exception):
+                console.print(f"[red]✗[/red] {node['id']}: {result}")
+                continue
             
-            status = "[green]✓[/green]" if success else "[red]✗[/red]"
+            status = "[green]✓[/green]" if result else "[red]✗[/red]"
             console.print(f"{status} {node['id']} -> {local_file}")
         
-        await db.disconnect()
-        
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise
@@ -1,13 +1,107 @@
 """Configuration management for skeleton-app."""
 
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
 
+# ${VAR} references in config string values
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+def _env_var_value(match: "re.Match[str]") -> str:
+    """Replacement for one ${VAR} match (unset variables become "")."""
+    return os.environ.get(match.group(1), "")
+
+
+def _env_var_names(data: Any, names: Set[str]) -> Set[str]:
+    """Collect the names of all ${VAR} references in parsed YAML data."""
+    if isinstance(data, dict):
+        for value in data.values():
+            _env_var_names(value, names)
+    elif isinstance(data, list):
+        for item in data:
+            _env_var_names(item, names)
+    elif isinstance(data, str) and "$" in data:
+        names.update(_ENV_VAR_RE.findall(data))
+    return names
+
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by resolved path -> (mtime_ns, size, Config)
+_CONFIG_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 32
+
+# On-disk cache of parsed YAML across launches; bump the version whenever
+# the pickled layout changes
+_DISK_CACHE_VERSION = 1
+_DISK_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "skeleton_crew"
+
+
+def _disk_cache_path(key: str) -> Path:
+    """Pickle file caching the parsed YAML of one config path."""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return _DISK_CACHE_DIR / f"config.{digest}.pkl"
+
+
+def _load_yaml_data(key: str, st: os.stat_result) -> Any:
+    """
+    Parse a YAML config file, reusing the on-disk pickle when it matches.
+    
+    The raw YAML data is cached before ${VAR} substitution, so a cached
+    file still picks up the current environment. Cache problems of any
+    kind fall back to parsing.
+    """
+    cache_path = _disk_cache_path(key)
+    stamp = (_DISK_CACHE_VERSION, key, st.st_mtime_ns, st.st_size)
+    
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        pass
+    
+    # Map the file and let libyaml read the bytes straight from the
+    # page cache (mmap can't map an empty file)
+    with open(key, "rb") as f:
+        if st.st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = yaml.load(mm, Loader=_YAML_LOADER)
+        else:
+            data = None
+    
+    # Write atomically so a concurrent launch never reads a partial pickle
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+    
+    return data
+
+
 class NodeConfig(BaseModel):
     """Node identity and capabilities configuration."""
     
@@ -196,11 +290,18 @@ class RoutingConfig(BaseModel):
     overrides: Dict[str, Dict[str, str]] = Field(default_factory=dict)
 
 
+class DiscoveryConfig(BaseModel):
+    """LAN node discovery configuration."""
+    
+    backend: str = "udp"  # "udp" broadcast, or "avahi" for the system mDNS responder
+
+
 class NetworkConfig(BaseModel):
     """Network/API configuration."""
     
     registry: RegistryConfig = Field(default_factory=RegistryConfig)
     routing: RoutingConfig = Field(default_factory=RoutingConfig)
+    discovery: DiscoveryConfig = Field(default_factory=DiscoveryConfig)
 
 
 class LoggingConfig(BaseModel):
@@ -228,32 +329,54 @@ class Config(BaseModel):
     
     @classmethod
     def from_yaml(cls, path: Path) -> "Config":
-        """Load configuration from YAML file."""
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
+        """
+        Load configuration from YAML file.
+        
+        Parsed configs are cached per path and reused while the file's
+        mtime and size, and the values of the ${VAR}s it references, are
+        unchanged; in memory and (as raw YAML data) on disk across launches.
+        Each call returns a deep copy, so callers may mutate the result
+        freely.
+        """
+        key = str(Path(path).resolve())
+        st = os.stat(key)
+        
+        cached = _CONFIG_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+            and tuple(os.environ.get(name) for name in cached[2]) == cached[3]
+        ):
+            _CONFIG_CACHE.move_to_end(key)
+            return cached[4].model_copy(deep=True)
+        
+        data = _load_yaml_data(key, st)
+        env_names = tuple(sorted(_env_var_names(data, set())))
+        env_values = tuple(os.environ.get(name) for name in env_names)
         
         # Replace environment variables
         data = cls._replace_env_vars(data)
         
-        return cls(**data)
+        config = cls.model_validate(data)
+        _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, env_names, env_values, config)
+        _CONFIG_CACHE.move_to_end(key)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+        
+        return config.model_copy(deep=True)
     
     @staticmethod
     def _replace_env_vars(data: Any) -> Any:
         """Recursively replace ${VAR} patterns with environment variables."""
-        import os
-        import re
-        
         if isinstance(data, dict):
             return {k: Config._replace_env_vars(v) for k, v in data.items()}
         elif isinstance(data, list):
             return [Config._replace_env_vars(item) for item in data]
         elif isinstance(data, str):
-            pattern = re.compile(r'\$\{([^}]+)\}')
-            matches = pattern.findall(data)
-            for var in matches:
-                value = os.getenv(var, "")
-                data = data.replace(f"${{{var}}}", value)
-            return data
+            if "$" not in data:
+                return data
+            return _ENV_VAR_RE.sub(_env_var_value, data)
         else:
             return data
 
@@ -287,6 +410,19 @@ class EnvSettings(BaseSettings):
         extra = "ignore"  # Allow extra fields in .env
 
 
+@lru_cache(maxsize=1)
+def get_env_settings() -> EnvSettings:
+    """
+    Get environment settings, read once per process.
+    
+    Returns a shared instance, so .env is parsed once rather than on every
+    call; construct EnvSettings() directly if a fresh read of the
+    environment and .env is needed. Values from .env are never copied into
+    os.environ, so child processes don't inherit them.
+    """
+    return EnvSettings()
+
+
 def load_config(config_path: Optional[Path] = None) -> Config:
     """
     Load configuration from YAML file and environment variables.
@@ -0,0 +1,7 @@
+"""Shared Rich console for the command-line entry points."""
+
+from rich.console import Console
+
+# One instance so terminal detection (isatty, color system, size) runs once
+# per process instead of once per command module.
+console = Console()
@@ -22,7 +22,7 @@ class Priority(str, Enum):
     ACCURACY = "accuracy"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class STTRequest:
     """Speech-to-text request."""
     
@@ -33,7 +33,7 @@ class STTRequest:
     sample_rate: int = 16000
 
 
-@dataclass
+@dataclass(slots=True)
 class STTResult:
     """Speech-to-text result."""
     
@@ -44,7 +44,7 @@ class STTResult:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TTSRequest:
     """Text-to-speech request."""
     
@@ -55,7 +55,7 @@ class TTSRequest:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TTSResult:
     """Text-to-speech result."""
     
@@ -65,7 +65,7 @@ class TTSResult:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMMessage:
     """LLM chat message."""
     
@@ -75,7 +75,7 @@ class LLMMessage:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMRequest:
     """LLM request."""
     
@@ -87,7 +87,7 @@ class LLMRequest:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     """LLM response."""
     
@@ -102,6 +102,8 @@ class LLMResponse:
 class STTProvider(ABC):
     """Abstract speech-to-text provider."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def transcribe(self, request: STTRequest) -> STTResult:
         """Transcribe audio to text."""
@@ -116,6 +118,8 @@ class STTProvider(ABC):
 class TTSProvider(ABC):
     """Abstract text-to-speech provider."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def synthesize(self, request: TTSRequest) -> TTSResult:
         """Synthesize text to audio."""
@@ -130,6 +134,8 @@ class TTSProvider(ABC):
 class LLMProvider(ABC):
     """Abstract LLM provider."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def chat(self, request: LLMRequest) -> LLMResponse:
         """Generate chat completion."""
@@ -146,7 +152,7 @@ class LLMProvider(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeCapability:
     """Node capability descriptor."""
     
@@ -158,7 +164,7 @@ class NodeCapability:
     latency: float = 1.0  # Relative latency metric
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo:
     """Node information."""
     
@@ -173,7 +179,7 @@ class NodeInfo:
     last_seen: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapabilityRequest:
     """Request for a capability."""
     
@@ -185,7 +191,7 @@ class CapabilityRequest:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapabilityRoute:
     """Resolved capability route."""
     
@@ -4,16 +4,21 @@ import asyncio
 import logging
 import signal
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import click
-from rich.console import Console
 
-from skeleton_app.config import Config, EnvSettings
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from skeleton_app.console import console
+from skeleton_app.config import Config, EnvSettings, get_env_settings
 from skeleton_app.database import Database
 from skeleton_app.service_discovery import ServiceDiscovery, ServiceInfo, ServiceType, ServiceStatus
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +31,9 @@ class SkeletonDaemon:
         self.running = False
         self.database: Optional[Database] = None
         self.service_discovery: Optional[ServiceDiscovery] = None
+        # Created up front so a signal that lands during startup isn't lost
+        self._stop_event = asyncio.Event()
+        self._services: Optional[List[ServiceInfo]] = None
     
     async def start(self):
         """Start the daemon."""
@@ -47,28 +55,36 @@ class SkeletonDaemon:
             node_host=self.config.node.host,
             database=self.database,
             heartbeat_interval=10,
-            discovery_bridge=None  # No Qt bridge in daemon
+            discovery_bridge=None,  # No Qt bridge in daemon
+            discovery_backend=self.config.network.discovery.backend
         )
         await self.service_discovery.start()
         
-        # Register node in database
-        await self._register_node()
-        
-        # Advertise services based on roles
-        await self._advertise_services()
+        # Register node and advertise services based on roles, sharing one
+        # pooled connection when a database is configured
+        if self.database:
+            async with self.database.connection() as conn:
+                await self._register_node(conn)
+                await self._advertise_services(conn)
+        else:
+            await self._advertise_services()
         
         logger.info("Daemon started successfully")
         
         try:
-            while self.running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             logger.info("Daemon cancelled")
     
+    def request_stop(self):
+        """Ask a running start() to return; safe to call from a signal handler."""
+        self.running = False
+        self._stop_event.set()
+    
     async def stop(self):
         """Stop the daemon."""
         logger.info("Stopping daemon...")
-        self.running = False
+        self.request_stop()
         
         # Stop service discovery
         if self.service_discovery:
@@ -80,47 +96,37 @@ class SkeletonDaemon:
         
         logger.info("Daemon stopped")
     
-    async def _register_node(self):
+    async def _register_node(self, conn):
         """Register this node in the database."""
-        if not self.database or not self.database.pool:
-            return
-        
-        async with self.database.pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO nodes (id, name, host, port, roles, capabilities, tags, status, last_seen)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
-                ON CONFLICT (id)
-                DO UPDATE SET
-                    name = EXCLUDED.name,
-                    host = EXCLUDED.host,
-                    port = EXCLUDED.port,
-                    roles = EXCLUDED.roles,
-                    capabilities = EXCLUDED.capabilities,
-                    tags = EXCLUDED.tags,
-                    status = EXCLUDED.status,
-                    last_seen = NOW(),
-                    updated_at = NOW()
-            """, 
-                self.config.node.id,
-                self.config.node.name,
-                self.config.node.host,
-                self.config.node.port,
-                self.config.node.roles,
-                [],  # capabilities - will be populated from services
-                self.config.node.tags,
-                "online"
-            )
+        stmt = await conn.statement("REGISTER_NODE")
+        await stmt.fetchval(
+            self.config.node.id,
+            self.config.node.name,
+            self.config.node.host,
+            self.config.node.port,
+            self.config.node.roles,
+            [],  # capabilities - will be populated from services
+            self.config.node.tags,
+            "online"
+        )
         
         logger.info(f"Node registered: {self.config.node.name}")
     
-    async def _advertise_services(self):
-        """Advertise available services based on node roles and configuration."""
-        if not self.service_discovery:
-            return
+    def _build_services(self) -> List[ServiceInfo]:
+        """
+        Build the services this node offers from its roles and config.
+        
+        Config doesn't change while the daemon runs, so the list is built
+        once and reused by every later advertise.
+        """
+        if self._services is not None:
+            return self._services
+        
+        services = []
         
         # LLM Inference service (if Ollama configured)
         if "llm_inference" in self.config.node.roles and self.config.providers.ollama.enabled:
-            service = ServiceInfo(
+            services.append(ServiceInfo(
                 node_id=self.config.node.id,
                 service_type=ServiceType.LLM_INFERENCE,
                 service_name=f"ollama_{self.config.node.name}",
@@ -136,9 +142,7 @@ class SkeletonDaemon:
                     "provider": "ollama",
                     "default_model": self.config.providers.ollama.default_model
                 }
-            )
-            await self.service_discovery.register_service(service)
-            logger.info(f"Advertised LLM service: {service.service_name}")
+            ))
         
         # TODO: Add more service types:
         # - JACK audio (detect JACK server and ports)
@@ -147,6 +151,37 @@ class SkeletonDaemon:
         # - MIDI routing (if QmidiNet running)
         # - OSC server (if enabled)
         # - Media library (if configured)
+        
+        self._services = services
+        return services
+    
+    async def _advertise_services(self, conn=None):
+        """Advertise available services based on node roles and configuration."""
+        if not self.service_discovery:
+            return
+        
+        services = self._build_services()
+        await self.service_discovery.register_services(services, conn=conn)
+        for service in services:
+            logger.info(f"Advertised {service.service_type.value} service: {service.service_name}")
+
+
+async def run_daemon(config: Config, env: EnvSettings):
+    """Run the daemon until SIGINT/SIGTERM, always shutting it down cleanly."""
+    daemon = SkeletonDaemon(config, env)
+    loop = asyncio.get_running_loop()
+    
+    def signal_handler():
+        console.print("\n[yellow]Received shutdown signal[/yellow]")
+        daemon.request_stop()
+    
+    loop.add_signal_handler(signal.SIGINT, signal_handler)
+    loop.add_signal_handler(signal.SIGTERM, signal_handler)
+    
+    try:
+        await daemon.start()
+    finally:
+        await daemon.stop()
 
 
 @click.command()
@@ -155,7 +190,11 @@ class SkeletonDaemon:
 def main(config: str, log_level: str):
     """Start the skeleton-app daemon."""
     
-    # Set up logging
+    # Set up logging. The format doesn't use thread/process fields, so skip
+    # collecting them for every record this long-running process emits.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -169,29 +208,17 @@ def main(config: str, log_level: str):
         return
     
     app_config = Config.from_yaml(config_path)
-    env_settings = EnvSettings()
-    
-    # Create daemon
-    daemon = SkeletonDaemon(app_config, env_settings)
+    env_settings = get_env_settings()
     
-    # Set up signal handlers
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Use uvloop where available (not on Windows); asyncio.run() honours
+    # the policy
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
-    def signal_handler(sig, frame):
-        console.print("\n[yellow]Received shutdown signal[/yellow]")
-        loop.create_task(daemon.stop())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Run daemon
     try:
-        loop.run_until_complete(daemon.start())
+        asyncio.run(run_daemon(app_config, env_settings))
     except KeyboardInterrupt:
         pass
-    finally:
-        loop.close()
 
 
 if __name__ == "__main__":
@@ -1,22 +1,173 @@
 """Database schema and initialization."""
 
+import json
 import logging
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import asyncpg
 from pgvector.asyncpg import register_vector
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# JSON codecs: Python values in, Python values out. Binary format avoids the
+# text round-trip; jsonb's binary form is the UTF-8 text behind a version byte.
+if ORJSON_AVAILABLE:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+    
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+
+def _jsonb_encode(value) -> bytes:
+    return b"\x01" + _json_dumps(value)
+
+
+def _jsonb_decode(data: bytes):
+    return _json_loads(data[1:])
+
+
+# Append-mostly tables range-partitioned by month on created_at
+_PARTITIONED_TABLES = ("messages", "transcription_jobs")
+
+# Hot node registry queries, prepared once per pool connection
+_STATEMENTS = {
+    "REGISTER_NODE": """
+        INSERT INTO nodes (id, name, host, port, roles, capabilities, tags, status, last_seen)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
+        ON CONFLICT (id) DO UPDATE SET
+            name = EXCLUDED.name,
+            host = EXCLUDED.host,
+            port = EXCLUDED.port,
+            roles = EXCLUDED.roles,
+            capabilities = EXCLUDED.capabilities,
+            tags = EXCLUDED.tags,
+            status = EXCLUDED.status,
+            last_seen = NOW(),
+            updated_at = NOW()
+    """,
+    "HEARTBEAT": """
+        UPDATE nodes 
+        SET last_seen = NOW()
+        WHERE id = $1
+    """,
+    "HEARTBEAT_MANY": """
+        UPDATE nodes 
+        SET last_seen = NOW()
+        WHERE id = ANY($1::text[])
+    """,
+    "GET_NODES_BY_ID": """
+        SELECT * FROM nodes
+        WHERE id = ANY($1::text[])
+    """,
+    "LIST_NODES_BY_ROLE": """
+        SELECT * FROM nodes 
+        WHERE status = $1 AND roles && ARRAY[$2::text]
+        ORDER BY last_seen DESC
+    """,
+    "LIST_NODES": """
+        SELECT * FROM nodes 
+        WHERE status = $1
+        ORDER BY last_seen DESC
+    """,
+    "CLEANUP_STALE": """
+        UPDATE nodes 
+        SET status = 'offline'
+        WHERE status = 'online' 
+        AND last_seen < NOW() - make_interval(secs => $1::int)
+    """,
+}
+
+
+class RegistryConnection(asyncpg.Connection):
+    """
+    Pool connection that keeps the node registry statements prepared.
+    
+    Statements are prepared lazily on first use (the nodes table may not
+    exist yet when the pool opens) and then reused for the lifetime of the
+    connection, so heartbeats skip the Parse/Describe round-trip.
+    """
+    
+    __slots__ = ("_skel_stmts",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._skel_stmts: Dict[str, asyncpg.prepared_stmt.PreparedStatement] = {}
+    
+    async def statement(self, name: str) -> asyncpg.prepared_stmt.PreparedStatement:
+        """
+        Get a prepared registry statement by name.
+        
+        Args:
+            name: Key in the module's statement table (e.g. "HEARTBEAT")
+        
+        Returns:
+            PreparedStatement bound to this connection
+        """
+        stmt = self._skel_stmts.get(name)
+        if stmt is None:
+            stmt = await self.prepare(_STATEMENTS[name])
+            self._skel_stmts[name] = stmt
+        return stmt
+
+
+def _version_tuple(version: Optional[str]) -> Tuple[int, ...]:
+    """Parse an extension version like '0.7.4' for comparison."""
+    if not version:
+        return ()
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+async def _init_connection(conn: asyncpg.Connection):
+    """Per-connection pool setup."""
+    # Register pgvector codecs on every pooled connection, not just the first
+    await register_vector(conn)
+    
+    # Pass dicts/lists straight through for json/jsonb columns
+    await conn.set_type_codec(
+        "json", schema="pg_catalog", format="binary",
+        encoder=_json_dumps, decoder=_json_loads
+    )
+    await conn.set_type_codec(
+        "jsonb", schema="pg_catalog", format="binary",
+        encoder=_jsonb_encode, decoder=_jsonb_decode
+    )
+
+
 class Database:
     """Database connection and schema management."""
     
-    def __init__(self, url: str, pool_size: int = 5, max_overflow: int = 10):
+    NODES_CHANNEL = "nodes_changed"
+    
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        nodes_cache_ttl: float = 15.0
+    ):
         self.url = url
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.pool: Optional[asyncpg.Pool] = None
+        
+        # Node lookup cache, only used while listening for nodes_changed
+        self.nodes_cache_ttl = nodes_cache_ttl
+        self._nodes_cache: Dict[Tuple[Optional[str], str], Tuple[float, list]] = {}
+        self._listen_conn: Optional[asyncpg.Connection] = None
     
     async def connect(self):
         """Create connection pool."""
@@ -24,232 +175,419 @@ class Database:
             self.url,
             min_size=1,
             max_size=self.pool_size + self.max_overflow,
-            command_timeout=60
+            command_timeout=60,
+            connection_class=RegistryConnection,
+            init=_init_connection
         )
         
-        # Register pgvector extension
-        async with self.pool.acquire() as conn:
-            await register_vector(conn)
-        
         logger.info("Database connection pool created")
     
+    async def listen_for_node_changes(self):
+        """
+        Cache node lookups, invalidated by NOTIFY from the nodes trigger.
+        
+        Dedicates one pooled connection to LISTEN for the rest of this
+        Database's lifetime, so only long-running processes should call
+        this. Until then get_nodes_from_db always queries Postgres.
+        """
+        if self._listen_conn is not None:
+            return
+        
+        self._listen_conn = await self.pool.acquire()
+        await self._listen_conn.add_listener(self.NODES_CHANNEL, self._on_nodes_changed)
+        logger.info(f"Listening for {self.NODES_CHANNEL} notifications")
+    
+    def _on_nodes_changed(self, connection, pid, channel, payload):
+        """asyncpg listener callback."""
+        self._nodes_cache.clear()
+    
+    def _get_cached_nodes(self, key: Tuple[Optional[str], str]) -> Optional[list]:
+        """Return cached rows for key if listening and still fresh."""
+        if self._listen_conn is None:
+            return None
+        
+        entry = self._nodes_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.nodes_cache_ttl:
+            return None
+        return entry[1]
+    
+    def _store_cached_nodes(self, key: Tuple[Optional[str], str], rows: list):
+        """Remember rows for key if listening."""
+        if self._listen_conn is not None:
+            self._nodes_cache[key] = (time.monotonic(), rows)
+    
     async def disconnect(self):
         """Close connection pool."""
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.remove_listener(self.NODES_CHANNEL, self._on_nodes_changed)
+                await self.pool.release(self._listen_conn)
+            except Exception as e:
+                logger.warning(f"Error releasing listener connection: {e}")
+            self._listen_conn = None
+            self._nodes_cache.clear()
+        
         if self.pool:
             await self.pool.close()
+            self.pool = None
             logger.info("Database connection pool closed")
     
+    async def __aenter__(self) -> "Database":
+        """Connect on entry to ``async with``."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Disconnect on exit, including early returns and errors."""
+        await self.disconnect()
+    
     async def initialize_schema(self):
-        """Create database schema if it doesn't exist."""
+        """
+        Create database schema if it doesn't exist.
+        
+        Runs as a single transaction, with related DDL batched into
+        multi-statement executes to keep round-trips and commits down.
+        
+        Surrogate keys are BIGINT identity columns and session ids are
+        UUIDv7. Tables created by older versions (SERIAL / VARCHAR ids) are
+        left as they are; they keep working, and can be migrated with
+        ALTER TABLE ... ALTER COLUMN id TYPE BIGINT during a maintenance
+        window.
+        """
         async with self.pool.acquire() as conn:
-            # Enable pgvector extension
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-            
-            # Node registry table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS nodes (
-                    id VARCHAR(255) PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    host VARCHAR(255) NOT NULL,
-                    port INTEGER NOT NULL,
-                    roles TEXT[] NOT NULL,
-                    capabilities JSONB NOT NULL DEFAULT '[]',
-                    tags JSONB NOT NULL DEFAULT '{}',
-                    status VARCHAR(50) NOT NULL DEFAULT 'online',
-                    last_seen TIMESTAMP NOT NULL DEFAULT NOW(),
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-                )
-            """)
-            
-            # Create index for node lookups
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_nodes_status 
-                ON nodes(status)
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_nodes_last_seen 
-                ON nodes(last_seen)
-            """)
-            
-            # Corpus table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS corpora (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL UNIQUE,
-                    description TEXT,
-                    owner VARCHAR(255),
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-                )
-            """)
-            
-            # Document table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS documents (
-                    id SERIAL PRIMARY KEY,
-                    corpus_id INTEGER NOT NULL REFERENCES corpora(id) ON DELETE CASCADE,
-                    path TEXT NOT NULL,
-                    title VARCHAR(500),
-                    content_type VARCHAR(100),
-                    metadata JSONB NOT NULL DEFAULT '{}',
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    UNIQUE(corpus_id, path)
+            async with conn.transaction():
+                # Enable pgvector extension
+                await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                
+                # halfvec (FP16 storage) needs pgvector >= 0.7
+                vector_version = await conn.fetchval(
+                    "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
                 )
-            """)
+                embedding_type = "halfvec" if _version_tuple(vector_version) >= (0, 7) else "vector"
+                
+                # Node registry table, with a GIN index for role membership and
+                # a covering (status, last_seen) index so listings can be
+                # answered from the index alone. The trigger notifies listeners
+                # when node membership changes; heartbeats only touch
+                # last_seen, so they don't fire it.
+                await conn.execute("""
+                    CREATE TABLE IF NOT EXISTS nodes (
+                        id VARCHAR(255) PRIMARY KEY,
+                        name VARCHAR(255) NOT NULL,
+                        host VARCHAR(255) NOT NULL,
+                        port INTEGER NOT NULL,
+                        roles TEXT[] NOT NULL,
+                        capabilities JSONB NOT NULL DEFAULT '[]',
+                        tags JSONB NOT NULL DEFAULT '{}',
+                        status VARCHAR(50) NOT NULL DEFAULT 'online',
+                        last_seen TIMESTAMP NOT NULL DEFAULT NOW(),
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+                    );
+                    
+                    DROP INDEX IF EXISTS idx_nodes_status;
+                    DROP INDEX IF EXISTS idx_nodes_last_seen;
+                    
+                    CREATE INDEX IF NOT EXISTS idx_nodes_roles_gin 
+                    ON nodes USING gin(roles);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_nodes_status_recent 
+                    ON nodes(status, last_seen DESC)
+                    INCLUDE (id, name, host, port, roles);
+                    
+                    CREATE OR REPLACE FUNCTION notify_nodes_changed() RETURNS trigger AS $$
+                    BEGIN
+                        PERFORM pg_notify('nodes_changed', '');
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    
+                    DROP TRIGGER IF EXISTS nodes_notify ON nodes;
+                    CREATE TRIGGER nodes_notify
+                    AFTER INSERT OR DELETE OR UPDATE OF name, host, port, roles, capabilities, tags, status
+                    ON nodes
+                    FOR EACH STATEMENT EXECUTE PROCEDURE notify_nodes_changed();
+                """)
+                
+                # Corpus and document tables
+                await conn.execute("""
+                    CREATE TABLE IF NOT EXISTS corpora (
+                        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                        name VARCHAR(255) NOT NULL UNIQUE,
+                        description TEXT,
+                        owner VARCHAR(255),
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS documents (
+                        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                        corpus_id BIGINT NOT NULL REFERENCES corpora(id) ON DELETE CASCADE,
+                        path TEXT NOT NULL,
+                        title VARCHAR(500),
+                        content_type VARCHAR(100),
+                        metadata JSONB NOT NULL DEFAULT '{}',
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        UNIQUE(corpus_id, path)
+                    );
+                    
+                    CREATE INDEX IF NOT EXISTS idx_documents_corpus 
+                    ON documents(corpus_id);
+                """)
+                
+                # Chunk table with embeddings
+                await conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS chunks (
+                        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                        document_id BIGINT NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+                        chunk_index INTEGER NOT NULL,
+                        text TEXT NOT NULL,
+                        embedding {embedding_type}(768),  -- Default for nomic-embed-text
+                        start_time FLOAT,       -- For media files
+                        end_time FLOAT,         -- For media files
+                        metadata JSONB NOT NULL DEFAULT '{{}}',
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        UNIQUE(document_id, chunk_index)
+                    );
+                    
+                    CREATE INDEX IF NOT EXISTS idx_chunks_document 
+                    ON chunks(document_id);
+                """)
+                
+                # Vector similarity search index. HNSW (pgvector >= 0.5) needs no
+                # probes tuning and keeps recall on small tables, so it replaces
+                # the old IVFFlat index; older pgvector keeps IVFFlat. Existing
+                # tables keep their column type, so pick ops to match.
+                column_type = await conn.fetchval("""
+                    SELECT t.typname
+                    FROM pg_attribute a JOIN pg_type t ON t.oid = a.atttypid
+                    WHERE a.attrelid = 'chunks'::regclass AND a.attname = 'embedding'
+                """)
+                if _version_tuple(vector_version) >= (0, 5):
+                    index_def = await conn.fetchval(
+                        "SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_chunks_embedding'"
+                    )
+                    if index_def and "ivfflat" in index_def:
+                        await conn.execute("DROP INDEX idx_chunks_embedding")
+                    
+                    await conn.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_chunks_embedding 
+                        ON chunks USING hnsw (embedding {column_type}_cosine_ops)
+                        WITH (m = 16, ef_construction = 64)
+                    """)
+                else:
+                    await conn.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_chunks_embedding 
+                        ON chunks USING ivfflat (embedding {column_type}_cosine_ops)
+                        WITH (lists = 100)
+                    """)
+                
+                # Session, message and transcription job tables. Session ids
+                # are time-ordered UUIDv7 so the primary key index stays
+                # append-mostly; gen_random_uuid() is built in from PG 13.
+                # Messages and jobs are range-partitioned by month on
+                # created_at, so their indexes track the recent window.
+                await conn.execute("""
+                    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+                        SELECT encode(
+                            set_bit(
+                                set_bit(
+                                    overlay(
+                                        uuid_send(gen_random_uuid())
+                                        PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                                        FROM 1 FOR 6
+                                    ),
+                                    52, 1
+                                ),
+                                53, 1
+                            ),
+                            'hex'
+                        )::uuid
+                    $$ LANGUAGE sql VOLATILE;
+                    
+                    CREATE TABLE IF NOT EXISTS sessions (
+                        id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
+                        user_id VARCHAR(255),
+                        node_id VARCHAR(255),
+                        context JSONB NOT NULL DEFAULT '{}',
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        last_activity TIMESTAMP NOT NULL DEFAULT NOW()
+                    );
+                    
+                    CREATE INDEX IF NOT EXISTS idx_sessions_user 
+                    ON sessions(user_id);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_sessions_last_activity 
+                    ON sessions(last_activity);
+                    
+                    CREATE TABLE IF NOT EXISTS messages (
+                        id BIGSERIAL,  -- identity columns need PG 17 on partitioned tables
+                        session_id UUID NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+                        role VARCHAR(50) NOT NULL,
+                        content TEXT NOT NULL,
+                        metadata JSONB NOT NULL DEFAULT '{}',
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        PRIMARY KEY (id, created_at)
+                    ) PARTITION BY RANGE (created_at);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_messages_session 
+                    ON messages(session_id, created_at);
+                    
+                    CREATE TABLE IF NOT EXISTS transcription_jobs (
+                        id BIGSERIAL,
+                        file_path TEXT NOT NULL,
+                        status VARCHAR(50) NOT NULL DEFAULT 'pending',
+                        priority VARCHAR(50) NOT NULL DEFAULT 'normal',
+                        model VARCHAR(100),
+                        assigned_node VARCHAR(255),
+                        result JSONB,
+                        error TEXT,
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        started_at TIMESTAMP,
+                        completed_at TIMESTAMP,
+                        metadata JSONB NOT NULL DEFAULT '{}',
+                        PRIMARY KEY (id, created_at)
+                    ) PARTITION BY RANGE (created_at);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_transcription_jobs_status 
+                    ON transcription_jobs(status, priority, created_at);
+                """)
+                
+                await self._ensure_partitions(conn)
+                
+                # Service registry and health history tables
+                await conn.execute("""
+                    CREATE TABLE IF NOT EXISTS services (
+                        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                        node_id VARCHAR(255) NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+                        service_type VARCHAR(100) NOT NULL,
+                        service_name VARCHAR(255) NOT NULL,
+                        endpoint TEXT,
+                        port INTEGER,
+                        protocol VARCHAR(50),
+                        capabilities JSONB NOT NULL DEFAULT '{}',
+                        metadata JSONB NOT NULL DEFAULT '{}',
+                        status VARCHAR(50) NOT NULL DEFAULT 'available',
+                        health_status VARCHAR(50) NOT NULL DEFAULT 'healthy',
+                        last_heartbeat TIMESTAMP NOT NULL DEFAULT NOW(),
+                        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        UNIQUE(node_id, service_type, service_name)
+                    );
+                    
+                    CREATE INDEX IF NOT EXISTS idx_services_node 
+                    ON services(node_id);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_services_type 
+                    ON services(service_type, status);
+                    
+                    CREATE INDEX IF NOT EXISTS idx_services_heartbeat 
+                    ON services(last_heartbeat);
+                    
+                    CREATE TABLE IF NOT EXISTS service_health_history (
+                        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                        service_id BIGINT NOT NULL REFERENCES services(id) ON DELETE CASCADE,
+                        health_status VARCHAR(50) NOT NULL,
+                        response_time_ms FLOAT,
+                        error_message TEXT,
+                        checked_at TIMESTAMP NOT NULL DEFAULT NOW()
+                    );
+                    
+                    CREATE INDEX IF NOT EXISTS idx_service_health_service 
+                    ON service_health_history(service_id, checked_at);
+                """)
             
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_documents_corpus 
-                ON documents(corpus_id)
-            """)
-            
-            # Chunk table with embeddings
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS chunks (
-                    id SERIAL PRIMARY KEY,
-                    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
-                    chunk_index INTEGER NOT NULL,
-                    text TEXT NOT NULL,
-                    embedding vector(768),  -- Default for nomic-embed-text
-                    start_time FLOAT,       -- For media files
-                    end_time FLOAT,         -- For media files
-                    metadata JSONB NOT NULL DEFAULT '{}',
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    UNIQUE(document_id, chunk_index)
-                )
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_chunks_document 
-                ON chunks(document_id)
-            """)
-            
-            # Vector similarity search index
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_chunks_embedding 
-                ON chunks USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100)
-            """)
-            
-            # Session table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id VARCHAR(255) PRIMARY KEY,
-                    user_id VARCHAR(255),
-                    node_id VARCHAR(255),
-                    context JSONB NOT NULL DEFAULT '{}',
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    last_activity TIMESTAMP NOT NULL DEFAULT NOW()
-                )
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_sessions_user 
-                ON sessions(user_id)
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_sessions_last_activity 
-                ON sessions(last_activity)
-            """)
-            
-            # Message table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id SERIAL PRIMARY KEY,
-                    session_id VARCHAR(255) NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
-                    role VARCHAR(50) NOT NULL,
-                    content TEXT NOT NULL,
-                    metadata JSONB NOT NULL DEFAULT '{}',
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW()
-                )
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_session 
-                ON messages(session_id, created_at)
-            """)
-            
-            # Transcription jobs table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS transcription_jobs (
-                    id SERIAL PRIMARY KEY,
-                    file_path TEXT NOT NULL,
-                    status VARCHAR(50) NOT NULL DEFAULT 'pending',
-                    priority VARCHAR(50) NOT NULL DEFAULT 'normal',
-                    model VARCHAR(100),
-                    assigned_node VARCHAR(255),
-                    result JSONB,
-                    error TEXT,
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    started_at TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    metadata JSONB NOT NULL DEFAULT '{}'
-                )
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_transcription_jobs_status 
-                ON transcription_jobs(status, priority, created_at)
-            """)
-            
-            # Service registry table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS services (
-                    id SERIAL PRIMARY KEY,
-                    node_id VARCHAR(255) NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
-                    service_type VARCHAR(100) NOT NULL,
-                    service_name VARCHAR(255) NOT NULL,
-                    endpoint TEXT,
-                    port INTEGER,
-                    protocol VARCHAR(50),
-                    capabilities JSONB NOT NULL DEFAULT '{}',
-                    metadata JSONB NOT NULL DEFAULT '{}',
-                    status VARCHAR(50) NOT NULL DEFAULT 'available',
-                    health_status VARCHAR(50) NOT NULL DEFAULT 'healthy',
-                    last_heartbeat TIMESTAMP NOT NULL DEFAULT NOW(),
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    UNIQUE(node_id, service_type, service_name)
-                )
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_services_node 
-                ON services(node_id)
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_services_type 
-                ON services(service_type, status)
-            """)
-            
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_services_heartbeat 
-                ON services(last_heartbeat)
-            """)
-            
-            # Service health history table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS service_health_history (
-                    id SERIAL PRIMARY KEY,
-                    service_id INTEGER NOT NULL REFERENCES services(id) ON DELETE CASCADE,
-                    health_status VARCHAR(50) NOT NULL,
-                    response_time_ms FLOAT,
-                    error_message TEXT,
-                    checked_at TIMESTAMP NOT NULL DEFAULT NOW()
+            logger.info("Database schema initialized")
+    
+    async def ensure_partitions(self, months_ahead: int = 2):
+        """
+        Create monthly partitions for the current and upcoming months.
+        
+        initialize_schema does this already; long-running deployments should
+        re-run it (e.g. `skeleton db init` from cron) so rows don't pile up
+        in the default partition.
+        
+        Args:
+            months_ahead: Number of months past the current one to create
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await self._ensure_partitions(conn, months_ahead)
+    
+    async def _ensure_partitions(self, conn, months_ahead: int = 2):
+        """Create default + monthly partitions for the partitioned tables."""
+        today = date.today()
+        
+        for table in _PARTITIONED_TABLES:
+            # Tables created before partitioning was introduced stay plain
+            is_partitioned = await conn.fetchval("""
+                SELECT EXISTS(
+                    SELECT 1 FROM pg_partitioned_table
+                    WHERE partrelid = to_regclass($1)
                 )
-            """)
+            """, table)
+            if not is_partitioned:
+                continue
             
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_service_health_service 
-                ON service_health_history(service_id, checked_at)
-            """)
+            await conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+            )
             
-            logger.info("Database schema initialized")
+            for offset in range(months_ahead + 1):
+                month = today.month - 1 + offset
+                start = date(today.year + month // 12, month % 12 + 1, 1)
+                month += 1
+                end = date(today.year + month // 12, month % 12 + 1, 1)
+                
+                # A savepoint per partition: creation fails if the default
+                # partition already holds rows for that month
+                try:
+                    async with conn.transaction():
+                        await conn.execute(f"""
+                            CREATE TABLE IF NOT EXISTS {table}_p{start:%Y_%m}
+                            PARTITION OF {table}
+                            FOR VALUES FROM ('{start}') TO ('{end}')
+                        """)
+                except asyncpg.PostgresError as e:
+                    logger.warning(f"Could not create partition {table}_p{start:%Y_%m}: {e}")
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[RegistryConnection]:
+        """
+        Acquire one pooled connection for several statements.
+        
+        The yielded connection has the usual execute/executemany/fetch*
+        methods plus statement(); use it instead of the one-shot helpers
+        below when issuing more than one query in a row.
+        
+        Example:
+            async with db.connection() as conn:
+                await conn.execute(...)
+                await conn.executemany(...)
+        """
+        async with self.pool.acquire() as conn:
+            yield conn
+    
+    async def bulk_insert_chunks(
+        self,
+        rows: Iterable[tuple],
+        columns: Sequence[str] = ("document_id", "chunk_index", "text", "embedding", "metadata")
+    ):
+        """
+        Insert many chunks with binary COPY instead of per-row INSERTs.
+        
+        Embeddings can be lists or numpy arrays; the pgvector codec encodes
+        them straight into the column's binary form.
+        
+        Args:
+            rows: Tuples whose values line up with columns
+            columns: Chunk columns present in each row
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.copy_records_to_table("chunks", records=rows, columns=list(columns))
     
     async def execute(self, query: str, *args):
         """Execute a query."""
@@ -276,63 +614,86 @@ class Database:
 
 async def register_node_in_db(db: Database, node_info: dict):
     """Register or update a node in the database."""
-    await db.execute("""
-        INSERT INTO nodes (id, name, host, port, roles, capabilities, tags, status, last_seen)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
-        ON CONFLICT (id) DO UPDATE SET
-            name = EXCLUDED.name,
-            host = EXCLUDED.host,
-            port = EXCLUDED.port,
-            roles = EXCLUDED.roles,
-            capabilities = EXCLUDED.capabilities,
-            tags = EXCLUDED.tags,
-            status = EXCLUDED.status,
-            last_seen = NOW(),
-            updated_at = NOW()
-    """, 
-        node_info['id'],
-        node_info['name'],
-        node_info['host'],
-        node_info['port'],
-        node_info['roles'],
-        node_info['capabilities'],
-        node_info['tags'],
-        node_info.get('status', 'online')
-    )
+    async with db.pool.acquire() as conn:
+        stmt = await conn.statement("REGISTER_NODE")
+        await stmt.fetchval(
+            node_info['id'],
+            node_info['name'],
+            node_info['host'],
+            node_info['port'],
+            node_info['roles'],
+            node_info['capabilities'],
+            node_info['tags'],
+            node_info.get('status', 'online')
+        )
 
 
 async def get_nodes_from_db(db: Database, role: Optional[str] = None, status: str = 'online'):
-    """Get nodes from database."""
-    if role:
-        rows = await db.fetch("""
-            SELECT * FROM nodes 
-            WHERE status = $1 AND $2 = ANY(roles)
-            ORDER BY last_seen DESC
-        """, status, role)
-    else:
-        rows = await db.fetch("""
-            SELECT * FROM nodes 
-            WHERE status = $1
-            ORDER BY last_seen DESC
-        """, status)
-    
-    return [dict(row) for row in rows]
+    """
+    Get nodes from database.
+    
+    Returns asyncpg Records, which support node['host'] / node.get('tags')
+    access by column name; call dict(node) only where a real dict is needed.
+    
+    Results are served from db's node cache when it is listening for
+    changes (see Database.listen_for_node_changes).
+    """
+    key = (role, status)
+    rows = db._get_cached_nodes(key)
+    if rows is not None:
+        return rows
+    
+    async with db.pool.acquire() as conn:
+        if role:
+            stmt = await conn.statement("LIST_NODES_BY_ROLE")
+            rows = await stmt.fetch(status, role)
+        else:
+            stmt = await conn.statement("LIST_NODES")
+            rows = await stmt.fetch(status)
+    
+    db._store_cached_nodes(key, rows)
+    return rows
+
+
+async def get_nodes_by_id_from_db(db: Database, node_ids: Optional[List[str]] = None):
+    """
+    Get specific nodes from database in one query.
+    
+    Args:
+        db: Connected database
+        node_ids: IDs to fetch, regardless of status. If None, all online
+            nodes are returned (same as get_nodes_from_db).
+    
+    Returns:
+        List of node Records; IDs that don't exist are simply absent
+    """
+    if node_ids is None:
+        return await get_nodes_from_db(db)
+    
+    async with db.pool.acquire() as conn:
+        stmt = await conn.statement("GET_NODES_BY_ID")
+        return await stmt.fetch(node_ids)
 
 
 async def heartbeat_node_in_db(db: Database, node_id: str):
     """Update node last_seen timestamp."""
-    await db.execute("""
-        UPDATE nodes 
-        SET last_seen = NOW()
-        WHERE id = $1
-    """, node_id)
+    async with db.pool.acquire() as conn:
+        stmt = await conn.statement("HEARTBEAT")
+        await stmt.fetchval(node_id)
+
+
+async def heartbeat_nodes_in_db(db: Database, node_ids: List[str]):
+    """Update last_seen for several nodes with a single UPDATE."""
+    if not node_ids:
+        return
+    
+    async with db.pool.acquire() as conn:
+        stmt = await conn.statement("HEARTBEAT_MANY")
+        await stmt.fetchval(list(node_ids))
 
 
 async def cleanup_stale_nodes_in_db(db: Database, timeout_seconds: int = 300):
     """Mark nodes as offline if they haven't sent heartbeat."""
-    await db.execute("""
-        UPDATE nodes 
-        SET status = 'offline'
-        WHERE status = 'online' 
-        AND last_seen < NOW() - INTERVAL '%s seconds'
-    """ % timeout_seconds)
+    async with db.pool.acquire() as conn:
+        stmt = await conn.statement("CLEANUP_STALE")
+        await stmt.fetchval(int(timeout_seconds))
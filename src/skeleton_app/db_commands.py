@@ -4,19 +4,26 @@ import asyncio
 import logging
 
 import click
-from rich.console import Console
 
-from skeleton_app.config import EnvSettings
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from skeleton_app.console import console
+from skeleton_app.config import get_env_settings
 from skeleton_app.database import Database
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 
 @click.group()
 def db():
     """Database management commands."""
-    pass
+    # Faster event loop for the asyncpg round-trips below, where available
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @db.command()
@@ -28,7 +35,7 @@ def init(url: str):
 
 async def init_database(url: str = None):
     """Initialize the database schema."""
-    env = EnvSettings()
+    env = get_env_settings()
     db_url = url or env.database_url
     
     console.print(f"[cyan]Connecting to database...[/cyan]")
@@ -67,7 +74,7 @@ def check(url: str):
 
 async def check_database(url: str = None):
     """Check database connection and list tables."""
-    env = EnvSettings()
+    env = get_env_settings()
     db_url = url or env.database_url
     
     console.print(f"[cyan]Connecting to database...[/cyan]")
@@ -120,7 +127,7 @@ def nodes(url: str):
 
 async def list_nodes(url: str = None):
     """List all nodes in the registry."""
-    env = EnvSettings()
+    env = get_env_settings()
     db_url = url or env.database_url
     
     try:
@@ -4,5 +4,13 @@ GUI module for skeleton-app desktop application.
 
 __all__ = ["MainWindow", "main"]
 
-from skeleton_app.gui.main_window import MainWindow
 from skeleton_app.gui.app import main
+
+
+def __getattr__(name):
+    # MainWindow pulls in every widget plus JACK; import it on first use so
+    # the GUI entry point can load it behind the splash screen
+    if name == "MainWindow":
+        from skeleton_app.gui.main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,20 +3,55 @@
 Main GUI application entry point.
 """
 
+import importlib
+import logging
+import os
 import sys
+import threading
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QSplashScreen
+from PySide6.QtCore import Qt, QObject, Signal
+from PySide6.QtGui import QColor, QGuiApplication, QPixmap
 
-from skeleton_app.gui.main_window import MainWindow
 from skeleton_app.config import Config
 
+logger = logging.getLogger(__name__)
+
+# Imported behind the splash screen: the main window pulls in every widget,
+# JACK and Qt multimedia
+_MAIN_WINDOW_MODULE = "skeleton_app.gui.main_window"
+
+
+class _Preloader(QObject):
+    """Imports the main window module off the GUI thread."""
+    
+    done = Signal()
+    
+    def run(self):
+        try:
+            importlib.import_module(_MAIN_WINDOW_MODULE)
+        except Exception as e:
+            # Re-raised by the import on the GUI thread
+            logger.debug(f"Background import failed: {e}")
+        finally:
+            self.done.emit()
+
+
+def _splash_pixmap() -> QPixmap:
+    """Plain splash background (the app ships no image resources)."""
+    pixmap = QPixmap(480, 160)
+    pixmap.fill(QColor(30, 30, 30))
+    return pixmap
+
 
 def main():
     """Run the skeleton-app GUI."""
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
+    # High DPI scaling is on by default in Qt 6; the environment variable is
+    # the remaining switch, and the rounding policy must be set before the
+    # application object exists
+    os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
@@ -25,6 +60,11 @@ def main():
     app.setOrganizationName("SkeletonCrew")
     app.setOrganizationDomain("skeleton-crew.local")
     
+    splash = QSplashScreen(_splash_pixmap())
+    splash.show()
+    splash.showMessage("Skeleton Crew - loading...", Qt.AlignCenter, Qt.white)
+    app.processEvents()
+    
     # Load configuration
     config_path = Path("config.yaml")
     if config_path.exists():
@@ -32,9 +72,26 @@ def main():
     else:
         config = Config()
     
-    # Create and show main window
-    window = MainWindow(config, config_path)
-    window.show()
+    windows = []
+    
+    def show_main_window():
+        """Create and show main window (GUI thread, once imports are done)."""
+        try:
+            from skeleton_app.gui.main_window import MainWindow
+            window = MainWindow(config, config_path)
+        except Exception:
+            logger.exception("Failed to create main window")
+            splash.close()
+            app.exit(1)
+            return
+        window.show()
+        splash.finish(window)
+        windows.append(window)
+    
+    # Import the heavy GUI modules while the splash is up
+    preloader = _Preloader()
+    preloader.done.connect(show_main_window)
+    threading.Thread(target=preloader.run, name="gui-preload", daemon=True).start()
     
     sys.exit(app.exec())
 
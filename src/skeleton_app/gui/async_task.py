@@ -2,20 +2,76 @@
 Utilities for running asyncio code in Qt applications.
 
 Provides async/await integration for Qt GUI code without requiring qasync.
+All coroutines run on one long-lived asyncio loop hosted in a background
+thread; results come back to the GUI thread through Qt's queued signals.
 """
 
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Optional, Set
 
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import Signal, QObject
 
 logger = logging.getLogger(__name__)
 
 
+class _AsyncRuntime:
+    """One asyncio event loop running forever in a daemon thread."""
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="asyncio-runtime", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+    
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+    
+    def stop(self, timeout: float = 1.0):
+        """Stop the loop and wait for its thread to exit."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
+_runtime: Optional[_AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = _AsyncRuntime()
+        return _runtime.loop
+
+
+def stop_async_loop(timeout: float = 1.0):
+    """Stop the shared background event loop, if it was started."""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None:
+        runtime.stop(timeout)
+
+
+# Tasks in flight, so callers may drop their reference without the
+# QObject being collected before it emits
+_pending_tasks: Set["AsyncTask"] = set()
+
+
 class AsyncTask(QObject):
     """
-    Run an async coroutine in a separate thread and emit results via Qt signals.
+    Run an async coroutine on the shared loop and emit results via Qt signals.
     
     Usage:
         task = AsyncTask(some_async_function(args))
@@ -27,44 +83,42 @@ class AsyncTask(QObject):
     # Signals
     finished = Signal(object)  # Emitted with result when task completes
     error = Signal(Exception)  # Emitted with exception if task fails
+    _done = Signal()  # Internal: release after finished/error are delivered
     
     def __init__(self, coro: Coroutine):
         super().__init__()
         self.coro = coro
-        self.thread = None
+        self.future: Optional[Future] = None
+        self._done.connect(self._release)
     
     def start(self):
-        """Start the async task in a background thread."""
-        self.thread = QThread()
-        self.moveToThread(self.thread)
-        
-        self.thread.started.connect(self._run_async)
-        self.thread.finished.connect(self.thread.deleteLater)
-        
-        self.thread.start()
+        """Schedule the coroutine on the shared background loop."""
+        _pending_tasks.add(self)
+        self.future = asyncio.run_coroutine_threadsafe(self.coro, get_async_loop())
+        self.future.add_done_callback(self._on_done)
     
-    def _run_async(self):
-        """Run the async coroutine in this thread."""
+    def _on_done(self, future: Future):
+        """Emit the outcome; runs on the loop thread, delivered queued to the GUI."""
         try:
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(self.coro)
-                self.finished.emit(result)
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.error(f"Async task error: {e}")
-            self.error.emit(e)
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                logger.error("Async task error: %s", exc, exc_info=exc)
+                self.error.emit(exc)
+            else:
+                self.finished.emit(future.result())
         finally:
-            self.thread.quit()
+            self._done.emit()
+    
+    def _release(self):
+        """Drop the in-flight reference; runs on the GUI thread after the result."""
+        _pending_tasks.discard(self)
 
 
 def run_async(coro: Coroutine, on_finished: Optional[Callable] = None, on_error: Optional[Callable] = None) -> AsyncTask:
     """
-    Run an async coroutine in a background thread.
+    Run an async coroutine on the shared background loop.
     
     Args:
         coro: The coroutine to run
@@ -2,21 +2,23 @@
 Main application window for skeleton-app.
 """
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QStatusBar, QMenuBar, QMenu, QToolBar,
+    QTabWidget, QTabBar, QStatusBar, QMenuBar, QMenu, QToolBar,
     QLabel, QPushButton, QMessageBox, QDockWidget
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QAction, QIcon, QKeySequence
 
 from skeleton_app.config import Config
 from skeleton_app.database import Database
 from skeleton_app.service_discovery import ServiceDiscovery
+from skeleton_app.gui.async_task import get_async_loop, run_async, stop_async_loop
 from skeleton_app.gui.discovery_bridge import ServiceDiscoveryBridge
 from skeleton_app.gui.widgets.transport_panel import TransportPanel
 from skeleton_app.gui.widgets.cluster_panel import ClusterPanel
@@ -31,6 +33,14 @@ from skeleton_app.audio.transport_services import TransportAgentService, Transpo
 from skeleton_app.providers import get_tool_registry, register_builtin_tools
 
 logger = logging.getLogger(__name__)
+
+# Key sequences are parsed once at import, not per action. Standard keys stay
+# as enums: resolving them needs the platform theme, i.e. a QGuiApplication.
+_KS_QUIT = QKeySequence.StandardKey.Quit
+_KS_CONNECT_JACK = QKeySequence("Ctrl+J")
+_KS_SETTINGS = QKeySequence("Ctrl+,")
+
+
 class MainWindow(QMainWindow):
     """
     Main application window.
@@ -44,6 +54,10 @@ class MainWindow(QMainWindow):
     
     # Signals
     jack_status_changed = Signal(bool)  # Connected/disconnected
+    jack_xrun = Signal(int)  # Total xrun count since connecting
+    _jack_shutdown = Signal(str)  # Internal: JACK server went away (reason)
+    
+    SHUTDOWN_TIMEOUT = 2.0  # Seconds to wait for async shutdown on close
     service_discovery_ready = Signal()  # Service discovery initialized
     
     def __init__(self, config: Config, config_path: Optional[Path] = None, parent: Optional[QWidget] = None):
@@ -80,64 +94,55 @@ class MainWindow(QMainWindow):
         self._create_status_bar()
         
         # Initialize JACK connection
+        self._jack_connected = False
+        self._jack_shutdown.connect(self._on_jack_shutdown)
         self._init_jack()
         
         # Initialize service discovery (async)
         self._init_service_discovery()
         
-        # Status update timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_status)
-        self.status_timer.start(1000)  # Update every second
+        # Transport status is pushed by the transport panel; this slow timer
+        # only catches a JACK client that died without a shutdown callback
+        self.jack_watchdog = QTimer(self)
+        self.jack_watchdog.timeout.connect(self._check_jack_alive)
+        self.jack_watchdog.start(5000)
         
         # Restore window geometry
         self._restore_geometry()
     
+    def _mk_action(self, text: str, shortcut: Optional[Union[QKeySequence, QKeySequence.StandardKey]] = None, slot=None,
+                   checkable: bool = False, checked: bool = False, enabled: bool = True) -> QAction:
+        """Build a QAction with its shortcut, slot and check state in one place."""
+        action = QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        if checkable:
+            action.setCheckable(True)
+            action.setChecked(checked)
+        if not enabled:
+            action.setEnabled(False)
+        if slot is not None:
+            action.triggered.connect(slot)
+        return action
+    
     def _create_actions(self):
         """Create menu and toolbar actions."""
         # File menu actions
-        self.quit_action = QAction("&Quit", self)
-        self.quit_action.setShortcut(QKeySequence.Quit)
-        self.quit_action.triggered.connect(self.close)
+        self.quit_action = self._mk_action("&Quit", _KS_QUIT, self.close)
         
         # JACK menu actions
-        self.connect_jack_action = QAction("&Connect to JACK", self)
-        self.connect_jack_action.setShortcut("Ctrl+J")
-        self.connect_jack_action.triggered.connect(self._connect_jack)
-        
-        self.disconnect_jack_action = QAction("&Disconnect from JACK", self)
-        self.disconnect_jack_action.triggered.connect(self._disconnect_jack)
-        self.disconnect_jack_action.setEnabled(False)
+        self.connect_jack_action = self._mk_action("&Connect to JACK", _KS_CONNECT_JACK, self._connect_jack)
+        self.disconnect_jack_action = self._mk_action("&Disconnect from JACK", slot=self._disconnect_jack, enabled=False)
         
         # View menu actions
-        self.view_patchbay_action = QAction("&Patchbay", self)
-        self.view_patchbay_action.setCheckable(True)
-        self.view_patchbay_action.setChecked(True)
-        
-        self.view_cluster_action = QAction("&Cluster Status", self)
-        self.view_cluster_action.setCheckable(True)
-        self.view_cluster_action.setChecked(True)
-        
-        self.view_video_action = QAction("&Video Players", self)
-        self.view_video_action.setCheckable(True)
-        self.view_video_action.setChecked(False)
-        
-        self.view_transcode_action = QAction("&Transcode Videos", self)
-        self.view_transcode_action.setCheckable(True)
-        self.view_transcode_action.setChecked(False)
-        
-        self.view_transport_action = QAction("Transport &Coordination", self)
-        self.view_transport_action.setCheckable(True)
-        self.view_transport_action.setChecked(True)
+        # (dock toggles come from QDockWidget.toggleViewAction in _create_dock_widgets)
+        self.view_patchbay_action = self._mk_action("&Patchbay", checkable=True, checked=True)
         
         # Tools menu actions
-        self.settings_action = QAction("&Settings...", self)
-        self.settings_action.setShortcut("Ctrl+,")
-        self.settings_action.triggered.connect(self._show_settings)
+        self.settings_action = self._mk_action("&Settings...", _KS_SETTINGS, self._show_settings)
         
         # Help menu actions
-        self.about_action = QAction("&About", self)
-        self.about_action.triggered.connect(self._show_about)
+        self.about_action = self._mk_action("&About", slot=self._show_about)
     
     def _create_menus(self):
         """Create menu bar."""
@@ -153,10 +158,8 @@ class MainWindow(QMainWindow):
         jack_menu.addAction(self.disconnect_jack_action)
         
         # View menu
-        view_menu = menubar.addMenu("&View")
-        view_menu.addAction(self.view_patchbay_action)
-        view_menu.addAction(self.view_cluster_action)
-        view_menu.addAction(self.view_transport_action)
+        self.view_menu = menubar.addMenu("&View")
+        self.view_menu.addAction(self.view_patchbay_action)
         
         # Tools menu
         tools_menu = menubar.addMenu("&Tools")
@@ -182,6 +185,7 @@ class MainWindow(QMainWindow):
         
         # Transport panel (always visible at top)
         self.transport_panel = TransportPanel(self)
+        self.transport_panel.transport_state_changed.connect(self._on_transport_state_changed)
         layout.addWidget(self.transport_panel)
         
         # Tab widget for main content
@@ -193,31 +197,85 @@ class MainWindow(QMainWindow):
         self.node_canvas = NodeCanvasWidget(parent=self)
         self.tabs.addTab(self.node_canvas, "Local Node Canvas")
         
-        # Patchbay tab (list view - LOCAL)
-        self.patchbay = PatchbayWidget(self)
-        self.tabs.addTab(self.patchbay, "Local Patchbay")
+        # Patchbay tab (list view - LOCAL); the canvas is the tab shown at
+        # startup, so only this one is built lazily (see the patchbay property)
+        self._patchbay: Optional[PatchbayWidget] = None
+        self._patchbay_page = self._create_lazy_page()
+        self.tabs.addTab(self._patchbay_page, "Local Patchbay")
         
-        # Remote Node Canvas tab (visual graph - REMOTE)
+        # Remote tabs start hidden, so their pages are empty until first shown
+        # (see the remote_canvas/remote_jack properties)
         self.tool_registry = get_tool_registry()
         register_builtin_tools(self.tool_registry)
-        self.remote_canvas = RemoteNodeCanvas(parent=self, tool_registry=self.tool_registry, config=self.config)
-        self.tabs.addTab(self.remote_canvas, "Remote Node Canvas")
+        self._remote_canvas: Optional[RemoteNodeCanvas] = None
+        self._remote_jack: Optional[RemoteJackPanel] = None
+        
+        # Remote Node Canvas tab (visual graph - REMOTE)
+        self._remote_canvas_page = self._create_lazy_page()
+        self.tabs.addTab(self._remote_canvas_page, "Remote Node Canvas")
         
         # Remote JACK Panel tab (list view - REMOTE)
-        self.remote_jack = RemoteJackPanel(parent=self, tool_registry=self.tool_registry, config=self.config)
-        self.tabs.addTab(self.remote_jack, "Remote Patchbay")
+        self._remote_jack_page = self._create_lazy_page()
+        self.tabs.addTab(self._remote_jack_page, "Remote Patchbay")
+        
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
-        # Prevent closing of system tabs
-        from PySide6.QtWidgets import QTabBar
-        self.tabs.tabBar().setTabButton(0, QTabBar.ButtonPosition.RightSide, None)
-        self.tabs.tabBar().setTabButton(1, QTabBar.ButtonPosition.RightSide, None)
-        self.tabs.tabBar().setTabButton(2, QTabBar.ButtonPosition.RightSide, None)
-        self.tabs.tabBar().setTabButton(3, QTabBar.ButtonPosition.RightSide, None)
+        # Prevent closing of system tabs (tracked by page, not index, so
+        # tabs added or moved later can't shift them)
+        self._system_tab_widgets = {
+            self.node_canvas, self._patchbay_page, self._remote_canvas_page, self._remote_jack_page
+        }
+        for index in range(self.tabs.count()):
+            self.tabs.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
         
         layout.addWidget(self.tabs)
         
         self.setCentralWidget(central)
     
+    def _create_lazy_page(self) -> QWidget:
+        """Create an empty tab page that a panel is added to on first show."""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        return page
+    
+    @property
+    def patchbay(self) -> PatchbayWidget:
+        """Local patchbay, built on first use."""
+        if self._patchbay is None:
+            self._patchbay = PatchbayWidget(self)
+            self._patchbay_page.layout().addWidget(self._patchbay)
+            if self._jack_connected:
+                self._patchbay.set_jack_manager(self.jack_manager)
+        return self._patchbay
+    
+    @property
+    def remote_canvas(self) -> RemoteNodeCanvas:
+        """Remote node canvas, built on first use."""
+        if self._remote_canvas is None:
+            self._remote_canvas = RemoteNodeCanvas(parent=self, tool_registry=self.tool_registry, config=self.config)
+            self._remote_canvas_page.layout().addWidget(self._remote_canvas)
+        return self._remote_canvas
+    
+    @property
+    def remote_jack(self) -> RemoteJackPanel:
+        """Remote JACK panel, built on first use."""
+        if self._remote_jack is None:
+            self._remote_jack = RemoteJackPanel(parent=self, tool_registry=self.tool_registry, config=self.config)
+            self._remote_jack_page.layout().addWidget(self._remote_jack)
+        return self._remote_jack
+    
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Build a lazy tab the first time it is shown."""
+        page = self.tabs.widget(index)
+        if page is self._patchbay_page:
+            self.patchbay
+        elif page is self._remote_canvas_page:
+            self.remote_canvas
+        elif page is self._remote_jack_page:
+            self.remote_jack
+    
     def _create_dock_widgets(self):
         """Create dock widgets."""
         # Cluster status dock
@@ -229,17 +287,22 @@ class MainWindow(QMainWindow):
         # Connect cluster panel node selection to remote JACK panel
         self.cluster_panel.node_selected.connect(self._on_cluster_node_selected)
         
-        # Transport coordination dock
+        # Transport coordination dock; services and widgets are built the
+        # first time the dock is shown, so no OSC ports are bound until then
         self.transport_dock = QDockWidget("Transport Coordination", self)
-        self._init_transport_panel()
+        self.transport_dock.setWidget(QLabel("Loading…"))
+        self.transport_dock.visibilityChanged.connect(self._on_transport_dock_visibility_changed)
         self.addDockWidget(Qt.RightDockWidgetArea, self.transport_dock)
         
-        # Connect view actions
-        self.view_cluster_action.toggled.connect(self.cluster_dock.setVisible)
-        self.cluster_dock.visibilityChanged.connect(self.view_cluster_action.setChecked)
-        self.view_transport_action.toggled.connect(self.transport_dock.setVisible)
-        self.transport_dock.visibilityChanged.connect(self.view_transport_action.setChecked)
+        # View menu toggles, kept in sync with the docks by Qt itself
+        self.view_cluster_action = self.cluster_dock.toggleViewAction()
+        self.view_cluster_action.setText("&Cluster Status")
+        self.view_transport_action = self.transport_dock.toggleViewAction()
+        self.view_transport_action.setText("Transport &Coordination")
+        self.view_menu.addAction(self.view_cluster_action)
+        self.view_menu.addAction(self.view_transport_action)
     
+    @Slot(str, str)
     def _on_cluster_node_selected(self, node_id: str, node_name: str):
         """Handle node selection from cluster panel."""
         # Update remote panels with available nodes and select this one
@@ -247,12 +310,13 @@ class MainWindow(QMainWindow):
             self.remote_jack.set_available_nodes(self.cluster_panel.current_nodes)
             self.remote_canvas.set_available_nodes(self.cluster_panel.current_nodes)
             # Switch to Remote Node Canvas tab to show the visual graph
-            self.tabs.setCurrentWidget(self.remote_canvas)
+            self.tabs.setCurrentWidget(self._remote_canvas_page)
     
+    @Slot(int)
     def _on_tab_close_requested(self, index: int):
         """Handle tab close request."""
-        # Don't allow closing system tabs (first 4: Local Canvas, Local Patchbay, Remote Canvas, Remote Patchbay)
-        if index < 4:
+        # Don't allow closing system tabs (Local Canvas, Local Patchbay, Remote Canvas, Remote Patchbay)
+        if self.tabs.widget(index) in self._system_tab_widgets:
             return
         
         # For other tabs, just remove
@@ -271,6 +335,21 @@ class MainWindow(QMainWindow):
         self.transport_status_label = QLabel("Transport: Stopped")
         self.status_bar.addPermanentWidget(self.transport_status_label)
     
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set a status label only when the text differs (setText always relayouts)."""
+        if label.text() != text:
+            label.setText(text)
+    
+    @Slot(bool)
+    def _on_transport_dock_visibility_changed(self, visible: bool):
+        """Build the transport panel the first time its dock is shown."""
+        if visible:
+            self.transport_dock.visibilityChanged.disconnect(self._on_transport_dock_visibility_changed)
+            placeholder = self.transport_dock.widget()
+            self._init_transport_panel()
+            placeholder.deleteLater()
+    
     def _init_transport_panel(self):
         """Initialize transport coordination panel."""
         # Create container widget with tabs for agent and coordinator
@@ -321,8 +400,9 @@ class MainWindow(QMainWindow):
             self._on_jack_connected()
         except Exception as e:
             self.status_bar.showMessage(f"Failed to connect to JACK: {e}", 5000)
-            print(f"JACK connection failed: {e}")
+            logger.warning("JACK connection failed: %s", e)
     
+    @Slot()
     def _connect_jack(self):
         """Connect to JACK server."""
         try:
@@ -339,6 +419,7 @@ class MainWindow(QMainWindow):
                 f"Could not connect to JACK server:\n{e}"
             )
     
+    @Slot()
     def _disconnect_jack(self):
         """Disconnect from JACK server."""
         if self.jack_manager:
@@ -347,100 +428,124 @@ class MainWindow(QMainWindow):
     
     def _on_jack_connected(self):
         """Handle JACK connection."""
-        self.jack_status_label.setText("JACK: Connected")
+        self._jack_connected = True
+        self.jack_manager.on_xrun = self.jack_xrun.emit
+        self.jack_manager.on_shutdown = self._jack_shutdown.emit
+        self._set_label_text(self.jack_status_label, "JACK: Connected")
         self.connect_jack_action.setEnabled(False)
         self.disconnect_jack_action.setEnabled(True)
         self.jack_status_changed.emit(True)
         
         # Update widgets
         self.node_canvas.set_jack_manager(self.jack_manager)
-        self.patchbay.set_jack_manager(self.jack_manager)
+        if self._patchbay is not None:
+            self._patchbay.set_jack_manager(self.jack_manager)
         
         # Update transport panel
         self.transport_panel.set_jack_manager(self.jack_manager)
     
     def _on_jack_disconnected(self):
         """Handle JACK disconnection."""
-        self.jack_status_label.setText("JACK: Disconnected")
+        self._jack_connected = False
+        self._set_label_text(self.jack_status_label, "JACK: Disconnected")
+        self._set_label_text(self.transport_status_label, "Transport: N/A")
         self.connect_jack_action.setEnabled(True)
         self.disconnect_jack_action.setEnabled(False)
         self.jack_status_changed.emit(False)
         
         # Update widgets
         self.node_canvas.set_jack_manager(None)
-        self.patchbay.set_jack_manager(None)
+        if self._patchbay is not None:
+            self._patchbay.set_jack_manager(None)
         self.transport_panel.set_jack_manager(None)
     
-    def _update_status(self):
-        """Update status bar periodically."""
-        if self.jack_manager and self.jack_manager.is_connected():
-            # Update transport status
-            state = self.jack_manager.get_transport_state()
-            self.transport_status_label.setText(f"Transport: {state}")
-        else:
-            self.transport_status_label.setText("Transport: N/A")
+    @Slot(str)
+    def _on_jack_shutdown(self, reason: str):
+        """Handle the JACK server going away underneath us."""
+        self.status_bar.showMessage(f"JACK server shut down: {reason}", 5000)
+        if self.jack_manager:
+            self.jack_manager.disconnect()
+        self._on_jack_disconnected()
+    
+    @Slot()
+    def _check_jack_alive(self):
+        """Watchdog: notice a JACK client that died silently."""
+        if self._jack_connected and not (self.jack_manager and self.jack_manager.is_connected()):
+            self._on_jack_disconnected()
+    
+    @Slot(str)
+    def _on_transport_state_changed(self, state: str):
+        """Update the transport status label."""
+        self._set_label_text(self.transport_status_label, f"Transport: {state}")
     
     def _init_service_discovery(self):
-        """Initialize service discovery asynchronously."""
-        import asyncio
-        import threading
-        
+        """Initialize service discovery asynchronously on the shared loop."""
         logger.info(f"Starting service discovery initialization for {self.config.node.name}")
+        run_async(
+            self._async_init_service_discovery(),
+            on_finished=self._on_service_discovery_started,
+            on_error=self._on_service_discovery_failed
+        )
+    
+    async def _async_init_service_discovery(self):
+        """
+        Connect the database and start service discovery (runs on the shared loop).
+        
+        Errors propagate to _on_service_discovery_failed on the GUI thread.
+        """
+        logger.info("Initializing service discovery...")
+        
+        # Initialize database
+        if self.config.database:
+            logger.info("Connecting to database...")
+            self.database = Database(self.config.database.url)
+            await self.database.connect()
+            await self.database.initialize_schema()
+            logger.info("Database connected")
+        
+        # Initialize service discovery
+        logger.info(f"Creating ServiceDiscovery: {self.config.node.name} @ {self.config.node.host}")
+        self.service_discovery = ServiceDiscovery(
+            node_id=self.config.node.id,
+            node_name=self.config.node.name,
+            node_host=self.config.node.host,
+            database=self.database,
+            heartbeat_interval=10,
+            discovery_bridge=self.discovery_bridge,
+            discovery_backend=self.config.network.discovery.backend
+        )
         
-        def run_async_init():
-            """Run async init in a separate thread with its own event loop."""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def _async_init():
-                try:
-                    logger.info("Initializing service discovery...")
-                    
-                    # Initialize database
-                    if self.config.database:
-                        logger.info("Connecting to database...")
-                        self.database = Database(self.config.database.url)
-                        await self.database.connect()
-                        await self.database.initialize_schema()
-                        logger.info("Database connected")
-                    
-                    # Initialize service discovery
-                    logger.info(f"Creating ServiceDiscovery: {self.config.node.name} @ {self.config.node.host}")
-                    self.service_discovery = ServiceDiscovery(
-                        node_id=self.config.node.id,
-                        node_name=self.config.node.name,
-                        node_host=self.config.node.host,
-                        database=self.database,
-                        heartbeat_interval=10,
-                        discovery_bridge=self.discovery_bridge
-                    )
-                    
-                    logger.info("Starting service discovery...")
-                    await self.service_discovery.start()
-                    logger.info("Service discovery started")
-                    
-                    # Emit signal to update cluster panel
-                    self.service_discovery_ready.emit()
-                    
-                    logger.info(f"Service discovery initialized: {self.config.node.name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error initializing service discovery: {e}", exc_info=True)
-            
+        logger.info("Starting service discovery...")
+        await self.service_discovery.start()
+        logger.info("Service discovery started")
+    
+    @Slot(object)
+    def _on_service_discovery_started(self, _result):
+        """Service discovery is up; let the cluster panel attach to it."""
+        logger.info(f"Service discovery initialized: {self.config.node.name}")
+        self.service_discovery_ready.emit()
+    
+    @Slot(Exception)
+    def _on_service_discovery_failed(self, error: Exception):
+        """Report a failed service discovery start-up."""
+        logger.error("Error initializing service discovery: %s", error)
+        self.status_bar.showMessage(f"Service discovery unavailable: {error}", 10000)
+    
+    async def _async_shutdown(self):
+        """Stop service discovery, then disconnect the database (runs on the shared loop)."""
+        if self.service_discovery:
             try:
-                loop.run_until_complete(_async_init())
-                # Keep loop running for async tasks
-                loop.run_forever()
+                await self.service_discovery.stop()
             except Exception as e:
-                logger.error(f"Service discovery thread error: {e}", exc_info=True)
-            finally:
-                loop.close()
+                logger.debug(f"Error stopping service discovery: {e}")
         
-        # Start in daemon thread
-        thread = threading.Thread(target=run_async_init, daemon=True)
-        thread.start()
-        logger.info("Service discovery thread started")
+        if self.database:
+            try:
+                await self.database.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disconnecting database: {e}")
     
+    @Slot()
     def _set_service_discovery(self):
         """Set service discovery on cluster panel (must be called from main thread)."""
         if self.service_discovery:
@@ -449,16 +554,13 @@ class MainWindow(QMainWindow):
         else:
             logger.warning("Service discovery not available when trying to set on cluster panel")
     
-    def _open_video(self):
-        """Open video file via File menu."""
-        # Delegate to video panel
-        self.video_panel._on_open_video()
-    
+    @Slot()
     def _show_settings(self):
         """Show settings dialog."""
         dialog = SettingsDialog(self.config, self.config_path, self)
         dialog.exec()
     
+    @Slot()
     def _show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -485,27 +587,15 @@ class MainWindow(QMainWindow):
         """Handle window close event."""
         self._save_geometry()
         
-        # Stop service discovery
-        if self.service_discovery:
-            import asyncio
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.service_discovery.stop())
-                loop.close()
-            except Exception as e:
-                logger.debug(f"Error stopping service discovery: {e}")
-        
-        # Disconnect database
-        if self.database:
-            import asyncio
+        # Stop service discovery and the database on the loop that owns them,
+        # bounded so a stuck peer can't hang the window
+        if self.service_discovery or self.database:
+            future = asyncio.run_coroutine_threadsafe(self._async_shutdown(), get_async_loop())
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.database.disconnect())
-                loop.close()
+                future.result(timeout=self.SHUTDOWN_TIMEOUT)
             except Exception as e:
-                logger.debug(f"Error disconnecting database: {e}")
+                logger.warning(f"Async shutdown did not complete: {e}")
+        stop_async_loop()
         
         # Stop transport services
         if self.transport_agent:
@@ -2,17 +2,29 @@
 Cluster status panel widget.
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTreeWidget,
-    QTreeWidgetItem, QPushButton, QHBoxLayout, QGroupBox
+    QTreeWidgetItem, QPushButton, QHBoxLayout, QGroupBox, QToolTip
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QEvent, QObject
 
 from skeleton_app.service_discovery import ServiceDiscovery, ServiceInfo, ServiceType
 
 
+# Resolved once rather than as Qt.<color> lookups per row per refresh
+_COLOR_WHITE = Qt.white
+_COLOR_GRAY = Qt.gray
+_COLOR_GREEN = Qt.green
+_COLOR_YELLOW = Qt.yellow
+_COLOR_RED = Qt.red
+
+# (column, color) foregrounds for node rows
+_ONLINE_NODE_COLORS = ((0, _COLOR_WHITE), (2, _COLOR_GREEN))
+_DISCOVERED_NODE_COLORS = ((0, _COLOR_GRAY), (2, _COLOR_YELLOW))
+
+
 class ClusterPanel(QWidget):
     """
     Displays status of cluster nodes and their services.
@@ -26,6 +38,14 @@ class ClusterPanel(QWidget):
     
     # Signals
     node_selected = Signal(str, str)  # (node_id, node_name)
+    _refresh_requested = Signal()  # Internal: arm the coalescing timer on the GUI thread
+    
+    REFRESH_DELAY_MS = 50  # Coalesce bursts of change notifications
+    
+    # Display strings computed once instead of per row per refresh
+    _TYPE_DISPLAY = {st: st.value.replace('_', ' ').title() for st in ServiceType}
+    _HEALTH_DISPLAY = {"healthy": ("●", _COLOR_GREEN), "degraded": ("◐", _COLOR_YELLOW)}
+    _HEALTH_DISPLAY_DEFAULT = ("○", _COLOR_RED)
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -34,17 +54,36 @@ class ClusterPanel(QWidget):
         self.discovery_bridge = None
         self.current_nodes: List[Dict] = []
         
+        # Tree items kept between refreshes, and what each one last showed
+        self._node_items: Dict[str, QTreeWidgetItem] = {}
+        self._service_items: Dict[Tuple[str, str], QTreeWidgetItem] = {}
+        self._rendered: Dict[object, tuple] = {}
+        self._placeholder: Optional[QTreeWidgetItem] = None
+        self._last_stats_key: Optional[tuple] = None
+        self._last_version: Optional[int] = None  # service_discovery.registry_version last shown
+        self._shown = False  # Tracks show/hide events, which also fire on minimize/restore
+        
         self._setup_ui()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_status)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        # Change notifications mark the tree dirty and arm one short refresh;
+        # there is no periodic refresh, the Refresh button is the fallback
+        self._dirty = True  # Nothing rendered yet
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._update_status_if_dirty)
+        self._refresh_requested.connect(self._refresh_timer.start, Qt.QueuedConnection)
     
     def set_service_discovery(self, service_discovery: Optional[ServiceDiscovery], discovery_bridge=None):
-        """Set the service discovery instance and connect to bridge signals."""
+        """
+        Set the service discovery instance and connect to bridge signals.
+        
+        Node and service changes arrive through the discovery callback; the
+        bridge is only used for the initial services_loaded notification.
+        """
         self.service_discovery = service_discovery
         self.discovery_bridge = discovery_bridge
+        self._last_version = None
         
         if service_discovery:
             # Add callback for service changes (async updates)
@@ -52,34 +91,51 @@ class ClusterPanel(QWidget):
         
         # Connect bridge signals if available (Qt signals from async thread)
         if discovery_bridge:
-            discovery_bridge.node_discovered.connect(self._on_node_discovered)
-            discovery_bridge.service_registered.connect(self._on_service_registered)
-            discovery_bridge.service_updated.connect(self._on_service_updated)
-            discovery_bridge.service_unregistered.connect(self._on_service_unregistered)
-            discovery_bridge.services_loaded.connect(self._update_status)
+            discovery_bridge.services_loaded.connect(self._mark_dirty)
         
         self._update_status()
     
-    def _on_service_change(self, action: str, service: ServiceInfo):
-        """Handle service change notifications from async thread."""
-        # Just trigger update - the signals will also do this
-        pass
+    def _on_service_change(self, action: str, service):
+        """Handle node and service change notifications from async thread."""
+        self._mark_dirty()
     
-    def _on_node_discovered(self, node_id: str, node_name: str, host: str):
-        """Handle node discovery signal from bridge."""
-        self._update_status()
+    @Slot()
+    def _mark_dirty(self):
+        """
+        Schedule one coalesced refresh (safe from any thread).
+        
+        Only the first change since the last refresh posts to the GUI thread;
+        _update_status clears the flag before it reads the registry, so later
+        changes are either picked up by that read or post again.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self._refresh_requested.emit()
     
-    def _on_service_registered(self, node_id: str, service_name: str, service_type: str, action: str):
-        """Handle service registration signal from bridge."""
+    @Slot()
+    def _on_refresh_clicked(self):
+        """Re-read the registry even if its version has not moved."""
+        self._last_version = None
         self._update_status()
     
-    def _on_service_updated(self, node_id: str, service_name: str, service_type: str, action: str):
-        """Handle service update signal from bridge."""
-        self._update_status()
+    @Slot()
+    def _update_status_if_dirty(self):
+        """Refresh the tree if anything changed since the last refresh."""
+        # While hidden the flag stays set and showEvent catches up
+        if self._dirty and self._shown:
+            self._update_status()
     
-    def _on_service_unregistered(self, node_id: str, service_name: str):
-        """Handle service unregistration signal from bridge."""
-        self._update_status()
+    def showEvent(self, event):
+        """Catch up on changes that arrived while hidden."""
+        super().showEvent(event)
+        self._shown = True
+        if self._dirty:
+            self._update_status()
+    
+    def hideEvent(self, event):
+        """Defer refreshes while hidden or minimized."""
+        super().hideEvent(event)
+        self._shown = False
     
     def _setup_ui(self):
         """Setup the UI."""
@@ -108,7 +164,7 @@ class ClusterPanel(QWidget):
         # Refresh button
         button_layout = QHBoxLayout()
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.clicked.connect(self._update_status)
+        self.refresh_button.clicked.connect(self._on_refresh_clicked)
         button_layout.addWidget(self.refresh_button)
         button_layout.addStretch()
         layout.addLayout(button_layout)
@@ -118,7 +174,34 @@ class ClusterPanel(QWidget):
         
         # Connect item selection
         self.service_tree.itemClicked.connect(self._on_tree_item_clicked)
+        self.service_tree.viewport().installEventFilter(self)
+    
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Show service tooltips, formatting them only when one is requested."""
+        if event.type() == QEvent.ToolTip and watched is self.service_tree.viewport():
+            pos = event.pos()
+            item = self.service_tree.itemAt(pos)
+            service = item.data(0, Qt.UserRole) if item is not None else None
+            if isinstance(service, ServiceInfo):
+                if self.service_tree.columnAt(pos.x()) == 0:
+                    QToolTip.showText(event.globalPos(), self._service_tooltip(service), self.service_tree.viewport())
+                else:
+                    QToolTip.hideText()
+                return True
+        return super().eventFilter(watched, event)
     
+    def _service_tooltip(self, service: ServiceInfo) -> str:
+        """Format the details tooltip for a service row."""
+        return "\n".join(filter(None, (
+            f"Type: {self._TYPE_DISPLAY[service.service_type]}",
+            f"Status: {service.status.value}",
+            f"Health: {service.health_status.value}",
+            service.endpoint and f"Endpoint: {service.endpoint}",
+            service.port and f"Port: {service.port}",
+            service.capabilities and f"Capabilities: {', '.join(map(str, service.capabilities))}",
+        )))
+    
+    @Slot(QTreeWidgetItem, int)
     def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle tree item click - emit node_selected if clicking a node."""
         # Check if this is a top-level node item (has parent = None)
@@ -131,130 +214,233 @@ class ClusterPanel(QWidget):
                 if node_id:
                     self.node_selected.emit(node_id, node_name)
     
+    @Slot()
     def _update_status(self):
-        """Update cluster service status."""
+        """
+        Update cluster service status.
+        
+        The tree is diffed against the current snapshot: items are kept per
+        node and per service, and only added, removed or re-rendered when
+        something about them changed. Nothing is read at all while the
+        discovery registry_version is the one already shown.
+        """
+        self._dirty = False
         if not self.service_discovery:
-            self.service_tree.clear()
-            self.stats_label.setText("Service discovery not initialized.\nWaiting for initialization...")
+            self._clear_tree()
+            self._set_stats_text("Service discovery not initialized.\nWaiting for initialization...")
             
             # Show placeholder
-            placeholder = QTreeWidgetItem(["Initializing service discovery...", "", ""])
-            placeholder.setForeground(0, Qt.yellow)
-            self.service_tree.addTopLevelItem(placeholder)
+            self._set_placeholder("Initializing service discovery...", _COLOR_YELLOW)
             return
         
-        self.service_tree.clear()
+        # Read the version first: a change racing with the reads below bumps
+        # it again afterwards, so the next refresh cannot skip that change
+        version = self.service_discovery.registry_version
+        if version == self._last_version:
+            return
         
         # Get all known nodes (including those discovered via UDP)
         try:
             known_nodes = self.service_discovery.get_known_nodes()
             self.current_nodes = known_nodes
         except Exception as e:
+            self._last_version = None
+            self._last_stats_key = None
             self.stats_label.setText(f"Error getting nodes: {e}")
             return
         
         # Get all services grouped by node
         all_services = self.service_discovery.get_all_services()
+        self._last_version = version
+        node_names = {node['node_id']: node['node_name'] for node in known_nodes}
         
         total_services = 0
         healthy_services = 0
         service_types_count: Dict[ServiceType, int] = {}
+        seen_nodes = set()
+        seen_services = set()
+        new_node_items: List[QTreeWidgetItem] = []
+        new_children: Dict[QTreeWidgetItem, List[QTreeWidgetItem]] = {}
         
-        # First, add nodes with services
-        nodes_with_services = set()
-        for node_id, services in all_services.items():
-            if not services:
-                continue
-            
-            nodes_with_services.add(node_id)
+        self.service_tree.setUpdatesEnabled(False)
+        self.service_tree.blockSignals(True)
+        try:
+            # First, nodes with services
+            for node_id, services in all_services.items():
+                if not services:
+                    continue
+                
+                seen_nodes.add(node_id)
+                node_name = node_names.get(node_id, node_id)
+                node_item = self._get_node_item(node_id, new_node_items)
+                self._render_item(
+                    node_item, node_id,
+                    (f"{node_name} ({node_id[:8]}...)", "", "Online"),
+                    _ONLINE_NODE_COLORS,
+                    ""
+                )
+                
+                # Services under node
+                for service in services:
+                    total_services += 1
+                    
+                    # Count by type
+                    service_types_count[service.service_type] = service_types_count.get(service.service_type, 0) + 1
+                    
+                    # Status indicator
+                    health = service.health_status.value
+                    status_icon, status_color = self._HEALTH_DISPLAY.get(health, self._HEALTH_DISPLAY_DEFAULT)
+                    if health == "healthy":
+                        healthy_services += 1
+                    
+                    service_type_display = self._TYPE_DISPLAY[service.service_type]
+                    
+                    key = (node_id, service.service_name)
+                    seen_services.add(key)
+                    service_item = self._service_items.get(key)
+                    if service_item is None:
+                        service_item = QTreeWidgetItem()
+                        new_children.setdefault(node_item, []).append(service_item)
+                        self._service_items[key] = service_item
+                    self._render_item(
+                        service_item, key,
+                        (
+                            f"  {service.service_name}",
+                            service_type_display,
+                            f"{status_icon} {service.status.value.capitalize()}"
+                        ),
+                        ((2, status_color),),
+                        ""
+                    )
+                    # Tooltip is formatted from this on hover (see eventFilter)
+                    if service_item.data(0, Qt.UserRole) is not service:
+                        service_item.setData(0, Qt.UserRole, service)
             
-            # Find node name from known_nodes
-            node_name = node_id
+            # Discovered nodes without services yet
             for node in known_nodes:
-                if node['node_id'] == node_id:
-                    node_name = node['node_name']
-                    break
+                node_id = node['node_id']
+                if node_id in seen_nodes or node_id == self.service_discovery.node_id:
+                    continue
+                
+                seen_nodes.add(node_id)
+                self._render_item(
+                    self._get_node_item(node_id, new_node_items), node_id,
+                    (f"{node['node_name']} ({node_id[:8]}...)", "", "Discovered (no services)"),
+                    _DISCOVERED_NODE_COLORS,
+                    f"Node: {node['node_name']}\nHost: {node['host']}\nPort: {node['port']}"
+                )
             
-            # Create node item
-            node_item = QTreeWidgetItem([f"{node_name} ({node_id[:8]}...)", "", "Online"])
-            node_item.setData(0, Qt.UserRole, node_id)  # Store full node_id for selection
-            node_item.setExpanded(True)
-            node_item.setForeground(0, Qt.white)
-            node_item.setForeground(2, Qt.green)
+            # Attach everything created above with one call per parent
+            for node_item, children in new_children.items():
+                node_item.addChildren(children)
+            self._insert_node_items(new_node_items)
             
-            # Add services under node
-            for service in services:
-                total_services += 1
-                
-                # Count by type
-                service_types_count[service.service_type] = service_types_count.get(service.service_type, 0) + 1
-                
-                # Status indicator
-                if service.health_status.value == "healthy":
-                    status_icon = "●"
-                    status_color = Qt.green
-                    healthy_services += 1
-                elif service.health_status.value == "degraded":
-                    status_icon = "◐"
-                    status_color = Qt.yellow
-                else:
-                    status_icon = "○"
-                    status_color = Qt.red
-                
-                # Format service type
-                service_type_display = service.service_type.value.replace('_', ' ').title()
-                
-                # Create service item
-                service_item = QTreeWidgetItem([
-                    f"  {service.service_name}",
-                    service_type_display,
-                    f"{status_icon} {service.status.value.capitalize()}"
-                ])
-                service_item.setForeground(2, status_color)
-                
-                # Add tooltip with details
-                tooltip = f"Type: {service_type_display}\n"
-                tooltip += f"Status: {service.status.value}\n"
-                tooltip += f"Health: {service.health_status.value}\n"
-                if service.endpoint:
-                    tooltip += f"Endpoint: {service.endpoint}\n"
-                if service.port:
-                    tooltip += f"Port: {service.port}\n"
-                if service.capabilities:
-                    tooltip += f"Capabilities: {', '.join(str(k) for k in service.capabilities.keys())}\n"
-                
-                service_item.setToolTip(0, tooltip)
-                
-                node_item.addChild(service_item)
+            # Drop whatever disappeared since the last refresh
+            for key in set(self._service_items) - seen_services:
+                item = self._service_items.pop(key)
+                self._rendered.pop(key, None)
+                parent = item.parent()
+                if parent is not None:
+                    parent.removeChild(item)
+            for node_id in set(self._node_items) - seen_nodes:
+                item = self._node_items.pop(node_id)
+                self._rendered.pop(node_id, None)
+                self.service_tree.takeTopLevelItem(self.service_tree.indexOfTopLevelItem(item))
             
-            self.service_tree.addTopLevelItem(node_item)
+            # If no services, show message
+            if total_services == 0:
+                self._set_placeholder("No services discovered", _COLOR_GRAY)
+            else:
+                self._set_placeholder(None)
+        finally:
+            self.service_tree.blockSignals(False)
+            self.service_tree.setUpdatesEnabled(True)
         
-        # Add discovered nodes without services yet
-        for node in known_nodes:
-            if node['node_id'] not in nodes_with_services and node['node_id'] != self.service_discovery.node_id:
-                node_item = QTreeWidgetItem([
-                    f"{node['node_name']} ({node['node_id'][:8]}...)",
-                    "",
-                    "Discovered (no services)"
-                ])
-                node_item.setData(0, Qt.UserRole, node['node_id'])  # Store full node_id
-                node_item.setForeground(0, Qt.gray)
-                node_item.setForeground(2, Qt.yellow)
-                node_item.setToolTip(0, f"Node: {node['node_name']}\nHost: {node['host']}\nPort: {node['port']}")
-                self.service_tree.addTopLevelItem(node_item)
+        # Update stats, rebuilding the text only when the numbers moved
+        stats_key = (len(known_nodes), len(all_services), total_services, healthy_services,
+                     tuple(service_types_count.items()))
+        if stats_key == self._last_stats_key:
+            return
+        self._last_stats_key = stats_key
         
-        # Update stats
-        stats_text = f"Nodes: {len(known_nodes)} discovered, {len(all_services)} with services\n"
-        stats_text += f"Services: {total_services} total, {healthy_services} healthy\n\n"
-        stats_text += "By Type:\n"
-        for service_type, count in sorted(service_types_count.items(), key=lambda x: -x[1]):
-            type_display = service_type.value.replace('_', ' ').title()
-            stats_text += f"  • {type_display}: {count}\n"
+        lines = [
+            f"Nodes: {len(known_nodes)} discovered, {len(all_services)} with services",
+            f"Services: {total_services} total, {healthy_services} healthy",
+            "",
+            "By Type:",
+        ]
+        lines.extend(
+            f"  • {self._TYPE_DISPLAY[service_type]}: {count}"
+            for service_type, count in sorted(service_types_count.items(), key=lambda x: -x[1])
+        )
+        lines.append("")
+        self._set_stats_text("\n".join(lines))
+    
+    def _get_node_item(self, node_id: str, new_items: List[QTreeWidgetItem]) -> QTreeWidgetItem:
+        """
+        Get the top-level item for a node, creating it on first sight.
         
-        self.stats_label.setText(stats_text)
+        New items are appended to new_items instead of being inserted, so the
+        caller can add them to the tree in one call.
+        """
+        item = self._node_items.get(node_id)
+        if item is None:
+            item = QTreeWidgetItem()
+            item.setData(0, Qt.UserRole, node_id)  # Store full node_id for selection
+            new_items.append(item)
+            self._node_items[node_id] = item
+        return item
+    
+    def _insert_node_items(self, items: List[QTreeWidgetItem]):
+        """Add new node items in one call, keeping the placeholder (if any) last."""
+        if not items:
+            return
+        if self._placeholder is not None:
+            self.service_tree.insertTopLevelItems(self.service_tree.indexOfTopLevelItem(self._placeholder), items)
+        else:
+            self.service_tree.addTopLevelItems(items)
+        for item in items:
+            item.setExpanded(True)
+    
+    def _render_item(self, item: QTreeWidgetItem, key, texts: tuple, colors: tuple, tooltip: str):
+        """Apply texts, foreground colors and tooltip unless they are unchanged."""
+        state = (texts, colors, tooltip)
+        if self._rendered.get(key) == state:
+            return
+        self._rendered[key] = state
+        
+        for column, text in enumerate(texts):
+            item.setText(column, text)
+        for column, color in colors:
+            item.setForeground(column, color)
+        item.setToolTip(0, tooltip)
+    
+    def _set_placeholder(self, text: Optional[str], color=None):
+        """Show a single placeholder row at the end of the tree, or remove it."""
+        if text is None:
+            if self._placeholder is not None:
+                self.service_tree.takeTopLevelItem(self.service_tree.indexOfTopLevelItem(self._placeholder))
+                self._placeholder = None
+            return
         
-        # If no services, show message
-        if total_services == 0:
-            placeholder = QTreeWidgetItem(["No services discovered", "", ""])
-            placeholder.setForeground(0, Qt.gray)
-            self.service_tree.addTopLevelItem(placeholder)
+        if self._placeholder is None:
+            self._placeholder = QTreeWidgetItem()
+            self.service_tree.addTopLevelItem(self._placeholder)
+        if self._placeholder.text(0) != text:
+            self._placeholder.setText(0, text)
+            self._placeholder.setForeground(0, color)
+    
+    def _clear_tree(self):
+        """Remove all items and forget their rendered state."""
+        self.service_tree.clear()
+        self._node_items.clear()
+        self._service_items.clear()
+        self._rendered.clear()
+        self._placeholder = None
+        self._last_stats_key = None
+        self._last_version = None
+    
+    def _set_stats_text(self, text: str):
+        """Update the summary label only when its text changes."""
+        if self.stats_label.text() != text:
+            self.stats_label.setText(text)
@@ -11,24 +11,16 @@ from dataclasses import dataclass, field
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
-    QGraphicsItem, QPushButton, QComboBox, QLabel,
-    QInputDialog, QMessageBox
+    QGraphicsItem, QGraphicsLineItem, QPushButton, QComboBox, QLabel,
+    QInputDialog, QMessageBox, QMenu
 )
 from PySide6.QtCore import Qt, QPointF, QRectF, QTimer, Signal, QObject
-from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor, QBrush, QFont
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor, QBrush, QFont, QFontMetrics
 
 from skeleton_app.audio.jack_client import JackClientManager
 
 logger = logging.getLogger(__name__)
 
-# Startup confirmation
-print("=" * 60)
-print("NODE_CANVAS_V3 LOADED - Color scheme enabled:")
-print("  Audio nodes: Blue-gray (50, 60, 80)")
-print("  MIDI nodes: Red-gray (80, 50, 50)")
-print("  Mixed nodes: Purple-gray (70, 60, 80)")
-print("=" * 60)
-
 
 # ============================================================================
 # PURE DATA MODEL (No Qt, No UI)
@@ -68,6 +60,7 @@ class GraphModel(QObject):
         self.connections: List[ConnectionModel] = []
         self.aliases: Dict[str, str] = {}  # Map original name -> alias
         self._batch_mode = False  # Suppress signals during batch updates
+        self._batch_depth = 0  # Nesting depth of begin_batch()/end_batch()
     
     def add_node(self, name: str, x: float = 0, y: float = 0) -> NodeModel:
         if name not in self.nodes:
@@ -109,13 +102,22 @@ class GraphModel(QObject):
             self.changed.emit()
     
     def begin_batch(self):
-        """Start batch mode - suppress changed signals."""
+        """Start batch mode - suppress changed signals. Batches may nest."""
+        self._batch_depth += 1
         self._batch_mode = True
     
     def end_batch(self):
-        """End batch mode - emit one changed signal."""
+        """End batch mode - emit one changed signal when the outermost batch ends."""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth:
+            return
         self._batch_mode = False
         self.changed.emit()
+    
+    @property
+    def in_batch(self) -> bool:
+        """True while inside begin_batch()/end_batch()."""
+        return self._batch_mode
 
 
 # ============================================================================
@@ -149,8 +151,6 @@ class NodeGraphicsItem(QGraphicsItem):
     
     def _calculate_size(self):
         """Calculate node size based on content."""
-        from PySide6.QtGui import QFontMetrics
-        
         # Measure text widths
         font_title = QFont("Sans", 9, QFont.Bold)
         font_port = QFont("Sans", 8)
@@ -208,13 +208,6 @@ class NodeGraphicsItem(QGraphicsItem):
         margin = 10
         all_ports = self.model.inputs + self.model.outputs
         
-        # TEMPORARY DEBUG - Print port info
-        if not hasattr(self, '_debug_printed'):
-            if all_ports:
-                print(f"NODE '{self.model.name}': {len(all_ports)} ports")
-                print(f"  Sample port: {all_ports[0].name}, is_midi={all_ports[0].is_midi}")
-            self._debug_printed = True
-        
         if len(all_ports) > 0:
             has_audio = any(not p.is_midi for p in all_ports)
             has_midi = any(p.is_midi for p in all_ports)
@@ -363,8 +356,6 @@ class NodeGraphicsItem(QGraphicsItem):
     
     def _show_context_menu(self, pos):
         """Show context menu for node operations."""
-        from PySide6.QtWidgets import QMenu
-        
         menu = QMenu()
         
         current_display = self.graph_model.get_display_name(self.model.name)
@@ -565,7 +556,6 @@ class GraphCanvas(QGraphicsView):
     
     def start_connection_drag(self, start_pos: QPointF, start_port: str, is_output: bool):
         """Start dragging a temporary connection line."""
-        from PySide6.QtWidgets import QGraphicsLineItem
         self._temp_start_pos = start_pos
         self._temp_start_port = start_port
         self._temp_start_is_output = is_output
@@ -623,30 +613,32 @@ class GraphCanvas(QGraphicsView):
     
     def rebuild_view(self):
         """Rebuild all graphics items from model."""
-        # Clear existing items
-        for item in self.connection_items:
-            self.scene.removeItem(item)
-        for item in self.node_items.values():
-            self.scene.removeItem(item)
-        
-        self.node_items.clear()
-        self.connection_items.clear()
-        
-        # Create node items
-        for node_model in self.model.nodes.values():
-            item = NodeGraphicsItem(node_model, self.model)
-            self.scene.addItem(item)
-            self.node_items[node_model.name] = item
-        
-        # Create connection items
-        for conn in self.model.connections:
-            item = ConnectionGraphicsItem(conn, self.model, self.node_items)
-            self.scene.addItem(item)
-            self.connection_items.append(item)
-        
-        # Update connection paths
-        for item in self.connection_items:
-            item.update_path()
+        # Repaint once after the whole rebuild, not per added/removed item
+        self.setUpdatesEnabled(False)
+        try:
+            # Clear existing items
+            for item in self.connection_items:
+                self.scene.removeItem(item)
+            for item in self.node_items.values():
+                self.scene.removeItem(item)
+            
+            self.node_items.clear()
+            self.connection_items.clear()
+            
+            # Create node items
+            for node_model in self.model.nodes.values():
+                item = NodeGraphicsItem(node_model, self.model)
+                self.scene.addItem(item)
+                self.node_items[node_model.name] = item
+            
+            # Create connection items (each computes its path on construction,
+            # once all node items exist)
+            for conn in self.model.connections:
+                item = ConnectionGraphicsItem(conn, self.model, self.node_items)
+                self.scene.addItem(item)
+                self.connection_items.append(item)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 # ============================================================================
@@ -710,6 +702,22 @@ class NodeCanvasWidget(QWidget):
         self._load_last_preset()
         self._refresh_preset_list()
     
+    def begin_batch(self):
+        """
+        Start a batch of model changes.
+        
+        The canvas rebuilds and repaints once, at the matching end_batch().
+        Batches may nest.
+        """
+        self.model.begin_batch()
+        self.canvas.setUpdatesEnabled(False)
+    
+    def end_batch(self):
+        """End a batch started with begin_batch()."""
+        self.model.end_batch()
+        if not self.model.in_batch:
+            self.canvas.setUpdatesEnabled(True)
+    
     def set_jack_manager(self, jack_manager: Optional[JackClientManager]):
         """Set or update the JACK manager."""
         self.jack_manager = jack_manager
@@ -720,6 +728,7 @@ class NodeCanvasWidget(QWidget):
         """Update model from JACK state."""
         if not self.jack_manager:
             return
+        batch_started = False
         try:
             # Get JACK data - include both audio and MIDI ports
             all_ports = self.jack_manager.get_ports()  # Get all ports (audio + MIDI)
@@ -734,7 +743,8 @@ class NodeCanvasWidget(QWidget):
                 self._preset_positions = {}  # Clear after use
             
             # Batch update - only emit changed once at the end
-            self.model.begin_batch()
+            self.begin_batch()
+            batch_started = True
             
             # Clear model
             self.model.clear()
@@ -752,9 +762,10 @@ class NodeCanvasWidget(QWidget):
                 except Exception as e:
                     logger.warning(f"Error checking port type for {port_name}: {e}")
             
-            print(f"DEBUG: Total ports: {len(all_ports)}, MIDI ports: {len(midi_ports)}")
-            if midi_ports:
-                print(f"DEBUG: Sample MIDI ports: {list(midi_ports)[:3]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Total ports: %d, MIDI ports: %d", len(all_ports), len(midi_ports))
+                if midi_ports:
+                    logger.debug("Sample MIDI ports: %s", list(midi_ports)[:3])
             
             for port_name in all_ports:
                 if ':' not in port_name:
@@ -831,11 +842,13 @@ class NodeCanvasWidget(QWidget):
                 for in_port in in_ports:
                     self.model.add_connection(out_port, in_port)
             
-            # End batch - trigger single rebuild
-            self.model.end_batch()
-        
         except Exception as e:
             logger.error(f"Error refreshing from JACK: {e}", exc_info=True)
+        
+        finally:
+            # End batch - trigger single rebuild
+            if batch_started:
+                self.end_batch()
     
     def _save_preset(self):
         # Prepopulate with current preset name if available
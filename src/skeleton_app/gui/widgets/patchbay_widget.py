@@ -2,6 +2,7 @@
 JACK patchbay visual widget.
 """
 
+import logging
 from typing import Optional, Dict, Set, Tuple
 
 from PySide6.QtWidgets import (
@@ -13,6 +14,8 @@ from PySide6.QtCore import Qt, QTimer, Signal
 
 from skeleton_app.audio.jack_client import JackClientManager
 
+logger = logging.getLogger(__name__)
+
 
 class PatchbayWidget(QWidget):
     """
@@ -183,7 +186,7 @@ class PatchbayWidget(QWidget):
         # Update output ports (sources - they output audio)
         self.output_tree.clear()
         output_ports = self.jack_manager.get_ports(is_output=True, is_audio=True)
-        print(f"DEBUG: Found {len(output_ports)} output ports (sources)")
+        logger.debug("Found %d output ports (sources)", len(output_ports))
         
         # Group by client
         output_clients: Dict[str, list] = {}
@@ -212,7 +215,7 @@ class PatchbayWidget(QWidget):
         # Update input ports (sinks - they consume audio)
         self.input_tree.clear()
         input_ports = self.jack_manager.get_ports(is_input=True, is_audio=True)
-        print(f"DEBUG: Found {len(input_ports)} input ports (sinks)")
+        logger.debug("Found %d input ports (sinks)", len(input_ports))
         
         # Group by client
         input_clients: Dict[str, list] = {}
@@ -5,6 +5,7 @@ Provides identical interface to local patchbay but executes operations
 on remote machines via tool registry over ZeroMQ.
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Set, Any
 
@@ -187,7 +188,6 @@ class RemoteJackPanel(QWidget):
         self.node_changed.emit(node_id)
         
         # Fetch this node's JACK state (run synchronously - JACK is not thread-safe)
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -408,7 +408,6 @@ class RemoteJackPanel(QWidget):
     
     def _sync_update_ports(self):
         """Synchronously update ports (JACK must be called from main thread)."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -421,7 +420,6 @@ class RemoteJackPanel(QWidget):
     
     def _sync_connect_selected(self):
         """Synchronously connect selected ports."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -433,7 +431,6 @@ class RemoteJackPanel(QWidget):
     
     def _sync_disconnect_selected(self):
         """Synchronously disconnect selected ports."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
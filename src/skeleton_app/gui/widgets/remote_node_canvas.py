@@ -5,8 +5,10 @@ Similar to NodeCanvasWidget but queries remote JACK state via SSH.
 Completely replaces its contents when a different node is selected.
 """
 
+import asyncio
 import logging
 import json
+import re
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -16,7 +18,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal
 
-from skeleton_app.gui.widgets.node_canvas_v3 import GraphModel, GraphCanvas, PortModel
+from skeleton_app.gui.widgets.node_canvas_v3 import GraphModel, GraphCanvas, PortModel, NodeGraphicsItem
 
 logger = logging.getLogger(__name__)
 
@@ -164,7 +166,6 @@ class RemoteNodeCanvas(QWidget):
     
     def _sync_update_canvas(self):
         """Synchronously update canvas from remote node."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -281,7 +282,6 @@ class RemoteNodeCanvas(QWidget):
                         input_ports.add(current_port)
             
             # Natural sort function for port names (e.g., capture_1, capture_2, ...)
-            import re
             def natural_sort_key(text):
                 return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
             
@@ -355,7 +355,6 @@ class RemoteNodeCanvas(QWidget):
                     saved_x, saved_y = self._preset_positions.get(node_name, (x, y))
                     node = self.model.add_node(node_name, saved_x, saved_y)
                     # Sort ports naturally before adding
-                    import re
                     def natural_sort_key(item):
                         text = item[0]  # Sort by port_short
                         return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
@@ -368,7 +367,6 @@ class RemoteNodeCanvas(QWidget):
                     saved_x, saved_y = self._preset_positions.get(node_name, (x, y))
                     node = self.model.add_node(node_name, saved_x, saved_y)
                     # Sort ports naturally before adding
-                    import re
                     def natural_sort_key(item):
                         text = item[0]  # Sort by port_short
                         return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
@@ -386,7 +384,6 @@ class RemoteNodeCanvas(QWidget):
                     saved_x, saved_y = self._preset_positions.get(node_name, (x, y))
                     node = self.model.add_node(node_name, saved_x, saved_y)
                     # Sort ports naturally before adding
-                    import re
                     def natural_sort_key(item):
                         text = item[0]  # Sort by port_short
                         return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
@@ -399,7 +396,6 @@ class RemoteNodeCanvas(QWidget):
                     saved_x, saved_y = self._preset_positions.get(node_name, (x, y))
                     node = self.model.add_node(node_name, saved_x, saved_y)
                     # Sort ports naturally before adding
-                    import re
                     def natural_sort_key(item):
                         text = item[0]  # Sort by port_short
                         return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
@@ -412,7 +408,6 @@ class RemoteNodeCanvas(QWidget):
                 saved_x, saved_y = self._preset_positions.get(client_name, (x, y))
                 node = self.model.add_node(client_name, saved_x, saved_y)
                 # Sort ports naturally before adding
-                import re
                 def natural_sort_key(item):
                     text = item[0]  # Sort by port_short
                     return [int(c) if c.isdigit() else c.lower() for c in re.split('([0-9]+)', text)]
@@ -539,7 +534,6 @@ class RemoteNodeCanvas(QWidget):
     
     def _load_preset(self):
         """Load preset (sync wrapper)."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -618,7 +612,6 @@ class RemoteNodeCanvas(QWidget):
     
     def _load_preset_silent(self, name: str):
         """Load preset without showing message box."""
-        import asyncio
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -723,7 +716,6 @@ class RemoteGraphCanvas(GraphCanvas):
     def _create_jack_connection(self, output_port: str, input_port: str):
         """Create a JACK connection on remote host."""
         if self.remote_parent:
-            import asyncio
             try:
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
@@ -736,32 +728,32 @@ class RemoteGraphCanvas(GraphCanvas):
     
     def rebuild_view(self):
         """Rebuild all graphics items from model - use RemoteConnectionGraphicsItem."""
-        from skeleton_app.gui.widgets.node_canvas_v3 import NodeGraphicsItem
-        
-        # Clear existing items
-        for item in self.connection_items:
-            self.scene.removeItem(item)
-        for item in self.node_items.values():
-            self.scene.removeItem(item)
-        
-        self.node_items.clear()
-        self.connection_items.clear()
-        
-        # Create node items
-        for node_model in self.model.nodes.values():
-            item = NodeGraphicsItem(node_model, self.model)
-            self.scene.addItem(item)
-            self.node_items[node_model.name] = item
-        
-        # Create connection items (use RemoteConnectionGraphicsItem)
-        for conn in self.model.connections:
-            item = RemoteConnectionGraphicsItem(conn, self.model, self.node_items)
-            self.scene.addItem(item)
-            self.connection_items.append(item)
-        
-        # Update connection paths
-        for item in self.connection_items:
-            item.update_path()
+        # Repaint once after the whole rebuild, not per added/removed item
+        self.setUpdatesEnabled(False)
+        try:
+            # Clear existing items
+            for item in self.connection_items:
+                self.scene.removeItem(item)
+            for item in self.node_items.values():
+                self.scene.removeItem(item)
+            
+            self.node_items.clear()
+            self.connection_items.clear()
+            
+            # Create node items
+            for node_model in self.model.nodes.values():
+                item = NodeGraphicsItem(node_model, self.model)
+                self.scene.addItem(item)
+                self.node_items[node_model.name] = item
+            
+            # Create connection items (use RemoteConnectionGraphicsItem); each
+            # computes its path on construction, once all node items exist
+            for conn in self.model.connections:
+                item = RemoteConnectionGraphicsItem(conn, self.model, self.node_items)
+                self.scene.addItem(item)
+                self.connection_items.append(item)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 
@@ -779,7 +771,6 @@ class RemoteConnectionGraphicsItem(ConnectionGraphicsItem):
             if self.scene() and self.scene().views():
                 view = self.scene().views()[0]
                 if hasattr(view, 'remote_parent') and view.remote_parent:
-                    import asyncio
                     try:
                         loop = asyncio.new_event_loop()
                         asyncio.set_event_loop(loop)
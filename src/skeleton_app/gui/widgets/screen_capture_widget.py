@@ -356,12 +356,15 @@ class ScreenCaptureWidget(QWidget):
     
     def _on_frame_ready(self, image: QImage):
         """Handle new frame from capture."""
-        # Scale to fit preview while maintaining aspect ratio
+        # Scale to fit preview while maintaining aspect ratio, at device
+        # pixels so HiDPI screens don't upscale a logical-size pixmap
+        dpr = self.preview_label.devicePixelRatioF()
         scaled = image.scaled(
-            self.preview_label.size(),
+            self.preview_label.size() * dpr,
             Qt.KeepAspectRatio,
             Qt.SmoothTransformation
         )
+        scaled.setDevicePixelRatio(dpr)
         self.preview_label.setPixmap(QPixmap.fromImage(scaled))
         
         # Update stats
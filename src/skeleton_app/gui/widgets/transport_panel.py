@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QPushButton, QSlider, QLCDNumber, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QFont
 
 from skeleton_app.audio.jack_client import JackClientManager
@@ -29,17 +29,26 @@ class TransportPanel(QWidget):
     play_clicked = Signal()
     stop_clicked = Signal()
     locate_requested = Signal(int)  # frame number
+    transport_state_changed = Signal(str)  # Emitted only when the state changes
+    
+    # Display refresh cadence: smooth while the transport moves, slow while
+    # it is stopped (still catches external starts/locates)
+    ROLLING_INTERVAL_MS = 50
+    IDLE_INTERVAL_MS = 500
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.jack_manager: Optional[JackClientManager] = None
+        self._last_state: Optional[str] = None
+        self._last_frame: Optional[int] = None
+        self._shown = False  # Tracks show/hide events, which also fire on minimize/restore
         
         self._setup_ui()
         
-        # Update timer
-        self.update_timer = QTimer()
+        # Update timer; runs only while JACK is connected and the panel is shown
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(self.IDLE_INTERVAL_MS)
         self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(50)  # Update every 50ms for smooth display
         
         # Track if we're dragging the slider
         self._slider_dragging = False
@@ -152,6 +161,8 @@ class TransportPanel(QWidget):
             jack_manager: JACK client manager instance
         """
         self.jack_manager = jack_manager
+        self._last_state = None
+        self._last_frame = None
         
         # Enable/disable controls
         enabled = jack_manager is not None and jack_manager.is_connected()
@@ -159,11 +170,31 @@ class TransportPanel(QWidget):
         self.stop_button.setEnabled(enabled)
         self.position_slider.setEnabled(enabled)
         
-        if not enabled:
+        if enabled:
+            self.update_timer.setInterval(self.IDLE_INTERVAL_MS)
+            if self._shown:
+                self.update_timer.start()
+        else:
+            self.update_timer.stop()
             self.timecode_display.setText("00:00:00:00")
             self.frame_display.setText("0")
             self.position_slider.setValue(0)
     
+    def showEvent(self, event):
+        """Resume display updates, catching up on the current position."""
+        super().showEvent(event)
+        self._shown = True
+        if self.jack_manager is not None and self.jack_manager.is_connected():
+            self.update_timer.start()
+            self._update_display()
+    
+    def hideEvent(self, event):
+        """Pause display updates while hidden or minimized."""
+        super().hideEvent(event)
+        self._shown = False
+        self.update_timer.stop()
+    
+    @Slot()
     def _on_play_clicked(self):
         """Handle play button click."""
         if self.jack_manager:
@@ -171,12 +202,15 @@ class TransportPanel(QWidget):
             if state == "Stopped":
                 self.jack_manager.transport_start()
                 self.play_button.setText("⏸ Pause")
+                # Don't wait out an idle tick before the display starts moving
+                self.update_timer.setInterval(self.ROLLING_INTERVAL_MS)
             elif state == "Rolling":
                 self.jack_manager.transport_stop()
                 self.play_button.setText("▶ Play")
         
         self.play_clicked.emit()
     
+    @Slot()
     def _on_stop_clicked(self):
         """Handle stop button click."""
         if self.jack_manager:
@@ -186,10 +220,12 @@ class TransportPanel(QWidget):
         
         self.stop_clicked.emit()
     
+    @Slot()
     def _on_slider_pressed(self):
         """Handle slider press."""
         self._slider_dragging = True
     
+    @Slot()
     def _on_slider_released(self):
         """Handle slider release."""
         self._slider_dragging = False
@@ -200,11 +236,13 @@ class TransportPanel(QWidget):
             self.jack_manager.transport_locate(frame)
             self.locate_requested.emit(frame)
     
+    @Slot(int)
     def _on_slider_moved(self, value: int):
         """Handle slider movement."""
         # Update frame display while dragging
         self.frame_display.setText(str(value))
     
+    @Slot()
     def _update_display(self):
         """Update the transport display."""
         if not self.jack_manager or not self.jack_manager.is_connected():
@@ -212,16 +250,25 @@ class TransportPanel(QWidget):
         
         # Get current state
         state = self.jack_manager.get_transport_state()
+        if state != self._last_state:
+            self._last_state = state
+            self.transport_state_changed.emit(state)
+            
+            # Update play button text based on state
+            if state == "Rolling":
+                self.play_button.setText("⏸ Pause")
+            else:
+                self.play_button.setText("▶ Play")
+            
+            moving = state in ("Rolling", "Starting")
+            self.update_timer.setInterval(self.ROLLING_INTERVAL_MS if moving else self.IDLE_INTERVAL_MS)
         
-        # Update play button text based on state
-        if state == "Rolling":
-            self.play_button.setText("⏸ Pause")
-        else:
-            self.play_button.setText("▶ Play")
-        
-        # Get current frame and time
+        # Get current frame; nothing below changes while the transport sits still
         frame = self.jack_manager.get_transport_frame()
-        hours, minutes, seconds, frames = self.jack_manager.get_transport_time()
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
+        hours, minutes, seconds, frames = self.jack_manager.get_transport_time(frame)
         
         # Update timecode display
         timecode = f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from skeleton_app.core.types import CapabilityRequest, CapabilityRoute, NodeCapability, NodeInfo
 
@@ -17,6 +17,11 @@ class NodeRegistry:
         self._nodes: Dict[str, NodeInfo] = {}
         self._local_node_id: Optional[str] = None
         self._lock = asyncio.Lock()
+        
+        # (type, subtype) -> [(node, capability)], rebuilt on membership
+        # change. Every capability is also filed under (type, None) so
+        # requests without a subtype hit a single bucket too.
+        self._capability_index: Dict[Tuple[str, Optional[str]], List[Tuple[NodeInfo, NodeCapability]]] = {}
     
     def set_local_node(self, node_id: str):
         """Set the ID of the local node."""
@@ -27,6 +32,7 @@ class NodeRegistry:
         async with self._lock:
             node.last_seen = time.time()
             self._nodes[node.id] = node
+            self._rebuild_capability_index()
             logger.info(f"Registered node: {node.id} ({node.name}) with roles: {node.roles}")
     
     async def unregister_node(self, node_id: str):
@@ -34,6 +40,7 @@ class NodeRegistry:
         async with self._lock:
             if node_id in self._nodes:
                 del self._nodes[node_id]
+                self._rebuild_capability_index()
                 logger.info(f"Unregistered node: {node_id}")
     
     async def update_node_status(self, node_id: str, status: str):
@@ -71,6 +78,16 @@ class NodeRegistry:
         
         return nodes
     
+    def _rebuild_capability_index(self):
+        """Rebuild the capability dispatch table; call with the lock held."""
+        index: Dict[Tuple[str, Optional[str]], List[Tuple[NodeInfo, NodeCapability]]] = {}
+        for node in self._nodes.values():
+            for cap in node.capabilities:
+                index.setdefault((cap.type, None), []).append((node, cap))
+                if cap.subtype is not None:
+                    index.setdefault((cap.type, cap.subtype), []).append((node, cap))
+        self._capability_index = index
+    
     async def find_nodes_with_capability(
         self,
         capability_type: str,
@@ -78,24 +95,19 @@ class NodeRegistry:
         model: Optional[str] = None
     ) -> List[NodeInfo]:
         """Find nodes that provide a specific capability."""
-        nodes = await self.list_nodes(status="online")
-        matching = []
+        bucket = self._capability_index.get((capability_type, subtype or None), ())
+        matching: Dict[str, NodeInfo] = {}
         
-        for node in nodes:
-            for cap in node.capabilities:
-                if cap.type != capability_type:
-                    continue
-                
-                if subtype and cap.subtype != subtype:
-                    continue
-                
-                if model and cap.models and model not in cap.models:
-                    continue
-                
-                matching.append(node)
-                break
+        for node, cap in bucket:
+            if node.status != "online" or node.id in matching:
+                continue
+            
+            if model and cap.models and model not in cap.models:
+                continue
+            
+            matching[node.id] = node
         
-        return matching
+        return list(matching.values())
     
     def is_local_node(self, node_id: str) -> bool:
         """Check if a node ID refers to the local node."""
@@ -2,6 +2,10 @@
 
 import asyncio
 import logging
+import os
+import shlex
+import stat
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -11,9 +15,35 @@ logger = logging.getLogger(__name__)
 class SSHExecutor:
     """Execute commands on remote nodes via SSH."""
     
-    def __init__(self, user: str = None, key_file: str = None):
+    def __init__(self, user: str = None, key_file: str = None, multiplex: bool = True):
         self.user = user or "sysadmin"  # Default user
         self.key_file = key_file  # Optional explicit key
+        
+        # OpenSSH connection sharing: the first command to a host opens a
+        # master connection that later ssh/scp/rsync calls (including from
+        # later CLI invocations, for ControlPersist seconds) reuse, skipping
+        # the TCP + key exchange handshake.
+        self.ssh_options = ["-o", "ConnectTimeout=5"]
+        if multiplex:
+            # Prefer the per-user runtime dir; a /tmp fallback must be a
+            # private directory we own, or another local user could plant
+            # or remove the control sockets.
+            runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+            control_dir = Path(runtime_dir) / f"skeleton-ssh-{os.getuid()}"
+            try:
+                control_dir.mkdir(mode=0o700, exist_ok=True)
+                st = control_dir.lstat()
+                if not stat.S_ISDIR(st.st_mode):
+                    raise OSError(f"{control_dir} is not a directory")
+                if st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+                    raise OSError(f"{control_dir} is not private to this user")
+                self.ssh_options += [
+                    "-o", "ControlMaster=auto",
+                    "-o", f"ControlPath={control_dir}/%C",
+                    "-o", "ControlPersist=60",
+                ]
+            except OSError as e:
+                logger.warning(f"SSH connection sharing disabled: {e}")
     
     async def execute(
         self,
@@ -29,7 +59,7 @@ class SSHExecutor:
             (exit_code, stdout, stderr)
         """
         # Build SSH command
-        ssh_cmd = ["ssh", "-o", "ConnectTimeout=5"]
+        ssh_cmd = ["ssh", *self.ssh_options]
         
         if self.key_file:
             ssh_cmd.extend(["-i", self.key_file])
@@ -99,7 +129,7 @@ class SSHExecutor:
         Args:
             direction: "to" (local -> remote) or "from" (remote -> local)
         """
-        scp_cmd = ["scp", "-o", "ConnectTimeout=5"]
+        scp_cmd = ["scp", *self.ssh_options]
         
         if self.key_file:
             scp_cmd.extend(["-i", self.key_file])
@@ -195,16 +225,17 @@ class SSHExecutor:
         Sync directory to/from remote host using rsync.
         Much more efficient than copying individual files.
         """
+        ssh_cmd = ["ssh", *self.ssh_options]
+        if self.key_file:
+            ssh_cmd.extend(["-i", self.key_file])
+        
         rsync_cmd = [
             "rsync",
             "-avz",  # archive, verbose, compress
             "--progress",
-            "-e", "ssh -o ConnectTimeout=5"
+            "-e", shlex.join(ssh_cmd)
         ]
         
-        if self.key_file:
-            rsync_cmd[-1] += f" -i {self.key_file}"
-        
         # Add exclusions
         if exclude:
             for pattern in exclude:
@@ -242,24 +273,23 @@ class ClusterManager:
         command: str,
         parallel: bool = True,
         cwd: Optional[str] = None
-    ) -> Dict[str, Tuple[int, str, str]]:
+    ) -> List[Tuple[int, str, str]]:
         """
         Execute command on multiple hosts.
         
         Returns:
-            Dict mapping host to (exit_code, stdout, stderr)
+            List of (exit_code, stdout, stderr), in the same order as hosts
         """
         if parallel:
             tasks = [
                 self.executor.execute(host, command, cwd=cwd)
                 for host in hosts
             ]
-            results = await asyncio.gather(*tasks)
-            return dict(zip(hosts, results))
+            return list(await asyncio.gather(*tasks))
         else:
-            results = {}
+            results = []
             for host in hosts:
-                results[host] = await self.executor.execute(host, command, cwd=cwd)
+                results.append(await self.executor.execute(host, command, cwd=cwd))
             return results
     
     async def deploy_code(
@@ -267,9 +297,12 @@ class ClusterManager:
         hosts: List[str],
         local_path: str,
         remote_path: str
-    ) -> Dict[str, bool]:
+    ) -> List[bool]:
         """
         Deploy code to multiple nodes using rsync.
+        
+        Returns:
+            Success flags, in the same order as hosts
         """
         tasks = [
             self.executor.rsync_directory(
@@ -282,8 +315,7 @@ class ClusterManager:
             for host in hosts
         ]
         
-        results = await asyncio.gather(*tasks)
-        return dict(zip(hosts, results))
+        return list(await asyncio.gather(*tasks))
     
     async def start_daemon(
         self,
@@ -318,14 +350,13 @@ class ClusterManager:
         await asyncio.sleep(2)  # Give it time to stop
         return await self.start_daemon(host, app_path, config_file)
     
-    async def check_daemon_status(self, hosts: List[str]) -> Dict[str, bool]:
-        """Check if daemon is running on multiple hosts."""
+    async def check_daemon_status(self, hosts: List[str]) -> List[bool]:
+        """Check if daemon is running on multiple hosts (results in host order)."""
         tasks = [
             self.executor.check_process(host, "skeleton-daemon")
             for host in hosts
         ]
-        results = await asyncio.gather(*tasks)
-        return dict(zip(hosts, results))
+        return list(await asyncio.gather(*tasks))
     
     async def collect_logs(
         self,
@@ -343,28 +374,40 @@ class ClusterManager:
         )
         
         if exit_code == 0:
-            # Write to local file
-            Path(local_dest).parent.mkdir(parents=True, exist_ok=True)
-            with open(local_dest, 'w') as f:
-                f.write(stdout)
+            # Write to local file off the event loop so concurrent
+            # collections aren't stalled by disk I/O
+            await asyncio.to_thread(self._write_local_file, local_dest, stdout)
             return True
         
         return False
     
+    @staticmethod
+    def _write_local_file(local_dest: str, content: str):
+        """Write content to a local file, creating its directory if needed."""
+        path = Path(local_dest)
+        if not path.parent.is_dir():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    
     async def sync_models(
         self,
         source_host: str,
         target_hosts: List[str],
         models_path: str
-    ) -> Dict[str, bool]:
+    ) -> List[bool]:
         """
         Synchronize models from one node to others.
         Useful for distributing Vosk/Whisper/Piper models.
+        
+        Returns:
+            Success flags, in the same order as target_hosts (False for a
+            target that is the source host itself, which is skipped)
         """
-        results = {}
+        results = []
         
         for target in target_hosts:
             if target == source_host:
+                results.append(False)
                 continue
             
             # Use SSH to rsync between remote hosts
@@ -380,7 +423,7 @@ class ClusterManager:
                 timeout=300.0  # Models can be large
             )
             
-            results[target] = (exit_code == 0)
+            results.append(exit_code == 0)
         
         return results
     
@@ -401,20 +444,40 @@ class ClusterManager:
         )
         return await self.executor.execute(host, command, timeout=300.0)
     
-    async def health_check_all(self, hosts: List[str]) -> Dict[str, Dict[str, any]]:
+    async def health_check_all(self, hosts: List[str]) -> List[Dict[str, any]]:
         """
         Perform health check on all nodes.
-        Returns system info and daemon status for each.
+        Returns system info and daemon status for each, in host order.
         """
-        results = {}
+        results = []
         
         for host in hosts:
             info = await self.executor.get_system_info(host)
             daemon_running = await self.executor.check_process(host, "skeleton-daemon")
             
-            results[host] = {
+            results.append({
                 **info,
                 'daemon_running': daemon_running
-            }
+            })
         
         return results
+
+
+_ssh_executor: Optional[SSHExecutor] = None
+_cluster_manager: Optional[ClusterManager] = None
+
+
+def get_ssh_executor() -> SSHExecutor:
+    """Get or create the shared SSH executor."""
+    global _ssh_executor
+    if _ssh_executor is None:
+        _ssh_executor = SSHExecutor()
+    return _ssh_executor
+
+
+def get_cluster_manager() -> ClusterManager:
+    """Get or create the shared cluster manager."""
+    global _cluster_manager
+    if _cluster_manager is None:
+        _cluster_manager = ClusterManager(get_ssh_executor())
+    return _cluster_manager
@@ -9,6 +9,8 @@ Hybrid approach:
 import asyncio
 import json
 import logging
+import re
+import shutil
 import socket
 import struct
 import time
@@ -20,10 +22,99 @@ from enum import Enum
 import zmq
 import zmq.asyncio
 
-from skeleton_app.database import Database
+from skeleton_app.database import Database, heartbeat_nodes_in_db
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_SERVICE_SQL = """
+    INSERT INTO services (
+        node_id, service_type, service_name, endpoint, port, protocol,
+        capabilities, metadata, status, health_status, last_heartbeat
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, NOW())
+    ON CONFLICT (node_id, service_type, service_name)
+    DO UPDATE SET
+        endpoint = EXCLUDED.endpoint,
+        port = EXCLUDED.port,
+        protocol = EXCLUDED.protocol,
+        capabilities = EXCLUDED.capabilities,
+        metadata = EXCLUDED.metadata,
+        status = EXCLUDED.status,
+        health_status = EXCLUDED.health_status,
+        last_heartbeat = NOW(),
+        updated_at = NOW()
+"""
+
+_SERVICE_ID_SQL = """
+    SELECT id FROM services 
+    WHERE node_id = $1 AND service_type = $2 AND service_name = $3
+"""
+
+_INSERT_HEALTH_SQL = """
+    INSERT INTO service_health_history (
+        service_id, health_status, response_time_ms, error_message
+    )
+    VALUES ($1, $2, $3, $4)
+"""
+
+_EXPIRE_SERVICES_SQL = """
+    UPDATE services
+    SET status = 'unavailable', updated_at = NOW()
+    WHERE last_heartbeat < NOW() - INTERVAL '1 second' * $1
+    AND status != 'unavailable'
+"""
+
+# Keep the last 1000 health checks per service
+_PRUNE_HEALTH_HISTORY_SQL = """
+    DELETE FROM service_health_history
+    WHERE id NOT IN (
+        SELECT id FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (PARTITION BY service_id ORDER BY checked_at DESC) as rn
+            FROM service_health_history
+        ) sub
+        WHERE rn <= 1000
+    )
+"""
+
+# Native mDNS (avahi) discovery: DNS-SD service type and the TXT strings of
+# a resolved `avahi-browse -p` record
+_AVAHI_SERVICE_TYPE = "_skeleton._tcp"
+_AVAHI_TXT_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def _parse_avahi_record(line: str) -> Optional[Dict[str, str]]:
+    """
+    Parse one line of `avahi-browse -rp` output.
+    
+    Only resolved IPv4 records ("=;iface;IPv4;name;type;domain;host;address;port;txt")
+    are returned, as their TXT key/value pairs plus "address" and "port".
+    """
+    fields = line.rstrip("\n").split(";", 9)
+    if len(fields) < 10 or fields[0] != "=" or fields[2] != "IPv4":
+        return None
+    
+    record = {}
+    for txt in _AVAHI_TXT_RE.findall(fields[9]):
+        key, sep, value = txt.partition("=")
+        if sep:
+            record[key] = value
+    record["address"] = fields[7]
+    record["port"] = fields[8]
+    return record
+
+
+async def _stop_avahi_proc(proc, timeout: float = 2.0):
+    """Terminate an avahi helper and reap it, killing it if it won't exit."""
+    if proc.returncode is not None:
+        return
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
 
 class ServiceType(str, Enum):
     """Types of services that can be registered."""
@@ -104,7 +195,8 @@ class ServiceDiscovery:
     """
     Hybrid service discovery using UDP broadcast, ZeroMQ, and PostgreSQL.
     
-    - UDP broadcast for automatic node discovery on LAN
+    - UDP broadcast for automatic node discovery on LAN (or the system
+      mDNS responder via avahi, with discovery_backend="avahi")
     - ZeroMQ pub/sub for real-time service announcements
     - PostgreSQL for persistent registry (optional)
     """
@@ -119,7 +211,8 @@ class ServiceDiscovery:
         sub_port: int = 5556,
         broadcast_port: int = 5557,
         heartbeat_interval: int = 10,
-        discovery_bridge = None  # Optional Qt bridge for safe GUI callbacks
+        discovery_bridge = None,  # Optional Qt bridge for safe GUI callbacks
+        discovery_backend: str = "udp"  # "udp" broadcast or "avahi" (native mDNS)
     ):
         self.node_id = node_id
         self.node_name = node_name
@@ -130,6 +223,7 @@ class ServiceDiscovery:
         self.broadcast_port = broadcast_port
         self.heartbeat_interval = heartbeat_interval
         self.discovery_bridge = discovery_bridge  # Qt signal bridge for thread-safe callbacks
+        self.discovery_backend = discovery_backend
         
         # ZeroMQ context
         self.zmq_context = zmq.asyncio.Context()
@@ -140,6 +234,9 @@ class ServiceDiscovery:
         self.broadcast_socket: Optional[socket.socket] = None
         self.listen_socket: Optional[socket.socket] = None
         
+        # avahi-publish-service / avahi-browse child processes (avahi backend)
+        self._avahi_procs: Set[asyncio.subprocess.Process] = set()
+        
         # Known nodes (discovered via UDP or database)
         self.known_nodes: Dict[str, Dict] = {}  # node_id -> {name, host, last_seen}
         self.subscribed_nodes: Set[str] = set()  # Track which nodes we've subscribed to
@@ -150,6 +247,14 @@ class ServiceDiscovery:
         # Cluster-wide service cache
         self.cluster_services: Dict[str, Dict[str, ServiceInfo]] = {}  # node_id -> {service_name -> ServiceInfo}
         
+        # Bumped after every change to known_nodes (other than last_seen) or
+        # cluster_services, so readers can skip re-reading an unchanged registry
+        self.registry_version = 0
+        
+        # Node ids seen alive since the last heartbeat flush
+        self._pending_heartbeats: Set[str] = set()
+        self.heartbeat_flush_interval = 1.0
+        
         # Service change callbacks
         self.callbacks: List[Callable] = []
         
@@ -162,6 +267,7 @@ class ServiceDiscovery:
         self.cleanup_task: Optional[asyncio.Task] = None
         self.broadcast_task: Optional[asyncio.Task] = None
         self.listen_task: Optional[asyncio.Task] = None
+        self.heartbeat_flush_task: Optional[asyncio.Task] = None
     
     async def start(self):
         """Start service discovery."""
@@ -170,8 +276,15 @@ class ServiceDiscovery:
         
         logger.info(f"Starting service discovery for node {self.node_id}")
         
+        if self.discovery_backend == "avahi" and not (
+            shutil.which("avahi-browse") and shutil.which("avahi-publish-service")
+        ):
+            logger.warning("avahi-utils not found, falling back to UDP broadcast discovery")
+            self.discovery_backend = "udp"
+        
         # Setup UDP broadcast listener
-        self._setup_udp_sockets()
+        if self.discovery_backend == "udp":
+            self._setup_udp_sockets()
         
         # Setup ZeroMQ publisher
         self.publisher = self.zmq_context.socket(zmq.PUB)
@@ -195,10 +308,15 @@ class ServiceDiscovery:
         self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         self.subscriber_task = asyncio.create_task(self._subscription_loop())
         self.cleanup_task = asyncio.create_task(self._cleanup_loop())
-        self.broadcast_task = asyncio.create_task(self._broadcast_loop())
-        self.listen_task = asyncio.create_task(self._listen_loop())
-        
-        logger.info("Service discovery started with UDP broadcast enabled")
+        if self.discovery_backend == "avahi":
+            self.broadcast_task = asyncio.create_task(self._avahi_publish_loop())
+            self.listen_task = asyncio.create_task(self._avahi_browse_loop())
+        else:
+            self.broadcast_task = asyncio.create_task(self._broadcast_loop())
+            self.listen_task = asyncio.create_task(self._listen_loop())
+        self.heartbeat_flush_task = asyncio.create_task(self._heartbeat_flush_loop())
+        
+        logger.info(f"Service discovery started with {self.discovery_backend} node discovery")
     
     def _setup_udp_sockets(self):
         """Setup UDP sockets for broadcast discovery."""
@@ -233,6 +351,14 @@ class ServiceDiscovery:
             self.broadcast_task.cancel()
         if self.listen_task:
             self.listen_task.cancel()
+        if self.heartbeat_flush_task:
+            self.heartbeat_flush_task.cancel()
+        
+        # Wait for the discovery loops, so their avahi helpers are reaped
+        # (and our mDNS record withdrawn) before stop() returns
+        discovery_tasks = [t for t in (self.broadcast_task, self.listen_task) if t]
+        if discovery_tasks:
+            await asyncio.gather(*discovery_tasks, return_exceptions=True)
         
         # Mark our services as unavailable
         for service_name in self.local_services:
@@ -250,27 +376,43 @@ class ServiceDiscovery:
         if self.listen_socket:
             self.listen_socket.close()
         
+        # Stop any avahi helpers the loops didn't get to
+        for proc in list(self._avahi_procs):
+            await _stop_avahi_proc(proc)
+        self._avahi_procs.clear()
+        
         logger.info("Service discovery stopped")
     
-    async def register_service(self, service: ServiceInfo):
+    async def register_service(self, service: ServiceInfo, conn=None):
         """
         Register a service on this node.
         
         Args:
             service: Service information
+            conn: Optional already-acquired database connection to reuse
+        """
+        await self.register_services([service], conn=conn)
+    
+    async def register_services(self, services: List[ServiceInfo], conn=None):
         """
-        service.node_id = self.node_id
-        service_key = f"{service.service_type.value}:{service.service_name}"
+        Register several services on this node in one database round-trip.
         
-        self.local_services[service_key] = service
+        Args:
+            services: Service information for each service
+            conn: Optional already-acquired database connection to reuse
+        """
+        for service in services:
+            service.node_id = self.node_id
+            service_key = f"{service.service_type.value}:{service.service_name}"
+            self.local_services[service_key] = service
         
         # Save to database
-        await self._save_service_to_db(service)
+        await self._save_services_to_db(services, conn)
         
         # Announce via ZeroMQ
-        await self._announce_service(service, "registered")
-        
-        logger.info(f"Registered service: {service.service_name} ({service.service_type.value})")
+        for service in services:
+            await self._announce_service(service, "registered")
+            logger.info(f"Registered service: {service.service_name} ({service.service_type.value})")
     
     async def unregister_service(self, service_name: str):
         """
@@ -401,34 +543,32 @@ class ServiceDiscovery:
                 
                 service_key = f"{service.service_type.value}:{service.service_name}"
                 self.cluster_services[service.node_id][service_key] = service
+            
+            self.registry_version += 1
     
-    async def _save_service_to_db(self, service: ServiceInfo):
+    async def _save_service_to_db(self, service: ServiceInfo, conn=None):
         """Save service to database."""
-        if not self.database.pool:
+        await self._save_services_to_db([service], conn)
+    
+    async def _save_services_to_db(self, services: List[ServiceInfo], conn=None):
+        """Save services to database with a single executemany."""
+        if not services or not self.database or not self.database.pool:
             return
         
-        async with self.database.pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO services (
-                    node_id, service_type, service_name, endpoint, port, protocol,
-                    capabilities, metadata, status, health_status, last_heartbeat
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, NOW())
-                ON CONFLICT (node_id, service_type, service_name)
-                DO UPDATE SET
-                    endpoint = EXCLUDED.endpoint,
-                    port = EXCLUDED.port,
-                    protocol = EXCLUDED.protocol,
-                    capabilities = EXCLUDED.capabilities,
-                    metadata = EXCLUDED.metadata,
-                    status = EXCLUDED.status,
-                    health_status = EXCLUDED.health_status,
-                    last_heartbeat = NOW(),
-                    updated_at = NOW()
-            """, service.node_id, service.service_type.value, service.service_name,
-                service.endpoint, service.port, service.protocol,
-                json.dumps(service.capabilities), json.dumps(service.metadata),
-                service.status.value, service.health_status.value)
+        rows = [
+            (service.node_id, service.service_type.value, service.service_name,
+             service.endpoint, service.port, service.protocol,
+             service.capabilities, service.metadata,
+             service.status.value, service.health_status.value)
+            for service in services
+        ]
+        
+        if conn is not None:
+            await conn.executemany(_UPSERT_SERVICE_SQL, rows)
+            return
+        
+        async with self.database.connection() as conn:
+            await conn.executemany(_UPSERT_SERVICE_SQL, rows)
     
     async def _save_service_health(
         self,
@@ -442,21 +582,19 @@ class ServiceDiscovery:
         
         async with self.database.pool.acquire() as conn:
             # Get service ID
-            row = await conn.fetchrow("""
-                SELECT id FROM services 
-                WHERE node_id = $1 AND service_type = $2 AND service_name = $3
-            """, service.node_id, service.service_type.value, service.service_name)
+            row = await conn.fetchrow(
+                _SERVICE_ID_SQL,
+                service.node_id, service.service_type.value, service.service_name
+            )
             
             if row:
-                await conn.execute("""
-                    INSERT INTO service_health_history (
-                        service_id, health_status, response_time_ms, error_message
-                    )
-                    VALUES ($1, $2, $3, $4)
-                """, row['id'], service.health_status.value, response_time_ms, error_message)
+                await conn.execute(
+                    _INSERT_HEALTH_SQL,
+                    row['id'], service.health_status.value, response_time_ms, error_message
+                )
             
             # Update service health
-            await self._save_service_to_db(service)
+            await self._save_service_to_db(service, conn)
     
     async def _announce_service(self, service: ServiceInfo, action: str):
         """Announce service change via ZeroMQ."""
@@ -471,10 +609,34 @@ class ServiceDiscovery:
         
         await self.publisher.send_json(message)
     
+    def queue_node_heartbeat(self, node_id: str):
+        """Mark a node as seen; written to the database on the next flush."""
+        self._pending_heartbeats.add(node_id)
+    
+    async def _heartbeat_flush_loop(self):
+        """Write coalesced node heartbeats with one UPDATE per interval."""
+        while self.running:
+            try:
+                await asyncio.sleep(self.heartbeat_flush_interval)
+                
+                if not self._pending_heartbeats or not self.database or not self.database.pool:
+                    continue
+                
+                node_ids = list(self._pending_heartbeats)
+                self._pending_heartbeats.clear()
+                await heartbeat_nodes_in_db(self.database, node_ids)
+            
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error flushing node heartbeats: {e}")
+    
     async def _heartbeat_loop(self):
         """Send periodic heartbeats for our services."""
         while self.running:
             try:
+                self.queue_node_heartbeat(self.node_id)
+                
                 for service in self.local_services.values():
                     await self._save_service_to_db(service)
                     await self._announce_service(service, "heartbeat")
@@ -524,27 +686,10 @@ class ServiceDiscovery:
                 
                 if action == "unregistered":
                     self.cluster_services[service.node_id].pop(service_key, None)
-                    # Notify via bridge
-                    if self.discovery_bridge:
-                        self.discovery_bridge.emit_service_unregistered(service.node_id, service.service_name)
+                    self.registry_version += 1
                 else:
                     self.cluster_services[service.node_id][service_key] = service
-                    # Notify via bridge
-                    if self.discovery_bridge:
-                        if action == "registered":
-                            self.discovery_bridge.emit_service_registered(
-                                service.node_id, 
-                                service.service_name, 
-                                service.service_type.value,
-                                action
-                            )
-                        else:
-                            self.discovery_bridge.emit_service_updated(
-                                service.node_id, 
-                                service.service_name, 
-                                service.service_type.value,
-                                action
-                            )
+                    self.registry_version += 1
                 
                 # Notify callbacks
                 for callback in self.callbacks:
@@ -575,25 +720,10 @@ class ServiceDiscovery:
                 timeout_seconds = self.heartbeat_interval * 2
                 
                 async with self.database.pool.acquire() as conn:
-                    await conn.execute("""
-                        UPDATE services
-                        SET status = 'unavailable', updated_at = NOW()
-                        WHERE last_heartbeat < NOW() - INTERVAL '1 second' * $1
-                        AND status != 'unavailable'
-                    """, timeout_seconds)
+                    await conn.execute(_EXPIRE_SERVICES_SQL, timeout_seconds)
                     
-                    # Clean up old health history (keep last 1000 per service)
-                    await conn.execute("""
-                        DELETE FROM service_health_history
-                        WHERE id NOT IN (
-                            SELECT id FROM (
-                                SELECT id,
-                                       ROW_NUMBER() OVER (PARTITION BY service_id ORDER BY checked_at DESC) as rn
-                                FROM service_health_history
-                            ) sub
-                            WHERE rn <= 1000
-                        )
-                    """)
+                    # Clean up old health history
+                    await conn.execute(_PRUNE_HEALTH_HISTORY_SQL)
             
             except asyncio.CancelledError:
                 break
@@ -643,52 +773,12 @@ class ServiceDiscovery:
                 if node_id == self.node_id:
                     continue
                 
-                node_name = announcement.get('node_name')
-                node_host = announcement.get('host')
-                pub_port = announcement.get('pub_port', self.pub_port)
-                
-                # Update known nodes
-                if node_id not in self.known_nodes:
-                    logger.info(f"Discovered new node via UDP: {node_name} ({node_id}) at {node_host}")
-                    
-                    # Save to database if available
-                    if self.database and self.database.pool:
-                        await self._save_discovered_node(node_id, node_name, node_host)
-                
-                self.known_nodes[node_id] = {
-                    'name': node_name,
-                    'host': node_host,
-                    'port': pub_port,
-                    'last_seen': time.time()
-                }
-                
-                # Subscribe to this node's ZeroMQ publisher if not already subscribed
-                if node_id not in self.subscribed_nodes:
-                    zmq_endpoint = f"tcp://{node_host}:{pub_port}"
-                    self.subscriber.connect(zmq_endpoint)
-                    self.subscribed_nodes.add(node_id)
-                    logger.info(f"Subscribed to ZeroMQ from {node_name} at {zmq_endpoint}")
-                    
-                    # Notify callbacks about new node (using bridge for thread safety)
-                    if self.discovery_bridge:
-                        self.discovery_bridge.emit_node_discovered(node_id, node_name, node_host)
-                    
-                    for callback in self.callbacks:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback("node_discovered", {
-                                    'node_id': node_id,
-                                    'node_name': node_name,
-                                    'host': node_host
-                                })
-                            else:
-                                callback("node_discovered", {
-                                    'node_id': node_id,
-                                    'node_name': node_name,
-                                    'host': node_host
-                                })
-                        except Exception as e:
-                            logger.error(f"Error in node discovery callback: {e}")
+                await self._on_node_announcement(
+                    node_id,
+                    announcement.get('node_name'),
+                    announcement.get('host'),
+                    announcement.get('pub_port', self.pub_port)
+                )
             
             except asyncio.CancelledError:
                 break
@@ -699,6 +789,130 @@ class ServiceDiscovery:
                 logger.error(f"Error in listen loop: {e}")
                 await asyncio.sleep(1)
     
+    async def _on_node_announcement(self, node_id: str, node_name: str, node_host: str, pub_port: int):
+        """Record a peer seen via UDP or mDNS and subscribe to its publisher."""
+        # Update known nodes
+        if node_id not in self.known_nodes:
+            logger.info(f"Discovered new node via {self.discovery_backend}: {node_name} ({node_id}) at {node_host}")
+            
+            # Save to database if available
+            if self.database and self.database.pool:
+                await self._save_discovered_node(node_id, node_name, node_host)
+        
+        previous = self.known_nodes.get(node_id)
+        self.known_nodes[node_id] = {
+            'name': node_name,
+            'host': node_host,
+            'port': pub_port,
+            'last_seen': time.time()
+        }
+        if previous is None or (previous['name'], previous['host'], previous['port']) != (node_name, node_host, pub_port):
+            self.registry_version += 1
+        self.queue_node_heartbeat(node_id)
+        
+        # Subscribe to this node's ZeroMQ publisher if not already subscribed
+        if node_id not in self.subscribed_nodes:
+            zmq_endpoint = f"tcp://{node_host}:{pub_port}"
+            self.subscriber.connect(zmq_endpoint)
+            self.subscribed_nodes.add(node_id)
+            logger.info(f"Subscribed to ZeroMQ from {node_name} at {zmq_endpoint}")
+            
+            # Notify callbacks about new node
+            for callback in self.callbacks:
+                try:
+                    if asyncio.iscoroutinefunction(callback):
+                        await callback("node_discovered", {
+                            'node_id': node_id,
+                            'node_name': node_name,
+                            'host': node_host
+                        })
+                    else:
+                        callback("node_discovered", {
+                            'node_id': node_id,
+                            'node_name': node_name,
+                            'host': node_host
+                        })
+                except Exception as e:
+                    logger.error(f"Error in node discovery callback: {e}")
+    
+    async def _avahi_publish_loop(self):
+        """Advertise this node through the system mDNS responder (avahi)."""
+        logger.info(f"Publishing {self.node_name} as {_AVAHI_SERVICE_TYPE} via avahi")
+        while self.running:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "avahi-publish-service",
+                    f"{self.node_name} ({self.node_id[:8]})",
+                    _AVAHI_SERVICE_TYPE,
+                    str(self.pub_port),
+                    f"node_id={self.node_id}",
+                    f"node_name={self.node_name}",
+                    f"host={self.node_host}",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                self._avahi_procs.add(proc)
+                try:
+                    await proc.wait()
+                finally:
+                    await _stop_avahi_proc(proc)
+                    self._avahi_procs.discard(proc)
+                
+                # Only reached if avahi-publish-service exits on its own
+                logger.warning(f"avahi-publish-service exited ({proc.returncode}), restarting")
+                await asyncio.sleep(5)
+            
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in avahi publish loop: {e}")
+                await asyncio.sleep(5)
+    
+    async def _avahi_browse_loop(self):
+        """Discover peers from the system mDNS responder via `avahi-browse`."""
+        logger.info(f"Browsing {_AVAHI_SERVICE_TYPE} via avahi")
+        while self.running:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "avahi-browse", "-rpk", _AVAHI_SERVICE_TYPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                self._avahi_procs.add(proc)
+                try:
+                    async for raw in proc.stdout:
+                        record = _parse_avahi_record(raw.decode("utf-8", "replace"))
+                        if not record:
+                            continue
+                        
+                        node_id = record.get("node_id")
+                        if not node_id or node_id == self.node_id:
+                            continue
+                        
+                        # Prefer the advertised host unless it is a wildcard bind
+                        host = record.get("host")
+                        if not host or host == "0.0.0.0":
+                            host = record["address"]
+                        
+                        await self._on_node_announcement(
+                            node_id,
+                            record.get("node_name", node_id),
+                            host,
+                            int(record["port"])
+                        )
+                finally:
+                    await _stop_avahi_proc(proc)
+                    self._avahi_procs.discard(proc)
+                
+                logger.warning("avahi-browse exited, restarting")
+                await asyncio.sleep(5)
+            
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in avahi browse loop: {e}")
+                await asyncio.sleep(5)
+    
     async def _save_discovered_node(self, node_id: str, node_name: str, node_host: str):
         """Save a discovered node to the database."""
         try:
@@ -719,8 +933,8 @@ class ServiceDiscovery:
                     node_host,
                     self.pub_port,
                     [],  # roles - PostgreSQL TEXT[] (will be updated via service announcements)
-                    json.dumps({}),  # capabilities - JSONB needs JSON string
-                    json.dumps({}),  # tags - JSONB needs JSON string
+                    {},  # capabilities
+                    {},  # tags
                     "online"
                 )
         except Exception as e:
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test the avahi (native mDNS) discovery backend without avahi installed.
+
+Covers the `avahi-browse -rp` record parser and the browse loop's handling
+of parsed records, using canned avahi-browse output.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from skeleton_app.service_discovery import ServiceDiscovery, _parse_avahi_record
+
+
+RESOLVED = '=;eth0;IPv4;indigo;_skeleton._tcp;local;indigo.local;192.168.32.7;5555;"node_name=indigo" "node_id=node-indigo" "host=0.0.0.0"'
+
+
+def test_parse_resolved_ipv4():
+    """A resolved IPv4 record yields its TXT pairs plus address and port."""
+    record = _parse_avahi_record(RESOLVED + "\n")
+    assert record == {
+        "node_name": "indigo",
+        "node_id": "node-indigo",
+        "host": "0.0.0.0",
+        "address": "192.168.32.7",
+        "port": "5555",
+    }
+
+
+def test_parse_skips_unresolved_ipv6_and_short_lines():
+    """Only resolved IPv4 records are used."""
+    assert _parse_avahi_record("+;eth0;IPv4;indigo;_skeleton._tcp;local") is None
+    assert _parse_avahi_record("-;eth0;IPv4;indigo;_skeleton._tcp;local") is None
+    assert _parse_avahi_record(RESOLVED.replace(";IPv4;", ";IPv6;")) is None
+    assert _parse_avahi_record("=;eth0;IPv4;indigo") is None
+    assert _parse_avahi_record("") is None
+
+
+def test_parse_escaped_fields():
+    """Escapes in the service name and TXT strings don't shift any fields."""
+    line = (
+        r'=;eth0;IPv4;Studio\032A\059B;_skeleton._tcp;local;studio.local;10.0.0.5;5560;'
+        r'"note=say \"hi\"; bye" "node_id=node-studio" "empty=" "flag"'
+    )
+    record = _parse_avahi_record(line)
+    assert record["address"] == "10.0.0.5"
+    assert record["port"] == "5560"
+    assert record["node_id"] == "node-studio"
+    assert record["note"] == r'say \"hi\"; bye'
+    assert record["empty"] == ""
+    assert "flag" not in record  # TXT strings without "=" carry no value
+
+
+class _FakeAvahiBrowse:
+    """Stands in for the avahi-browse child process."""
+    
+    def __init__(self, lines):
+        self.returncode = 0
+        self.stdout = self._lines(lines)
+        self.drained = asyncio.Event()
+    
+    async def _lines(self, lines):
+        for line in lines:
+            yield (line + "\n").encode()
+        self.drained.set()
+
+
+def test_browse_loop_announces_peers():
+    """Records become node announcements; our own and id-less ones are skipped."""
+    lines = [
+        "+;eth0;IPv4;indigo;_skeleton._tcp;local",
+        RESOLVED,
+        '=;eth0;IPv4;karate;_skeleton._tcp;local;karate.local;192.168.32.11;5555;"node_name=karate" "node_id=node-karate" "host=karate.lan"',
+        '=;eth0;IPv4;me;_skeleton._tcp;local;me.local;192.168.32.2;5555;"node_name=me" "node_id=node-me"',
+        '=;eth0;IPv4;anon;_skeleton._tcp;local;anon.local;192.168.32.3;5555;"node_name=anon"',
+        '=;eth0;IPv4;bare;_skeleton._tcp;local;bare.local;192.168.32.4;5600;"node_id=node-bare"',
+    ]
+    
+    async def run():
+        discovery = ServiceDiscovery("node-me", "me", "192.168.32.2", discovery_backend="avahi")
+        discovery.running = True
+        
+        announced = []
+        
+        async def on_node_announcement(node_id, node_name, host, port):
+            announced.append((node_id, node_name, host, port))
+        
+        discovery._on_node_announcement = on_node_announcement
+        proc = _FakeAvahiBrowse(lines)
+        
+        async def create_subprocess_exec(*args, **kwargs):
+            assert args[:3] == ("avahi-browse", "-rpk", "_skeleton._tcp")
+            return proc
+        
+        original = asyncio.create_subprocess_exec
+        asyncio.create_subprocess_exec = create_subprocess_exec
+        try:
+            task = asyncio.create_task(discovery._avahi_browse_loop())
+            await asyncio.wait_for(proc.drained.wait(), 5)
+            task.cancel()
+            await task  # the loop swallows the cancel and exits
+        finally:
+            asyncio.create_subprocess_exec = original
+            discovery.zmq_context.term()
+        
+        return announced
+    
+    announced = asyncio.run(run())
+    assert announced == [
+        ("node-indigo", "indigo", "192.168.32.7", 5555),  # wildcard host -> address
+        ("node-karate", "karate", "karate.lan", 5555),
+        ("node-bare", "node-bare", "192.168.32.4", 5600),  # name defaults to id
+    ]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_parse_resolved_ipv4,
+        test_parse_skips_unresolved_ipv6_and_short_lines,
+        test_parse_escaped_fields,
+        test_browse_loop_announces_peers,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  ✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
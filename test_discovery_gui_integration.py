@@ -3,7 +3,7 @@
 Test service discovery with GUI integration.
 
 This script tests the complete flow of service discovery from the GUI,
-including the bridge signals that update the UI.
+including the discovery callbacks that update the UI.
 
 Run on multiple hosts to see cross-host discovery:
   Machine 1: python3 test_discovery_gui_integration.py --node "indigo" --host 192.168.32.7
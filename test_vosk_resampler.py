@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the streaming resampler used to feed JACK audio to Vosk.
+
+JACK delivers audio in blocks of whatever size the server runs at, so
+resampling block by block must give the same result as resampling the
+whole signal at once (the filter state and decimation phase carry over).
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from skeleton_app.audio.vosk_jack_stt import _Resampler
+
+
+def _tone(freq: float, rate: int, n: int) -> np.ndarray:
+    return np.sin(2 * np.pi * freq * np.arange(n) / rate).astype(np.float32)
+
+
+def _in_blocks(resampler: _Resampler, samples: np.ndarray, sizes) -> np.ndarray:
+    out, start = [], 0
+    for size in sizes:
+        out.append(resampler.process(samples[start:start + size]))
+        start += size
+    out.append(resampler.process(samples[start:]))
+    return np.concatenate(out)
+
+
+def test_integer_ratio_blocks_match_whole_signal():
+    """48k -> 16k block by block equals one pass, for any block sizes."""
+    samples = _tone(440, 48000, 48000) + 0.1 * _tone(9000, 48000, 48000)
+    whole = _Resampler(48000, 16000).process(samples)
+    
+    # Odd sizes, so the decimation phase is non-zero at most boundaries
+    blocks = _in_blocks(_Resampler(48000, 16000), samples, [1, 2, 1000, 333, 7, 1024, 4096, 5])
+    
+    assert len(whole) == len(blocks) == 16000
+    np.testing.assert_allclose(blocks, whole, atol=1e-5)
+
+
+def test_integer_ratio_filters_above_output_nyquist():
+    """Content above the Vosk Nyquist (8 kHz) is removed, speech band is kept."""
+    resampler = _Resampler(48000, 16000)
+    passband = resampler.process(_tone(1000, 48000, 48000))
+    stopband = _Resampler(48000, 16000).process(_tone(12000, 48000, 48000))
+    
+    # Skip the filter's start-up transient
+    assert np.abs(passband[1000:]).max() > 0.9
+    assert np.abs(stopband[1000:]).max() < 0.05
+
+
+def test_non_integer_ratio_output_length():
+    """44.1k -> 16k falls back to polyphase resampling per block."""
+    resampler = _Resampler(44100, 16000)
+    assert resampler.up == 160 and resampler.down == 441
+    out = resampler.process(_tone(440, 44100, 4410))
+    assert len(out) == 1600
+
+
+if __name__ == "__main__":
+    tests = [
+        test_integer_ratio_blocks_match_whole_signal,
+        test_integer_ratio_filters_above_output_nyquist,
+        test_non_integer_ratio_output_length,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  ✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -44,11 +44,9 @@ def check_bridge_signals():
         app = QApplication([])
         bridge = ServiceDiscoveryBridge()
         
+        # Node/service changes go through ServiceDiscovery callbacks; the
+        # bridge only carries the initial load from the database
         signals = [
-            'node_discovered',
-            'service_registered',
-            'service_updated',
-            'service_unregistered',
             'services_loaded'
         ]
         
@@ -88,16 +86,15 @@ def check_discovery_params():
 
 
 def check_cluster_panel_methods():
-    """Verify ClusterPanel has signal handlers."""
+    """Verify ClusterPanel has its change-notification handlers."""
     print("\nChecking ClusterPanel methods...")
     try:
         from skeleton_app.gui.widgets.cluster_panel import ClusterPanel
         
         methods = [
-            '_on_node_discovered',
-            '_on_service_registered',
-            '_on_service_updated',
-            '_on_service_unregistered'
+            '_on_service_change',
+            '_mark_dirty',
+            '_update_status_if_dirty'
         ]
         
         for method in methods: